@@ -64,6 +64,26 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/v1/metrics": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Metrics
+         * @description In-process cache and password pool counters, plus the outbox relay backlog
+         */
+        get: operations["metrics_api_v1_metrics_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/auth/register": {
         parameters: {
             query?: never;
@@ -98,6 +118,26 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/auth/refresh": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Refresh
+         * @description Exchange a refresh token for new tokens carrying the user's current role.
+         */
+        post: operations["refresh_auth_refresh_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/v1/specialists": {
         parameters: {
             query?: never;
@@ -122,6 +162,26 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/v1/specialists/search/free": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Search Free Specialists
+         * @description Find available specialists with a free slot between start_time and end_time on a date.
+         */
+        get: operations["search_free_specialists_api_v1_specialists_search_free_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/v1/specialists/me": {
         parameters: {
             query?: never;
@@ -214,6 +274,70 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/v1/bookings/series": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Create Booking Series
+         * @description Create a recurring booking series as a patient.
+         */
+        post: operations["create_booking_series_api_v1_bookings_series_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/api/v1/bookings/series/{series_id}": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get Booking Series
+         * @description Get a booking series with its bookings (patient or specialist only).
+         */
+        get: operations["get_booking_series_api_v1_bookings_series__series_id__get"];
+        /**
+         * Update Booking Series
+         * @description Update every upcoming booking of a series (only by the patient).
+         */
+        put: operations["update_booking_series_api_v1_bookings_series__series_id__put"];
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/api/v1/bookings/series/{series_id}/cancel": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        /**
+         * Cancel Booking Series
+         * @description Cancel every upcoming booking of a series (by patient or specialist).
+         */
+        patch: operations["cancel_booking_series_api_v1_bookings_series__series_id__cancel_patch"];
+        trace?: never;
+    };
     "/api/v1/bookings/my-bookings": {
         parameters: {
             query?: never;
@@ -586,6 +710,26 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/v1/availability/specialist/{specialist_id}/slots/range": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get Available Slots Range
+         * @description Get available time slots grouped by day for a bounded date range.
+         */
+        get: operations["get_available_slots_range_api_v1_availability_specialist__specialist_id__slots_range_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/v1/availability/{availability_id}": {
         parameters: {
             query?: never;
@@ -760,6 +904,8 @@ export interface components {
             status: components["schemas"]["BookingStatus"];
             /** Cancellation Reason */
             cancellation_reason?: string | null;
+            /** Series Id */
+            series_id?: number | null;
             /**
              * Created At
              * Format: date-time
@@ -771,11 +917,124 @@ export interface components {
              */
             updated_at: string;
         };
+        /**
+         * BookingSeriesCreate
+         * @description A recurring booking, e.g. every Tuesday 10:00 for 12 weeks.
+         */
+        BookingSeriesCreate: {
+            /**
+             * Start Time
+             * Format: date-time
+             */
+            start_time: string;
+            /**
+             * Duration Minutes
+             * @description Duration in minutes (15 min to 8 hours)
+             * @default 60
+             */
+            duration_minutes: number;
+            /** Notes */
+            notes?: string | null;
+            /** Specialist Id */
+            specialist_id: number;
+            /**
+             * Interval Weeks
+             * @default 1
+             */
+            interval_weeks: number;
+            /** Occurrences */
+            occurrences: number;
+            /**
+             * Skip Conflicts
+             * @description Skip unavailable occurrences instead of rejecting the whole series
+             * @default false
+             */
+            skip_conflicts: boolean;
+        };
+        /** BookingSeriesOut */
+        BookingSeriesOut: {
+            /** Id */
+            id: number;
+            /** Patient Id */
+            patient_id: number;
+            /** Specialist Id */
+            specialist_id: number;
+            /**
+             * Start Time
+             * Format: date-time
+             */
+            start_time: string;
+            /** Duration Minutes */
+            duration_minutes: number;
+            /** Interval Weeks */
+            interval_weeks: number;
+            /** Occurrences */
+            occurrences: number;
+            /** Notes */
+            notes?: string | null;
+            /**
+             * Created At
+             * Format: date-time
+             */
+            created_at: string;
+            /**
+             * Bookings
+             * @default []
+             */
+            bookings: components["schemas"]["BookingOut"][];
+            /**
+             * Skipped
+             * @default []
+             */
+            skipped: string[];
+        };
+        /**
+         * BookingSeriesUpdate
+         * @description Changes applied to every upcoming active occurrence of a series.
+         */
+        BookingSeriesUpdate: {
+            /** Duration Minutes */
+            duration_minutes?: number | null;
+            /** Notes */
+            notes?: string | null;
+        };
         /**
          * BookingStatus
          * @enum {string}
          */
         BookingStatus: "pending" | "confirmed" | "cancelled" | "completed" | "no_show";
+        /**
+         * BookingSummary
+         * @description List-mode booking without the unbounded text columns.
+         */
+        BookingSummary: {
+            /** Id */
+            id: number;
+            /** Patient Id */
+            patient_id: number;
+            /** Specialist Id */
+            specialist_id: number;
+            /**
+             * Start Time
+             * Format: date-time
+             */
+            start_time: string;
+            /** Duration Minutes */
+            duration_minutes: number;
+            status: components["schemas"]["BookingStatus"];
+            /** Series Id */
+            series_id?: number | null;
+            /**
+             * Created At
+             * Format: date-time
+             */
+            created_at: string;
+            /**
+             * Updated At
+             * Format: date-time
+             */
+            updated_at: string;
+        };
         /** BookingUpdate */
         BookingUpdate: {
             /** Start Time */
@@ -801,11 +1060,42 @@ export interface components {
          * @enum {string}
          */
         DayOfWeek: "monday" | "tuesday" | "wednesday" | "thursday" | "friday" | "saturday" | "sunday";
+        /**
+         * DaySlots
+         * @description Available time slots for one day of a date range
+         */
+        DaySlots: {
+            /**
+             * Date
+             * Format: date
+             */
+            date: string;
+            /** Slots */
+            slots?: components["schemas"]["AvailableSlot"][];
+        };
+        /**
+         * FreeSpecialist
+         * @description Specialist with a free slot in a searched time window
+         */
+        FreeSpecialist: {
+            /** Specialist Id */
+            specialist_id: number;
+            /**
+             * Earliest Start
+             * Format: date-time
+             */
+            earliest_start: string;
+        };
         /** HTTPValidationError */
         HTTPValidationError: {
             /** Detail */
             detail?: components["schemas"]["ValidationError"][];
         };
+        /** RefreshRequest */
+        RefreshRequest: {
+            /** Refresh Token */
+            refresh_token: string;
+        };
         /** SessionCreate */
         SessionCreate: {
             /** Notes */
@@ -860,6 +1150,38 @@ export interface components {
          * @enum {string}
          */
         SessionStatus: "scheduled" | "in_progress" | "completed" | "cancelled" | "no_show";
+        /**
+         * SessionSummary
+         * @description List-mode session without the unbounded text columns.
+         */
+        SessionSummary: {
+            /** Id */
+            id: number;
+            /** Booking Id */
+            booking_id: number;
+            /** Actual Start Time */
+            actual_start_time?: string | null;
+            /** Actual End Time */
+            actual_end_time?: string | null;
+            status: components["schemas"]["SessionStatus"];
+            /** Recording Url */
+            recording_url?: string | null;
+            /**
+             * Is Recorded
+             * @default false
+             */
+            is_recorded: boolean;
+            /**
+             * Created At
+             * Format: date-time
+             */
+            created_at: string;
+            /**
+             * Updated At
+             * Format: date-time
+             */
+            updated_at: string;
+        };
         /** SessionUpdate */
         SessionUpdate: {
             /** Actual Start Time */
@@ -947,6 +1269,21 @@ export interface components {
             /** License Number */
             license_number?: string | null;
         };
+        /** TokenResponse */
+        TokenResponse: {
+            /** Access Token */
+            access_token: string;
+            /** Refresh Token */
+            refresh_token: string;
+            /**
+             * Token Type
+             * @default bearer
+             */
+            token_type: string;
+            /** Expires In */
+            expires_in: number;
+            user: components["schemas"]["UserOut"];
+        };
         /** UserCreate */
         UserCreate: {
             /**
@@ -977,6 +1314,10 @@ export interface components {
             msg: string;
             /** Error Type */
             type: string;
+            /** Input */
+            input?: unknown;
+            /** Context */
+            ctx?: Record<string, never>;
         };
     };
     responses: never;
@@ -1002,14 +1343,247 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": unknown;
+                    "application/json": unknown;
+                };
+            };
+        };
+    };
+    health_check_health_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": unknown;
+                };
+            };
+        };
+    };
+    api_health_api_v1_health_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": unknown;
+                };
+            };
+        };
+    };
+    metrics_api_v1_metrics_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": unknown;
+                };
+            };
+        };
+    };
+    register_auth_register_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["UserCreate"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            201: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["UserOut"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    login_auth_login_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["UserCreate"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["TokenResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    refresh_auth_refresh_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["RefreshRequest"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["TokenResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    list_specialists_api_v1_specialists_get: {
+        parameters: {
+            query?: {
+                skip?: number;
+                limit?: number;
+                is_available?: boolean | null;
+                specializations?: string[] | null;
+            };
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["SpecialistOut"][];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    create_specialist_profile_api_v1_specialists_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["SpecialistCreate"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            201: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["SpecialistOut"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
                 };
             };
         };
     };
-    health_check_health_get: {
+    search_free_specialists_api_v1_specialists_search_free_get: {
         parameters: {
-            query?: never;
+            query: {
+                target_date: string;
+                start_time: string;
+                end_time: string;
+                duration_minutes?: number;
+                specialization?: string | null;
+                limit?: number;
+            };
             header?: never;
             path?: never;
             cookie?: never;
@@ -1022,12 +1596,21 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": unknown;
+                    "application/json": components["schemas"]["FreeSpecialist"][];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
                 };
             };
         };
     };
-    api_health_api_v1_health_get: {
+    get_my_specialist_profile_api_v1_specialists_me_get: {
         parameters: {
             query?: never;
             header?: never;
@@ -1042,12 +1625,12 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": unknown;
+                    "application/json": components["schemas"]["SpecialistOut"];
                 };
             };
         };
     };
-    register_auth_register_post: {
+    update_my_specialist_profile_api_v1_specialists_me_put: {
         parameters: {
             query?: never;
             header?: never;
@@ -1056,17 +1639,17 @@ export interface operations {
         };
         requestBody: {
             content: {
-                "application/json": components["schemas"]["UserCreate"];
+                "application/json": components["schemas"]["SpecialistUpdate"];
             };
         };
         responses: {
             /** @description Successful Response */
-            201: {
+            200: {
                 headers: {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["UserOut"];
+                    "application/json": components["schemas"]["SpecialistOut"];
                 };
             };
             /** @description Validation Error */
@@ -1080,49 +1663,31 @@ export interface operations {
             };
         };
     };
-    login_auth_login_post: {
+    delete_my_specialist_profile_api_v1_specialists_me_delete: {
         parameters: {
             query?: never;
             header?: never;
             path?: never;
             cookie?: never;
         };
-        requestBody: {
-            content: {
-                "application/json": components["schemas"]["UserCreate"];
-            };
-        };
+        requestBody?: never;
         responses: {
             /** @description Successful Response */
-            200: {
-                headers: {
-                    [name: string]: unknown;
-                };
-                content: {
-                    "application/json": components["schemas"]["UserOut"];
-                };
-            };
-            /** @description Validation Error */
-            422: {
+            204: {
                 headers: {
                     [name: string]: unknown;
                 };
-                content: {
-                    "application/json": components["schemas"]["HTTPValidationError"];
-                };
+                content?: never;
             };
         };
     };
-    list_specialists_api_v1_specialists_get: {
+    get_specialist_api_v1_specialists__specialist_id__get: {
         parameters: {
-            query?: {
-                skip?: number;
-                limit?: number;
-                is_available?: boolean | null;
-                specializations?: string[] | null;
-            };
+            query?: never;
             header?: never;
-            path?: never;
+            path: {
+                specialist_id: string;
+            };
             cookie?: never;
         };
         requestBody?: never;
@@ -1133,7 +1698,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["SpecialistOut"][];
+                    "application/json": components["schemas"]["SpecialistOut"];
                 };
             };
             /** @description Validation Error */
@@ -1147,23 +1712,23 @@ export interface operations {
             };
         };
     };
-    create_specialist_profile_api_v1_specialists_post: {
+    update_specialist_api_v1_specialists__specialist_id__put: {
         parameters: {
             query?: never;
-            header?: {
-                "x-user-id"?: string | null;
+            header?: never;
+            path: {
+                specialist_id: string;
             };
-            path?: never;
             cookie?: never;
         };
         requestBody: {
             content: {
-                "application/json": components["schemas"]["SpecialistCreate"];
+                "application/json": components["schemas"]["SpecialistUpdate"];
             };
         };
         responses: {
             /** @description Successful Response */
-            201: {
+            200: {
                 headers: {
                     [name: string]: unknown;
                 };
@@ -1182,12 +1747,12 @@ export interface operations {
             };
         };
     };
-    get_my_specialist_profile_api_v1_specialists_me_get: {
+    toggle_my_availability_api_v1_specialists_me_availability_patch: {
         parameters: {
-            query?: never;
-            header?: {
-                "x-user-id"?: string | null;
+            query: {
+                is_available: boolean;
             };
+            header?: never;
             path?: never;
             cookie?: never;
         };
@@ -1213,28 +1778,26 @@ export interface operations {
             };
         };
     };
-    update_my_specialist_profile_api_v1_specialists_me_put: {
+    create_booking_api_v1_bookings_post: {
         parameters: {
             query?: never;
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path?: never;
             cookie?: never;
         };
         requestBody: {
             content: {
-                "application/json": components["schemas"]["SpecialistUpdate"];
+                "application/json": components["schemas"]["BookingCreate"];
             };
         };
         responses: {
             /** @description Successful Response */
-            200: {
+            201: {
                 headers: {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["SpecialistOut"];
+                    "application/json": components["schemas"]["BookingOut"];
                 };
             };
             /** @description Validation Error */
@@ -1248,23 +1811,27 @@ export interface operations {
             };
         };
     };
-    delete_my_specialist_profile_api_v1_specialists_me_delete: {
+    create_booking_series_api_v1_bookings_series_post: {
         parameters: {
             query?: never;
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path?: never;
             cookie?: never;
         };
-        requestBody?: never;
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["BookingSeriesCreate"];
+            };
+        };
         responses: {
             /** @description Successful Response */
-            204: {
+            201: {
                 headers: {
                     [name: string]: unknown;
                 };
-                content?: never;
+                content: {
+                    "application/json": components["schemas"]["BookingSeriesOut"];
+                };
             };
             /** @description Validation Error */
             422: {
@@ -1277,12 +1844,12 @@ export interface operations {
             };
         };
     };
-    get_specialist_api_v1_specialists__specialist_id__get: {
+    get_booking_series_api_v1_bookings_series__series_id__get: {
         parameters: {
             query?: never;
             header?: never;
             path: {
-                specialist_id: string;
+                series_id: number;
             };
             cookie?: never;
         };
@@ -1294,7 +1861,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["SpecialistOut"];
+                    "application/json": components["schemas"]["BookingSeriesOut"];
                 };
             };
             /** @description Validation Error */
@@ -1308,20 +1875,18 @@ export interface operations {
             };
         };
     };
-    update_specialist_api_v1_specialists__specialist_id__put: {
+    update_booking_series_api_v1_bookings_series__series_id__put: {
         parameters: {
             query?: never;
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path: {
-                specialist_id: string;
+                series_id: number;
             };
             cookie?: never;
         };
         requestBody: {
             content: {
-                "application/json": components["schemas"]["SpecialistUpdate"];
+                "application/json": components["schemas"]["BookingSeriesUpdate"];
             };
         };
         responses: {
@@ -1331,7 +1896,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["SpecialistOut"];
+                    "application/json": components["schemas"]["BookingOut"][];
                 };
             };
             /** @description Validation Error */
@@ -1345,15 +1910,13 @@ export interface operations {
             };
         };
     };
-    toggle_my_availability_api_v1_specialists_me_availability_patch: {
+    cancel_booking_series_api_v1_bookings_series__series_id__cancel_patch: {
         parameters: {
-            query: {
-                is_available: boolean;
-            };
-            header?: {
-                "x-user-id"?: string | null;
+            query?: never;
+            header?: never;
+            path: {
+                series_id: number;
             };
-            path?: never;
             cookie?: never;
         };
         requestBody?: never;
@@ -1364,42 +1927,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["SpecialistOut"];
-                };
-            };
-            /** @description Validation Error */
-            422: {
-                headers: {
-                    [name: string]: unknown;
-                };
-                content: {
-                    "application/json": components["schemas"]["HTTPValidationError"];
-                };
-            };
-        };
-    };
-    create_booking_api_v1_bookings_post: {
-        parameters: {
-            query?: never;
-            header?: {
-                "x-user-id"?: string | null;
-            };
-            path?: never;
-            cookie?: never;
-        };
-        requestBody: {
-            content: {
-                "application/json": components["schemas"]["BookingCreate"];
-            };
-        };
-        responses: {
-            /** @description Successful Response */
-            201: {
-                headers: {
-                    [name: string]: unknown;
-                };
-                content: {
-                    "application/json": components["schemas"]["BookingOut"];
+                    "application/json": components["schemas"]["BookingOut"][];
                 };
             };
             /** @description Validation Error */
@@ -1419,10 +1947,12 @@ export interface operations {
                 skip?: number;
                 limit?: number;
                 status?: components["schemas"]["BookingStatus"] | null;
+                /** @description Opaque cursor from X-Next-Cursor; overrides skip */
+                cursor?: string | null;
+                /** @description Set to 'notes' to include note columns */
+                include?: string | null;
             };
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path?: never;
             cookie?: never;
         };
@@ -1434,7 +1964,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["BookingOut"][];
+                    "application/json": (components["schemas"]["BookingSummary"] | components["schemas"]["BookingOut"])[];
                 };
             };
             /** @description Validation Error */
@@ -1456,10 +1986,12 @@ export interface operations {
                 status?: components["schemas"]["BookingStatus"] | null;
                 start_date?: string | null;
                 end_date?: string | null;
+                /** @description Opaque cursor from X-Next-Cursor; overrides skip */
+                cursor?: string | null;
+                /** @description Set to 'notes' to include note columns */
+                include?: string | null;
             };
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path?: never;
             cookie?: never;
         };
@@ -1471,7 +2003,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["BookingOut"][];
+                    "application/json": (components["schemas"]["BookingSummary"] | components["schemas"]["BookingOut"])[];
                 };
             };
             /** @description Validation Error */
@@ -1488,9 +2020,7 @@ export interface operations {
     get_booking_api_v1_bookings__booking_id__get: {
         parameters: {
             query?: never;
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path: {
                 booking_id: string;
             };
@@ -1521,9 +2051,7 @@ export interface operations {
     update_booking_api_v1_bookings__booking_id__put: {
         parameters: {
             query?: never;
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path: {
                 booking_id: string;
             };
@@ -1558,9 +2086,7 @@ export interface operations {
     cancel_booking_api_v1_bookings__booking_id__cancel_patch: {
         parameters: {
             query?: never;
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path: {
                 booking_id: string;
             };
@@ -1591,9 +2117,7 @@ export interface operations {
     confirm_booking_api_v1_bookings__booking_id__confirm_patch: {
         parameters: {
             query?: never;
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path: {
                 booking_id: string;
             };
@@ -1624,9 +2148,7 @@ export interface operations {
     complete_booking_api_v1_bookings__booking_id__complete_patch: {
         parameters: {
             query?: never;
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path: {
                 booking_id: string;
             };
@@ -1659,9 +2181,7 @@ export interface operations {
             query: {
                 booking_id: string;
             };
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path?: never;
             cookie?: never;
         };
@@ -1696,10 +2216,12 @@ export interface operations {
             query?: {
                 skip?: number;
                 limit?: number;
+                /** @description Opaque cursor from X-Next-Cursor; overrides skip */
+                cursor?: string | null;
+                /** @description Set to 'notes' to include note columns */
+                include?: string | null;
             };
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path?: never;
             cookie?: never;
         };
@@ -1711,7 +2233,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["SessionOut"][];
+                    "application/json": (components["schemas"]["SessionSummary"] | components["schemas"]["SessionOut"])[];
                 };
             };
             /** @description Validation Error */
@@ -1730,10 +2252,12 @@ export interface operations {
             query?: {
                 skip?: number;
                 limit?: number;
+                /** @description Opaque cursor from X-Next-Cursor; overrides skip */
+                cursor?: string | null;
+                /** @description Set to 'notes' to include note columns */
+                include?: string | null;
             };
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path?: never;
             cookie?: never;
         };
@@ -1745,7 +2269,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["SessionOut"][];
+                    "application/json": (components["schemas"]["SessionSummary"] | components["schemas"]["SessionOut"])[];
                 };
             };
             /** @description Validation Error */
@@ -1762,9 +2286,7 @@ export interface operations {
     get_session_api_v1_sessions__session_id__get: {
         parameters: {
             query?: never;
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path: {
                 session_id: string;
             };
@@ -1795,9 +2317,7 @@ export interface operations {
     update_session_api_v1_sessions__session_id__put: {
         parameters: {
             query?: never;
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path: {
                 session_id: string;
             };
@@ -1832,9 +2352,7 @@ export interface operations {
     delete_session_api_v1_sessions__session_id__delete: {
         parameters: {
             query?: never;
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path: {
                 session_id: string;
             };
@@ -1865,9 +2383,7 @@ export interface operations {
             query: {
                 session_id: string;
             };
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path: {
                 booking_id: string;
             };
@@ -1900,9 +2416,7 @@ export interface operations {
             query: {
                 notes: string;
             };
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path: {
                 session_id: string;
             };
@@ -1935,9 +2449,7 @@ export interface operations {
             query: {
                 recording_url: string;
             };
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path: {
                 session_id: string;
             };
@@ -1968,9 +2480,7 @@ export interface operations {
     create_availability_api_v1_availability_post: {
         parameters: {
             query?: never;
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path?: never;
             cookie?: never;
         };
@@ -2003,9 +2513,7 @@ export interface operations {
     create_bulk_availability_api_v1_availability_bulk_post: {
         parameters: {
             query?: never;
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path?: never;
             cookie?: never;
         };
@@ -2041,9 +2549,7 @@ export interface operations {
                 day_of_week?: components["schemas"]["DayOfWeek"] | null;
                 is_available?: boolean | null;
             };
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path?: never;
             cookie?: never;
         };
@@ -2137,12 +2643,45 @@ export interface operations {
             };
         };
     };
+    get_available_slots_range_api_v1_availability_specialist__specialist_id__slots_range_get: {
+        parameters: {
+            query: {
+                start_date: string;
+                end_date: string;
+                duration_minutes?: number;
+            };
+            header?: never;
+            path: {
+                specialist_id: number;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Slots grouped by day */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["DaySlots"][];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     get_availability_api_v1_availability__availability_id__get: {
         parameters: {
             query?: never;
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path: {
                 availability_id: string;
             };
@@ -2173,9 +2712,7 @@ export interface operations {
     update_availability_api_v1_availability__availability_id__put: {
         parameters: {
             query?: never;
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path: {
                 availability_id: string;
             };
@@ -2210,9 +2747,7 @@ export interface operations {
     delete_availability_api_v1_availability__availability_id__delete: {
         parameters: {
             query?: never;
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path: {
                 availability_id: string;
             };
@@ -2241,9 +2776,7 @@ export interface operations {
     clear_my_availability_api_v1_availability_me_all_delete: {
         parameters: {
             query?: never;
-            header?: {
-                "x-user-id"?: string | null;
-            };
+            header?: never;
             path?: never;
             cookie?: never;
         };
@@ -2256,15 +2789,6 @@ export interface operations {
                 };
                 content?: never;
             };
-            /** @description Validation Error */
-            422: {
-                headers: {
-                    [name: string]: unknown;
-                };
-                content: {
-                    "application/json": components["schemas"]["HTTPValidationError"];
-                };
-            };
         };
     };
 }
@@ -0,0 +1,44 @@
+"""Add free/busy search index tables
+
+Revision ID: 7b2e4f9a1c3d
+Revises: 323c08db1e6f
+Create Date: 2025-09-24 10:12:03.118402
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7b2e4f9a1c3d'
+down_revision = '323c08db1e6f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('availability_buckets',
+    sa.Column('specialist_id', sa.Integer(), nullable=False),
+    sa.Column('day_of_week', sa.String(length=10), nullable=False),
+    sa.Column('bucket', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['specialist_id'], ['specialists.id'], name=op.f('fk_availability_buckets_specialist_id_specialists')),
+    sa.PrimaryKeyConstraint('specialist_id', 'day_of_week', 'bucket', name=op.f('pk_availability_buckets'))
+    )
+    op.create_index('ix_availability_buckets_day_of_week_bucket', 'availability_buckets', ['day_of_week', 'bucket'], unique=False)
+    op.create_table('booking_buckets',
+    sa.Column('booking_id', sa.Integer(), nullable=False),
+    sa.Column('slot_date', sa.Date(), nullable=False),
+    sa.Column('bucket', sa.Integer(), nullable=False),
+    sa.Column('specialist_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['booking_id'], ['bookings.id'], name=op.f('fk_booking_buckets_booking_id_bookings')),
+    sa.ForeignKeyConstraint(['specialist_id'], ['specialists.id'], name=op.f('fk_booking_buckets_specialist_id_specialists')),
+    sa.PrimaryKeyConstraint('booking_id', 'slot_date', 'bucket', name=op.f('pk_booking_buckets'))
+    )
+    op.create_index('ix_booking_buckets_specialist_id_slot_date', 'booking_buckets', ['specialist_id', 'slot_date', 'bucket'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_booking_buckets_specialist_id_slot_date', table_name='booking_buckets')
+    op.drop_table('booking_buckets')
+    op.drop_index('ix_availability_buckets_day_of_week_bucket', table_name='availability_buckets')
+    op.drop_table('availability_buckets')
@@ -0,0 +1,52 @@
+"""Add booking_series and bookings.series_id
+
+Revision ID: a9d3f5e7c2b4
+Revises: f1c6d8a4b2e7
+Create Date: 2025-10-02 09:18:44.207315
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a9d3f5e7c2b4'
+down_revision = 'f1c6d8a4b2e7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('booking_series',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('patient_id', sa.Integer(), nullable=False),
+    sa.Column('specialist_id', sa.Integer(), nullable=False),
+    sa.Column('start_time', sa.DateTime(), nullable=False),
+    sa.Column('duration_minutes', sa.Integer(), nullable=False),
+    sa.Column('interval_weeks', sa.Integer(), nullable=False),
+    sa.Column('occurrences', sa.Integer(), nullable=False),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['patient_id'], ['users.id'], name=op.f('fk_booking_series_patient_id_users')),
+    sa.ForeignKeyConstraint(['specialist_id'], ['specialists.id'], name=op.f('fk_booking_series_specialist_id_specialists')),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_booking_series'))
+    )
+    op.create_index(op.f('ix_booking_series_patient_id'), 'booking_series', ['patient_id'], unique=False)
+    op.create_index(op.f('ix_booking_series_specialist_id'), 'booking_series', ['specialist_id'], unique=False)
+
+    with op.batch_alter_table('bookings') as batch_op:
+        batch_op.add_column(sa.Column('series_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(
+            op.f('fk_bookings_series_id_booking_series'), 'booking_series', ['series_id'], ['id']
+        )
+    op.create_index(op.f('ix_bookings_series_id'), 'bookings', ['series_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_bookings_series_id'), table_name='bookings')
+    with op.batch_alter_table('bookings') as batch_op:
+        batch_op.drop_constraint(op.f('fk_bookings_series_id_booking_series'), type_='foreignkey')
+        batch_op.drop_column('series_id')
+    op.drop_index(op.f('ix_booking_series_specialist_id'), table_name='booking_series')
+    op.drop_index(op.f('ix_booking_series_patient_id'), table_name='booking_series')
+    op.drop_table('booking_series')
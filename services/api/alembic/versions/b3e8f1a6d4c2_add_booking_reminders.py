@@ -0,0 +1,34 @@
+"""Add booking_reminders
+
+Revision ID: b3e8f1a6d4c2
+Revises: a9d3f5e7c2b4
+Create Date: 2025-10-09 14:02:37.518204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3e8f1a6d4c2'
+down_revision = 'a9d3f5e7c2b4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('booking_reminders',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('booking_id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=20), nullable=False),
+    sa.Column('start_time', sa.DateTime(), nullable=False),
+    sa.Column('claimed_at', sa.DateTime(), nullable=False),
+    sa.Column('sent_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['booking_id'], ['bookings.id'], name=op.f('fk_booking_reminders_booking_id_bookings'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_booking_reminders')),
+    sa.UniqueConstraint('booking_id', 'kind', 'start_time', name=op.f('uq_booking_reminders_booking_id'))
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('booking_reminders')
@@ -0,0 +1,65 @@
+"""Add bookings.end_time with overlap index and exclusion constraint
+
+Revision ID: c4d8e1f2a9b6
+Revises: 7b2e4f9a1c3d
+Create Date: 2025-09-26 14:41:27.503361
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4d8e1f2a9b6'
+down_revision = '7b2e4f9a1c3d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    op.add_column('bookings', sa.Column('end_time', sa.DateTime(), nullable=True))
+
+    # Backfill end_time = start_time + duration_minutes
+    if bind.dialect.name == 'postgresql':
+        op.execute("UPDATE bookings SET end_time = start_time + duration_minutes * interval '1 minute'")
+    else:
+        op.execute("UPDATE bookings SET end_time = datetime(start_time, '+' || duration_minutes || ' minutes')")
+
+    with op.batch_alter_table('bookings') as batch_op:
+        batch_op.alter_column('end_time', existing_type=sa.DateTime(), nullable=False)
+    op.create_index('ix_bookings_specialist_id_end_time', 'bookings', ['specialist_id', 'end_time'], unique=False)
+
+    if bind.dialect.name == 'postgresql':
+        # The constraint cannot be added over existing overlaps; list them so they
+        # can be cancelled or moved by hand before running the migration again
+        overlaps = bind.execute(sa.text(
+            "SELECT a.id, b.id FROM bookings a JOIN bookings b "
+            "ON a.specialist_id = b.specialist_id AND a.id < b.id "
+            "AND a.start_time < b.end_time AND b.start_time < a.end_time "
+            "WHERE a.status IN ('pending', 'confirmed') AND b.status IN ('pending', 'confirmed') "
+            "ORDER BY a.id, b.id"
+        )).all()
+        if overlaps:
+            pairs = ", ".join(f"{first}/{second}" for first, second in overlaps)
+            raise RuntimeError(
+                f"Cannot add ex_bookings_specialist_id_no_overlap: {len(overlaps)} pairs of active "
+                f"bookings overlap (booking ids {pairs}). Cancel or reschedule one of each pair and "
+                "run the migration again."
+            )
+
+        # Database-level guarantee that active bookings of a specialist never overlap
+        op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+        op.execute(
+            "ALTER TABLE bookings ADD CONSTRAINT ex_bookings_specialist_id_no_overlap "
+            "EXCLUDE USING gist (specialist_id WITH =, tsrange(start_time, end_time) WITH &&) "
+            "WHERE (status IN ('pending', 'confirmed'))"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("ALTER TABLE bookings DROP CONSTRAINT IF EXISTS ex_bookings_specialist_id_no_overlap")
+    op.drop_index('ix_bookings_specialist_id_end_time', table_name='bookings')
+    with op.batch_alter_table('bookings') as batch_op:
+        batch_op.drop_column('end_time')
@@ -0,0 +1,35 @@
+"""Add the (status, start_time) booking index for the reminder scheduler
+
+Revision ID: c8e4a2f6b1d3
+Revises: b3e8f1a6d4c2
+Create Date: 2025-10-09 14:05:12.640931
+
+On Postgres the index is built with CREATE INDEX CONCURRENTLY so bookings
+stays writable, as in f1c6d8a4b2e7.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8e4a2f6b1d3'
+down_revision = 'b3e8f1a6d4c2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.create_index('ix_bookings_status_start_time', 'bookings', ['status', 'start_time'], unique=False,
+                            postgresql_concurrently=True, if_not_exists=True)
+    else:
+        op.create_index('ix_bookings_status_start_time', 'bookings', ['status', 'start_time'], unique=False)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.drop_index('ix_bookings_status_start_time', table_name='bookings',
+                          postgresql_concurrently=True, if_exists=True)
+    else:
+        op.drop_index('ix_bookings_status_start_time', table_name='bookings')
@@ -0,0 +1,35 @@
+"""Add the (status, end_time) booking index for the expired-booking sweep
+
+Revision ID: d7a2c9e4f1b8
+Revises: c8e4a2f6b1d3
+Create Date: 2025-10-13 10:21:54.093817
+
+On Postgres the index is built with CREATE INDEX CONCURRENTLY so bookings
+stays writable, as in f1c6d8a4b2e7.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7a2c9e4f1b8'
+down_revision = 'c8e4a2f6b1d3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.create_index('ix_bookings_status_end_time', 'bookings', ['status', 'end_time'], unique=False,
+                            postgresql_concurrently=True, if_not_exists=True)
+    else:
+        op.create_index('ix_bookings_status_end_time', 'bookings', ['status', 'end_time'], unique=False)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.drop_index('ix_bookings_status_end_time', table_name='bookings',
+                          postgresql_concurrently=True, if_exists=True)
+    else:
+        op.drop_index('ix_bookings_status_end_time', table_name='bookings')
@@ -0,0 +1,40 @@
+"""Add the outbox table for booking and session domain events
+
+Revision ID: e2b9d4f7a3c1
+Revises: d7a2c9e4f1b8
+Create Date: 2025-10-15 16:47:12.662041
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2b9d4f7a3c1'
+down_revision = 'd7a2c9e4f1b8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('outbox',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('aggregate', sa.String(length=20), nullable=False),
+    sa.Column('aggregate_id', sa.Integer(), nullable=False),
+    sa.Column('event', sa.String(length=30), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('published_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_outbox'))
+    )
+    op.create_index(
+        'ix_outbox_pending_id', 'outbox', ['id'], unique=False,
+        postgresql_where=sa.text('published_at IS NULL'),
+        sqlite_where=sa.text('published_at IS NULL'),
+    )
+    op.create_index('ix_outbox_published_at', 'outbox', ['published_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outbox_published_at', table_name='outbox')
+    op.drop_index('ix_outbox_pending_id', table_name='outbox')
+    op.drop_table('outbox')
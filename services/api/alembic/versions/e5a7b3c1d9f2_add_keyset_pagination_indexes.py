@@ -0,0 +1,25 @@
+"""Add composite indexes for keyset pagination
+
+Revision ID: e5a7b3c1d9f2
+Revises: c4d8e1f2a9b6
+Create Date: 2025-09-29 09:03:51.774210
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a7b3c1d9f2'
+down_revision = 'c4d8e1f2a9b6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_bookings_patient_id_start_time_id', 'bookings', ['patient_id', 'start_time', 'id'], unique=False)
+    op.create_index('ix_bookings_specialist_id_start_time_id', 'bookings', ['specialist_id', 'start_time', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_bookings_specialist_id_start_time_id', table_name='bookings')
+    op.drop_index('ix_bookings_patient_id_start_time_id', table_name='bookings')
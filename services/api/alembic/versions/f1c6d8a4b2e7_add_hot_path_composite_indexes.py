@@ -0,0 +1,45 @@
+"""Add composite indexes for booking, session and availability hot paths
+
+Revision ID: f1c6d8a4b2e7
+Revises: e5a7b3c1d9f2
+Create Date: 2025-10-01 16:20:44.091536
+
+On Postgres the indexes are built with CREATE INDEX CONCURRENTLY so existing
+tables stay writable; that requires running outside a transaction block.
+Verify with scripts/explain_hot_queries.py.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1c6d8a4b2e7'
+down_revision = 'e5a7b3c1d9f2'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ('ix_bookings_patient_id_status_start_time', 'bookings', ['patient_id', 'status', 'start_time']),
+    ('ix_bookings_specialist_id_status_start_time', 'bookings', ['specialist_id', 'status', 'start_time']),
+    ('ix_availabilities_specialist_id_day_of_week_start_time', 'availabilities', ['specialist_id', 'day_of_week', 'start_time']),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            for name, table, columns in INDEXES:
+                op.create_index(name, table, columns, unique=False, postgresql_concurrently=True, if_not_exists=True)
+    else:
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            for name, table, _ in reversed(INDEXES):
+                op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    else:
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table)
@@ -25,6 +25,58 @@ class Settings(BaseSettings):
     async_database_url: str | None = Field(default=None, alias="ASYNC_DATABASE_URL")
     jwt_secret: str = Field(default="dev-secret-change-in-production", alias="JWT_SECRET")
     access_token_expires_min: int = Field(default=30, alias="ACCESS_TOKEN_EXPIRES_MIN")
+    # Refresh tokens are signed with their own secret when one is configured
+    jwt_refresh_secret: str | None = Field(default=None, alias="JWT_REFRESH_SECRET")
+    refresh_token_expires_hr: int = Field(default=168, alias="REFRESH_TOKEN_EXPIRES_HR")
+    jwt_algorithm: str = Field(default="HS256", alias="JWT_ALGORITHM")
+    # bcrypt cost for new hashes; stored hashes below it are upgraded on login.
+    # Pick it with scripts/calibrate_password_hash.py on production hardware.
+    bcrypt_rounds: int = Field(default=12, alias="BCRYPT_ROUNDS")
+    # Bounded thread pool for bcrypt; 0 workers hashes inline on the event loop
+    password_hash_workers: int = Field(default=4, alias="PASSWORD_HASH_WORKERS")
+    password_hash_max_queue: int = Field(default=32, alias="PASSWORD_HASH_MAX_QUEUE")
+    # Connection pool tuning for the process-wide async engine
+    db_pool_size: int = Field(default=10, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=20, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout: int = Field(default=30, alias="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(default=1800, alias="DB_POOL_RECYCLE")
+    db_pool_pre_ping: bool = Field(default=True, alias="DB_POOL_PRE_PING")
+    # Bounded retries for booking writes that hit lock/serialization conflicts
+    booking_max_retries: int = Field(default=3, alias="BOOKING_MAX_RETRIES")
+    redis_url: str | None = Field(default=None, alias="REDIS_URL")
+    # Asyncio worker mode (WORKER_MODE=async): max concurrent jobs per queue, as JSON
+    worker_queue_concurrency: dict[str, int] = Field(
+        default={"high": 32, "default": 32, "low": 8}, alias="WORKER_QUEUE_CONCURRENCY"
+    )
+    # Where job notifications go: "log", or "file:<path>" for JSON lines
+    notification_sender: str = Field(default="log", alias="NOTIFICATION_SENDER")
+    # Reminder scheduler: tick interval, how late a missed reminder may still go out, claim batch size
+    reminder_bucket_seconds: int = Field(default=300, alias="REMINDER_BUCKET_SECONDS")
+    reminder_catch_up_seconds: int = Field(default=900, alias="REMINDER_CATCH_UP_SECONDS")
+    reminder_batch_size: int = Field(default=100, alias="REMINDER_BATCH_SIZE")
+    # Expired-booking sweep: run interval, how long after its end a booking is left alone, UPDATE chunk size
+    booking_sweep_interval_seconds: int = Field(default=300, alias="BOOKING_SWEEP_INTERVAL_SECONDS")
+    booking_sweep_grace_seconds: int = Field(default=3600, alias="BOOKING_SWEEP_GRACE_SECONDS")
+    booking_sweep_chunk_size: int = Field(default=500, alias="BOOKING_SWEEP_CHUNK_SIZE")
+    # Outbox relay: events per batch, idle poll interval, how long published events are kept
+    outbox_batch_size: int = Field(default=200, alias="OUTBOX_BATCH_SIZE")
+    outbox_poll_seconds: float = Field(default=1.0, alias="OUTBOX_POLL_SECONDS")
+    outbox_retention_seconds: int = Field(default=7 * 24 * 3600, alias="OUTBOX_RETENTION_SECONDS")
+    # Idempotency-Key: how long responses are replayed, how long a duplicate waits for the
+    # request in flight, and after how long an unfinished request is presumed dead
+    idempotency_ttl_seconds: int = Field(default=24 * 3600, alias="IDEMPOTENCY_TTL_SECONDS")
+    idempotency_wait_seconds: float = Field(default=10.0, alias="IDEMPOTENCY_WAIT_SECONDS")
+    idempotency_lock_seconds: int = Field(default=60, alias="IDEMPOTENCY_LOCK_SECONDS")
+    # Available-slot cache: in-process LRU tier plus Redis tier when REDIS_URL is set;
+    # invalidations fan out to other workers over Redis pub/sub
+    slot_cache_max_entries: int = Field(default=4096, alias="SLOT_CACHE_MAX_ENTRIES")
+    slot_cache_local_ttl: float = Field(default=30, alias="SLOT_CACHE_LOCAL_TTL")
+    slot_cache_redis_ttl: int = Field(default=300, alias="SLOT_CACHE_REDIS_TTL")
+    slot_cache_channel: str = Field(default="slots:invalidate", alias="SLOT_CACHE_CHANNEL")
+    # Principal cache for refresh and profile lookups; invalidations fan out over Redis pub/sub
+    principal_cache_max_entries: int = Field(default=10000, alias="PRINCIPAL_CACHE_MAX_ENTRIES")
+    principal_cache_ttl: float = Field(default=60, alias="PRINCIPAL_CACHE_TTL")
+    principal_cache_channel: str = Field(default="principals:invalidate", alias="PRINCIPAL_CACHE_CHANNEL")
 
     class Config:
         env_file = ".env"
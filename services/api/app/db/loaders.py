@@ -0,0 +1,92 @@
+"""
+Named eager-loading profiles for ORM graph loads.
+
+Each service use case picks a profile instead of chaining loader options
+inline. Single-row detail loads use joined eager loading (one round trip);
+list loads use selectin loading (one extra round trip per relationship,
+regardless of page size), or contains_eager when the list query already joins
+the related table. Every profile ends in ``raiseload("*")``, so touching a
+relationship the profile did not load raises instead of emitting SQL (under
+asyncio an implicit lazy load fails anyway, only later and less clearly).
+"""
+
+from typing import Dict, Tuple
+
+from sqlalchemy.orm import contains_eager, defer, joinedload, raiseload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from app.models.booking import Booking
+from app.models.session import Session
+from app.models.specialist import Specialist
+
+# sql_only: many-to-one lookups already satisfied by the identity map still work
+_RAISE = raiseload("*", sql_only=True)
+
+# Unbounded text columns: never loaded for related rows in list profiles, and
+# deferred on list roots via defer_text() unless the caller asks for notes
+TEXT_COLUMNS = {
+    Booking: (Booking.notes, Booking.cancellation_reason),
+    Session: (Session.notes, Session.session_summary),
+}
+
+
+def _defer_all(columns) -> Tuple[LoaderOption, ...]:
+    return tuple(defer(column, raiseload=True) for column in columns)
+
+
+LOAD_PROFILES: Dict[str, Tuple[LoaderOption, ...]] = {
+    "booking.detail": (
+        joinedload(Booking.patient, innerjoin=True),
+        joinedload(Booking.specialist, innerjoin=True).joinedload(Specialist.user, innerjoin=True),
+        joinedload(Booking.session),
+        _RAISE,
+    ),
+    "booking.patient_list": (
+        selectinload(Booking.specialist).joinedload(Specialist.user, innerjoin=True),
+        selectinload(Booking.session).options(*_defer_all(TEXT_COLUMNS[Session])),
+        _RAISE,
+    ),
+    "booking.specialist_list": (
+        selectinload(Booking.patient),
+        selectinload(Booking.session).options(*_defer_all(TEXT_COLUMNS[Session])),
+        _RAISE,
+    ),
+    "session.detail": (
+        joinedload(Session.booking, innerjoin=True).joinedload(Booking.patient, innerjoin=True),
+        joinedload(Session.booking, innerjoin=True)
+        .joinedload(Booking.specialist, innerjoin=True)
+        .joinedload(Specialist.user, innerjoin=True),
+        _RAISE,
+    ),
+    # Session lists already JOIN bookings to filter, so the booking comes along for free
+    "session.patient_list": (
+        contains_eager(Session.booking)
+        .selectinload(Booking.specialist)
+        .joinedload(Specialist.user, innerjoin=True),
+        contains_eager(Session.booking).options(*_defer_all(TEXT_COLUMNS[Booking])),
+        _RAISE,
+    ),
+    "session.specialist_list": (
+        contains_eager(Session.booking).selectinload(Booking.patient),
+        contains_eager(Session.booking).options(*_defer_all(TEXT_COLUMNS[Booking])),
+        _RAISE,
+    ),
+    "specialist.detail": (
+        joinedload(Specialist.user, innerjoin=True),
+        _RAISE,
+    ),
+    "specialist.list": (
+        selectinload(Specialist.user),
+        _RAISE,
+    ),
+}
+
+
+def load_profile(name: str) -> Tuple[LoaderOption, ...]:
+    """Loader options for a named profile; raises KeyError for unknown names."""
+    return LOAD_PROFILES[name]
+
+
+def defer_text(model) -> Tuple[LoaderOption, ...]:
+    """Defer a model's unbounded text columns; reading one then raises instead of loading."""
+    return _defer_all(TEXT_COLUMNS[model])
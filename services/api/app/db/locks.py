@@ -0,0 +1,83 @@
+"""
+Per-specialist write locks and retry helpers for booking transactions.
+"""
+
+import asyncio
+import random
+from typing import Awaitable, Callable, TypeVar
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+T = TypeVar("T")
+
+# Namespace for pg_advisory_xact_lock(namespace, key) so booking locks can't collide with others
+SPECIALIST_LOCK_NAMESPACE = 1001
+
+# SQLSTATEs worth retrying: serialization_failure, deadlock_detected, lock_not_available
+RETRYABLE_SQLSTATES = {"40001", "40P01", "55P03"}
+EXCLUSION_VIOLATION_SQLSTATE = "23P01"
+
+
+async def lock_specialist(db: AsyncSession, specialist_id: int) -> None:
+    """Serialize booking writes for one specialist until the transaction ends.
+
+    Postgres takes a transaction-scoped advisory lock. SQLite has no row locks, so a
+    no-op UPDATE on the specialist row takes the database write lock instead.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        await db.execute(
+            text("SELECT pg_advisory_xact_lock(:namespace, :key)"),
+            {"namespace": SPECIALIST_LOCK_NAMESPACE, "key": specialist_id},
+        )
+    elif dialect == "sqlite":
+        await db.execute(text("UPDATE specialists SET id = id WHERE id = :id"), {"id": specialist_id})
+    else:
+        await db.execute(
+            text("SELECT id FROM specialists WHERE id = :id FOR UPDATE"), {"id": specialist_id}
+        )
+
+
+def _sqlstate(exc: DBAPIError) -> str | None:
+    orig = exc.orig
+    return getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+
+
+def is_retryable_error(exc: DBAPIError) -> bool:
+    """Transient contention errors that a fresh transaction may succeed past."""
+    if _sqlstate(exc) in RETRYABLE_SQLSTATES:
+        return True
+    return "database is locked" in str(exc.orig)
+
+
+def is_exclusion_violation(exc: DBAPIError) -> bool:
+    """The bookings overlap exclusion constraint rejected the write."""
+    return _sqlstate(exc) == EXCLUSION_VIOLATION_SQLSTATE
+
+
+async def run_with_retries(
+    db: AsyncSession,
+    operation: Callable[[], Awaitable[T]],
+    max_retries: int,
+    backoff_seconds: float = 0.02,
+) -> T:
+    """Run a transactional operation, rolling back and retrying on transient conflicts.
+
+    Any failure rolls the transaction back so locks taken by the operation are released.
+    """
+    attempt = 0
+    while True:
+        try:
+            return await operation()
+        except DBAPIError as exc:
+            await db.rollback()
+            if not is_retryable_error(exc) or attempt >= max_retries:
+                raise
+            attempt += 1
+            # Exponential backoff with jitter so retries don't collide again
+            await asyncio.sleep(backoff_seconds * (2 ** attempt) * random.random())
+        except BaseException:
+            await db.rollback()
+            raise
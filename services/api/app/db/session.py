@@ -1,10 +1,15 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from typing import AsyncGenerator
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from typing import AsyncGenerator, Optional
 import os
 
 from app.core.config import settings
 
 
+# One engine (and connection pool) per process, created lazily or by the app lifespan
+_engine: Optional[AsyncEngine] = None
+_session_maker: Optional[async_sessionmaker[AsyncSession]] = None
+
+
 def get_database_url() -> str:
     # Check for runtime environment variables first (for testing)
     if "ASYNC_DATABASE_URL" in os.environ:
@@ -21,12 +26,50 @@ def get_database_url() -> str:
     return settings.database_url
 
 
-def get_engine():
-    return create_async_engine(get_database_url(), pool_pre_ping=True)
+def get_engine_options(db_url: str) -> dict:
+    """Build pool options for create_async_engine from settings."""
+    options = {
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+    # SQLite uses its own pool classes which don't accept sizing arguments
+    if not db_url.startswith("sqlite"):
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+        )
+    return options
+
+
+def get_engine() -> AsyncEngine:
+    global _engine
+    if _engine is None:
+        db_url = get_database_url()
+        _engine = create_async_engine(db_url, **get_engine_options(db_url))
+    return _engine
+
+
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    global _session_maker
+    if _session_maker is None:
+        _session_maker = async_sessionmaker(get_engine(), class_=AsyncSession, expire_on_commit=False)
+    return _session_maker
+
+
+def init_engine() -> AsyncEngine:
+    """Create the process-wide engine and session maker (called on app startup)."""
+    get_session_maker()
+    return get_engine()
 
 
-def get_session_maker():
-    return async_sessionmaker(get_engine(), class_=AsyncSession, expire_on_commit=False)
+async def dispose_engine() -> None:
+    """Close all pooled connections and drop the process-wide engine (called on shutdown)."""
+    global _engine, _session_maker
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _session_maker = None
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
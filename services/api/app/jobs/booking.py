@@ -0,0 +1,85 @@
+"""
+Booking side-effect jobs: notifications and calendar updates.
+
+Jobs receive ids, not rows, and re-read the booking when they run, so a job
+that was queued behind a later change acts on the current state.
+Notifications go out through the configured sender (app.jobs.senders); no
+calendar provider is wired up yet, so the calendar job builds what one would
+receive, logs it and returns it as the job result.
+"""
+
+import logging
+from dataclasses import asdict
+from datetime import timedelta
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import aliased
+
+from app.jobs.context import job_session
+from app.jobs.senders import Notification, get_sender
+from app.models.booking import Booking, BookingStatus
+from app.models.specialist import Specialist
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+CALENDAR_STATUS = {
+    BookingStatus.PENDING: "TENTATIVE",
+    BookingStatus.CONFIRMED: "CONFIRMED",
+    BookingStatus.COMPLETED: "CONFIRMED",
+}
+
+
+async def notify_booking(booking_id: int, event: str) -> Optional[dict]:
+    """Tell the patient and the specialist that a booking was ``event``."""
+    row = await _load_booking(booking_id)
+    if row is None:
+        logger.info("Booking %s is gone; skipping %s notification", booking_id, event)
+        return None
+    notification = Notification(
+        kind=f"booking_{event}",
+        booking_id=booking_id,
+        subject=f"Appointment {event}: {row.start_time:%Y-%m-%d %H:%M}",
+        recipients=[row.patient_email, row.specialist_email],
+    )
+    await get_sender().send([notification])
+    return asdict(notification)
+
+
+async def sync_booking_calendar(booking_id: int, event: str) -> Optional[dict]:
+    """Upsert (or cancel) the booking's event in the specialist's calendar."""
+    row = await _load_booking(booking_id)
+    if row is None:
+        logger.info("Booking %s is gone; skipping calendar sync", booking_id)
+        return None
+    calendar_event = {
+        "uid": f"booking-{booking_id}@groundedcounselling",
+        "organizer": row.specialist_email,
+        "attendees": [row.patient_email],
+        "start": row.start_time.isoformat(),
+        "end": (row.start_time + timedelta(minutes=row.duration_minutes)).isoformat(),
+        "status": CALENDAR_STATUS.get(row.status, "CANCELLED"),
+    }
+    logger.info("Calendar update for %s booking: %s", event, calendar_event)
+    return calendar_event
+
+
+async def _load_booking(booking_id: int):
+    specialist_user = aliased(User)
+    async with job_session() as db:
+        return (
+            await db.execute(
+                select(
+                    Booking.start_time,
+                    Booking.duration_minutes,
+                    Booking.status,
+                    User.email.label("patient_email"),
+                    specialist_user.email.label("specialist_email"),
+                )
+                .join(User, User.id == Booking.patient_id)
+                .join(Specialist, Specialist.id == Booking.specialist_id)
+                .join(specialist_user, specialist_user.id == Specialist.user_id)
+                .where(Booking.id == booking_id)
+            )
+        ).one_or_none()
@@ -0,0 +1,39 @@
+"""
+Database access for job functions.
+
+Under the forking RQ worker every job runs in a fresh child process on its own
+event loop, so by default a job gets a throwaway NullPool engine that is
+disposed when the job ends. Runners that execute many jobs on one loop (and the
+test harness) install a shared session factory with ``use_session_maker``.
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.db.session import get_database_url
+
+_session_maker: Optional[async_sessionmaker[AsyncSession]] = None
+
+
+def use_session_maker(session_maker: Optional[async_sessionmaker[AsyncSession]]) -> None:
+    """Share ``session_maker`` across jobs in this process; None restores per-job engines."""
+    global _session_maker
+    _session_maker = session_maker
+
+
+@asynccontextmanager
+async def job_session() -> AsyncIterator[AsyncSession]:
+    if _session_maker is not None:
+        async with _session_maker() as session:
+            yield session
+        return
+
+    engine = create_async_engine(get_database_url(), poolclass=NullPool)
+    try:
+        async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+            yield session
+    finally:
+        await engine.dispose()
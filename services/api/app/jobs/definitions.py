@@ -0,0 +1,71 @@
+"""
+Typed definitions of the background jobs the worker runs.
+
+The API never imports job code to enqueue it: each JobSpec names its function
+by dotted path, and RQ resolves that path inside the worker. Queues are listed
+in priority order; a worker drains ``high`` before looking at ``default``, and
+``default`` before ``low``.
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+
+
+class JobQueue(str, Enum):
+    HIGH = "high"
+    DEFAULT = "default"
+    LOW = "low"
+
+
+# Order a worker listens in: earlier queues always win
+QUEUE_PRIORITY = (JobQueue.HIGH, JobQueue.DEFAULT, JobQueue.LOW)
+
+
+class BookingEvent(str, Enum):
+    CREATED = "created"
+    RESCHEDULED = "rescheduled"
+    CONFIRMED = "confirmed"
+    CANCELLED = "cancelled"
+    COMPLETED = "completed"
+    NO_SHOW = "no_show"
+
+
+class SessionEvent(str, Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    """A job function, the queue it runs on and its execution limits."""
+    func: str
+    queue: JobQueue
+    timeout: int = 60
+    retries: int = 3
+    description: str = ""
+
+
+NOTIFY_BOOKING = JobSpec(
+    func="app.jobs.booking.notify_booking",
+    queue=JobQueue.HIGH,
+    timeout=30,
+    description="Notify patient and specialist of a booking change",
+)
+
+SYNC_BOOKING_CALENDAR = JobSpec(
+    func="app.jobs.booking.sync_booking_calendar",
+    queue=JobQueue.DEFAULT,
+    timeout=60,
+    description="Push a booking change to the specialist's calendar",
+)
+
+# Jobs fanned out for every booking state change
+BOOKING_EVENT_JOBS = (NOTIFY_BOOKING, SYNC_BOOKING_CALENDAR)
+
+# Jobs the outbox relay fans out per aggregate; each gets ``<aggregate>_id`` and ``event``.
+# Session events are recorded for consumers to come but trigger no jobs yet.
+OUTBOX_JOBS = {
+    "booking": BOOKING_EVENT_JOBS,
+    "session": (),
+}
@@ -0,0 +1,36 @@
+"""
+Periodic purge of expired idempotency keys.
+
+Claims already replace an expired key for the same user and key, so the purge
+only keeps the table from growing with keys that are never reused.
+"""
+
+import asyncio
+import logging
+
+from app.jobs.context import job_session
+from app.services.idempotency import IdempotencyService
+
+logger = logging.getLogger(__name__)
+
+# Seconds between purges
+PURGE_INTERVAL = 3600
+
+
+async def purge_idempotency_keys() -> int:
+    """Delete every expired idempotency key; returns how many were deleted."""
+    async with job_session() as db:
+        purged = await IdempotencyService.purge_expired(db)
+    if purged:
+        logger.info("Purged %s expired idempotency keys", purged)
+    return purged
+
+
+async def run_idempotency_purge(interval: float = PURGE_INTERVAL) -> None:
+    """Purge once per interval until cancelled."""
+    while True:
+        try:
+            await purge_idempotency_keys()
+        except Exception:
+            logger.warning("Idempotency key purge failed", exc_info=True)
+        await asyncio.sleep(interval)
@@ -0,0 +1,161 @@
+"""
+Outbox relay: publish recorded domain events to the job queues.
+
+BookingService and SessionService write an outbox row in the same transaction
+as each state change (see app.services.outbox), so an event exists exactly
+when its change committed and the request never waits on Redis. The relay
+picks the oldest unpublished rows with SELECT ... FOR UPDATE SKIP LOCKED, so
+several relays can run side by side without taking the same rows, enqueues
+the jobs for the whole batch in one Redis pipeline and stamps the rows
+published in the same transaction.
+
+Delivery is at least once: if the process dies after the pipeline ran but
+before the commit, the batch is published again. Jobs re-read current state
+by id, so a repeat is harmless. Published rows are purged once older than the
+retention period, and so are rows that were never published (no REDIS_URL, or
+Redis down for the whole period): past retention their reminders are moot and
+keeping them would let the table grow without bound.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Sequence, cast
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.engine import CursorResult
+
+from app.core.config import settings
+from app.jobs.context import job_session
+from app.jobs.definitions import OUTBOX_JOBS
+from app.jobs.queue import get_job_connection, get_queues, job_options
+from app.models.outbox import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    def __init__(
+        self,
+        batch_size: int = 200,
+        poll_interval: float = 1.0,
+        retention: timedelta = timedelta(days=7),
+        purge_interval: float = 3600,
+    ):
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self.purge_interval = purge_interval
+        self.published = 0
+        self.failed_batches = 0
+        self.purged = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+
+    async def relay(self) -> int:
+        """Publish one batch of unpublished events; returns how many were published."""
+        connection = get_job_connection()
+        if connection is None:
+            logger.debug("No REDIS_URL; outbox events stay unpublished")
+            return 0
+        async with job_session() as db:
+            events = (
+                await db.scalars(
+                    select(OutboxEvent)
+                    .where(OutboxEvent.published_at.is_(None))
+                    .order_by(OutboxEvent.id)
+                    .limit(self.batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+            ).all()
+            if not events:
+                return 0
+            try:
+                await asyncio.to_thread(self._publish, connection, events)
+            except Exception:
+                self.failed_batches += 1
+                logger.warning("Publishing %s outbox events failed", len(events), exc_info=True)
+                return 0
+            now = datetime.utcnow()
+            await db.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id.in_([event.id for event in events]))
+                .values(published_at=now)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        self.published += len(events)
+        self.last_lag = (now - events[0].created_at).total_seconds()
+        self.max_lag = max(self.max_lag, self.last_lag)
+        return len(events)
+
+    async def purge(self, now: Optional[datetime] = None) -> int:
+        """Delete events older than the retention period, one batch per transaction."""
+        cutoff = (now or datetime.utcnow()) - self.retention
+        published = await self._purge_where(OutboxEvent.published_at < cutoff)
+        unpublished = await self._purge_where(
+            OutboxEvent.published_at.is_(None), OutboxEvent.created_at < cutoff
+        )
+        if unpublished:
+            logger.warning("Dropped %s outbox events never published within retention", unpublished)
+        self.purged += published + unpublished
+        return published + unpublished
+
+    async def _purge_where(self, *criteria) -> int:
+        purged = 0
+        async with job_session() as db:
+            while True:
+                expired = select(OutboxEvent.id).where(*criteria).limit(self.batch_size * 10)
+                result = cast(CursorResult, await db.execute(delete(OutboxEvent).where(OutboxEvent.id.in_(expired))))
+                await db.commit()
+                purged += result.rowcount
+                if result.rowcount < self.batch_size * 10:
+                    return purged
+
+    async def run_forever(self) -> None:
+        """Relay continuously until cancelled, purging once per purge interval."""
+        next_purge = time.monotonic()
+        while True:
+            try:
+                if time.monotonic() >= next_purge:
+                    await self.purge()
+                    next_purge = time.monotonic() + self.purge_interval
+                # A full batch means more are waiting: go again without sleeping
+                if await self.relay() == self.batch_size:
+                    continue
+            except Exception:
+                logger.warning("Outbox relay failed", exc_info=True)
+            await asyncio.sleep(self.poll_interval)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "published": self.published,
+            "failed_batches": self.failed_batches,
+            "purged": self.purged,
+            "last_lag_seconds": round(self.last_lag, 3),
+            "max_lag_seconds": round(self.max_lag, 3),
+        }
+
+    @staticmethod
+    def _publish(connection, events: Sequence[OutboxEvent]) -> None:
+        queues = get_queues(connection)
+        with connection.pipeline() as pipeline:
+            for event in events:
+                for spec in OUTBOX_JOBS[event.aggregate]:
+                    queues[spec.queue].enqueue(
+                        spec.func,
+                        kwargs={f"{event.aggregate}_id": event.aggregate_id, "event": event.event},
+                        pipeline=pipeline,
+                        **job_options(spec),
+                    )
+            pipeline.execute()
+
+
+def get_outbox_relay() -> OutboxRelay:
+    """Relay sized from settings."""
+    return OutboxRelay(
+        batch_size=settings.outbox_batch_size,
+        poll_interval=settings.outbox_poll_seconds,
+        retention=timedelta(seconds=settings.outbox_retention_seconds),
+    )
@@ -0,0 +1,75 @@
+"""
+API-side helper for putting jobs on the worker's RQ queues.
+
+Services do not enqueue booking and session side effects themselves: they
+record outbox events, which the outbox relay (app.jobs.outbox) publishes
+here. Direct enqueueing never fails the caller: without REDIS_URL jobs are
+skipped, and Redis errors are logged. RQ's client is synchronous, so the round
+trip runs in a thread to keep the event loop free.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Optional
+
+from rq import Queue, Retry
+
+from app.core.config import settings
+from app.jobs.definitions import QUEUE_PRIORITY, JobQueue, JobSpec
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before each retry of a failed job
+RETRY_INTERVALS = [10, 60, 300]
+
+_connection = None
+
+
+def get_job_connection():
+    """Process-wide synchronous Redis connection for RQ, or None without REDIS_URL."""
+    global _connection
+    if _connection is None and settings.redis_url:
+        import redis
+
+        _connection = redis.Redis.from_url(settings.redis_url)
+    return _connection
+
+
+def use_job_connection(connection) -> None:
+    """Enqueue on ``connection`` from now on (None disables enqueueing unless REDIS_URL is set)."""
+    global _connection
+    _connection = connection
+
+
+def get_queues(connection, **options) -> Dict[JobQueue, Queue]:
+    """RQ queues for every JobQueue, in priority order."""
+    return {name: Queue(name.value, connection=connection, **options) for name in QUEUE_PRIORITY}
+
+
+def job_options(spec: JobSpec) -> dict:
+    """Queue.enqueue options carrying ``spec``'s timeout, retries and description."""
+    return {
+        "job_timeout": spec.timeout,
+        "retry": Retry(max=spec.retries, interval=RETRY_INTERVALS[: spec.retries]) if spec.retries else None,
+        "description": spec.description or None,
+    }
+
+
+async def enqueue(spec: JobSpec, **kwargs) -> Optional[str]:
+    """Queue ``spec`` with keyword arguments; returns the RQ job id, or None if not queued."""
+    connection = get_job_connection()
+    if connection is None:
+        logger.debug("No REDIS_URL; skipping job %s", spec.func)
+        return None
+    queue = Queue(spec.queue.value, connection=connection)
+    try:
+        job = await asyncio.to_thread(
+            queue.enqueue,
+            spec.func,
+            kwargs=kwargs,
+            **job_options(spec),
+        )
+    except Exception:
+        logger.warning("Failed to enqueue job %s", spec.func, exc_info=True)
+        return None
+    return job.id
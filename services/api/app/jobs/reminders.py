@@ -0,0 +1,171 @@
+"""
+Appointment reminders, dispatched in time buckets.
+
+Every ``bucket`` the scheduler ticks once: a single range query on
+(status, start_time) finds the confirmed bookings whose 24h or 1h reminder is
+due before the next tick, skipping ones already reminded. It then claims and
+sends them in batches. A claim is an INSERT ... ON CONFLICT DO NOTHING
+RETURNING into booking_reminders, committed before the batch is sent, so a
+restarted or concurrent scheduler only ever sends the reminders it claimed
+itself. If the sender raises, the batch's claims are released for the next
+tick; a crash between claim and send drops those reminders rather than risk
+sending twice.
+
+Windows reach back ``catch_up`` before now + offset, so reminders that fell
+due while no scheduler was running are still sent late (but never for an
+appointment that has already started).
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import and_, case, delete, exists, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import aliased
+
+from app.core.config import settings
+from app.jobs.context import job_session
+from app.jobs.senders import Notification, NotificationSender, get_sender
+from app.models.booking import Booking, BookingStatus
+from app.models.booking_reminder import BookingReminder
+from app.models.specialist import Specialist
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Reminder kind -> how long before the appointment it is sent
+REMINDER_OFFSETS = {
+    "24h": timedelta(hours=24),
+    "1h": timedelta(hours=1),
+}
+
+
+class ReminderScheduler:
+    def __init__(
+        self,
+        sender: Optional[NotificationSender] = None,
+        bucket: timedelta = timedelta(minutes=5),
+        catch_up: timedelta = timedelta(minutes=15),
+        batch_size: int = 100,
+    ):
+        self.sender = sender
+        self.bucket = bucket
+        self.catch_up = catch_up
+        self.batch_size = batch_size
+
+    def windows(self, now: datetime) -> Dict[str, Tuple[datetime, datetime]]:
+        """Half-open start_time range per reminder kind for the tick at ``now``."""
+        return {
+            kind: (max(now, now + offset - self.catch_up), now + offset + self.bucket)
+            for kind, offset in REMINDER_OFFSETS.items()
+        }
+
+    async def tick(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Send every reminder due before the next tick; returns counts."""
+        now = now or datetime.utcnow()
+        sender = self.sender or get_sender()
+        counts = {"due": 0, "sent": 0, "skipped": 0, "failed": 0}
+        async with job_session() as db:
+            due = (await db.execute(self._due_query(now))).all()
+            counts["due"] = len(due)
+            for offset in range(0, len(due), self.batch_size):
+                batch = due[offset:offset + self.batch_size]
+                claimed = await self._claim(db, batch, now)
+                counts["skipped"] += len(batch) - len(claimed)
+                if not claimed:
+                    continue
+                try:
+                    await sender.send([self._notification(row) for row in batch if (row.id, row.kind) in claimed])
+                except Exception:
+                    logger.warning("Sending %s reminders failed; releasing claims", len(claimed), exc_info=True)
+                    await self._release(db, claimed)
+                    counts["failed"] += len(claimed)
+                    continue
+                await db.execute(
+                    update(BookingReminder)
+                    .where(BookingReminder.id.in_(claimed.values()))
+                    .values(sent_at=datetime.utcnow())
+                )
+                await db.commit()
+                counts["sent"] += len(claimed)
+        if counts["due"]:
+            logger.info("Reminder tick at %s: %s", now.isoformat(), counts)
+        return counts
+
+    async def run_forever(self) -> None:
+        """Tick once per bucket until cancelled."""
+        while True:
+            try:
+                await self.tick()
+            except Exception:
+                logger.warning("Reminder tick failed", exc_info=True)
+            await asyncio.sleep(self.bucket.total_seconds())
+
+    def _due_query(self, now: datetime):
+        windows = self.windows(now)
+        in_window = {
+            kind: and_(Booking.start_time >= start, Booking.start_time < end)
+            for kind, (start, end) in windows.items()
+        }
+        kind = case(*((condition, kind) for kind, condition in in_window.items())).label("kind")
+        specialist_user = aliased(User)
+        already_claimed = exists().where(
+            BookingReminder.booking_id == Booking.id,
+            BookingReminder.start_time == Booking.start_time,
+            BookingReminder.kind == kind,
+        )
+        return (
+            select(
+                Booking.id,
+                Booking.start_time,
+                kind,
+                User.email.label("patient_email"),
+                specialist_user.email.label("specialist_email"),
+            )
+            .join(User, User.id == Booking.patient_id)
+            .join(Specialist, Specialist.id == Booking.specialist_id)
+            .join(specialist_user, specialist_user.id == Specialist.user_id)
+            .where(Booking.status == BookingStatus.CONFIRMED, or_(*in_window.values()), ~already_claimed)
+            .order_by(Booking.start_time, Booking.id)
+        )
+
+    async def _claim(self, db, batch, now: datetime) -> Dict[Tuple[int, str], int]:
+        """Insert claims for ``batch``; returns (booking id, kind) -> reminder id for rows this call won."""
+        dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+        statement = (
+            dialect.insert(BookingReminder)
+            .values([
+                {"booking_id": row.id, "kind": row.kind, "start_time": row.start_time, "claimed_at": now}
+                for row in batch
+            ])
+            .on_conflict_do_nothing(index_elements=["booking_id", "kind", "start_time"])
+            .returning(BookingReminder.id, BookingReminder.booking_id, BookingReminder.kind)
+        )
+        claimed = {(row.booking_id, row.kind): row.id for row in await db.execute(statement)}
+        await db.commit()
+        return claimed
+
+    async def _release(self, db, claimed: Dict[Tuple[int, str], int]) -> None:
+        await db.execute(delete(BookingReminder).where(BookingReminder.id.in_(claimed.values())))
+        await db.commit()
+
+    @staticmethod
+    def _notification(row) -> Notification:
+        return Notification(
+            kind=f"reminder_{row.kind}",
+            booking_id=row.id,
+            subject=f"Reminder: appointment at {row.start_time:%Y-%m-%d %H:%M}",
+            recipients=[row.patient_email, row.specialist_email],
+        )
+
+
+def get_reminder_scheduler() -> ReminderScheduler:
+    """Scheduler sized from settings."""
+    return ReminderScheduler(
+        bucket=timedelta(seconds=settings.reminder_bucket_seconds),
+        catch_up=timedelta(seconds=settings.reminder_catch_up_seconds),
+        batch_size=settings.reminder_batch_size,
+    )
+
@@ -0,0 +1,306 @@
+"""
+Asyncio job runner: many RQ jobs at once on one event loop.
+
+The forking RQ Worker pays a fork (and a fresh database engine) for every job,
+which dominates the cost of I/O-bound jobs. This runner pops jobs from the
+same Redis queues with RQ's own dequeue, awaits coroutine jobs on one loop
+(sync jobs go to threads) and records status and results through RQ's job
+API, so enqueueing, ``rq info``, results and retries work unchanged. Jobs
+share the process-wide async engine through ``use_session_maker``.
+
+Concurrency is capped per queue; a queue at its cap is simply not polled
+until a slot frees up, so a flood of low-priority jobs cannot starve the
+others. Like the forking worker, each running job is recorded in its queue's
+StartedJobRegistry (as an RQ execution) with a TTL that a heartbeat refreshes
+every ``heartbeat_interval`` seconds. On SIGTERM the runner stops dequeuing,
+waits up to ``shutdown_grace`` seconds and puts unfinished jobs back at the
+front of their queue; after a hard kill the heartbeats stop, the entries
+expire, and the registry cleanup that every worker (this one included, every
+``cleanup_interval`` seconds) runs retries or fails those jobs.
+
+The runner drives RQ's job bookkeeping directly, including private Job
+methods, so requirements pin RQ to the major version it was tested with (2.x).
+"""
+
+import asyncio
+import inspect
+import logging
+import signal
+import socket
+import traceback
+import uuid
+from functools import partial
+from typing import Dict, Iterable, List, Optional, Set
+
+from rq import Queue
+from rq.exceptions import DequeueTimeout
+from rq.executions import Execution
+from rq.job import Job, JobStatus
+from rq.registry import clean_registries
+from rq.scheduler import RQScheduler
+
+from app.core.config import settings
+from app.db.session import dispose_engine, get_session_maker
+from app.jobs.context import use_session_maker
+from app.jobs.definitions import JobQueue
+from app.jobs.idempotency import run_idempotency_purge
+from app.jobs.outbox import get_outbox_relay
+from app.jobs.queue import get_queues
+from app.jobs.reminders import get_reminder_scheduler
+from app.jobs.sweeper import get_booking_sweeper
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESULT_TTL = 500
+
+
+class AsyncJobRunner:
+    """Concurrent RQ job execution on the running event loop, capped per queue.
+
+    Every ``scheduler_interval`` seconds the runner also moves due retries back
+    onto their queues, as ``rq worker --with-scheduler`` would; None disables it.
+    Every ``cleanup_interval`` seconds it cleans the queues' registries, failing
+    or retrying jobs whose worker died; None disables that too.
+    """
+
+    def __init__(
+        self,
+        connection,
+        concurrency: Dict[JobQueue, int],
+        name: Optional[str] = None,
+        poll_timeout: int = 1,
+        shutdown_grace: float = 30,
+        scheduler_interval: Optional[float] = 1,
+        heartbeat_interval: float = 30,
+        cleanup_interval: Optional[float] = 600,
+    ):
+        self.connection = connection
+        self.queues = get_queues(connection)
+        self.concurrency = {queue: concurrency.get(queue, 0) for queue in self.queues}
+        self.name = name or f"async-{socket.gethostname()}-{uuid.uuid4().hex[:8]}"
+        self.poll_timeout = poll_timeout
+        self.shutdown_grace = shutdown_grace
+        self.scheduler_interval = scheduler_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.cleanup_interval = cleanup_interval
+        self._running: Dict[JobQueue, Set[asyncio.Task]] = {queue: set() for queue in self.queues}
+        self._slot_freed = asyncio.Event()
+        self._stopping = False
+        self.finished = 0
+        self.failed = 0
+
+    def request_stop(self) -> None:
+        """Stop dequeuing; ``run`` returns once in-flight jobs end or the grace period runs out."""
+        self._stopping = True
+        self._slot_freed.set()
+
+    async def run(self, burst: bool = False) -> None:
+        """Process jobs until stopped, or in burst mode until every queue is empty."""
+        maintenance = []
+        if self.scheduler_interval is not None:
+            maintenance.append(asyncio.create_task(self._schedule_retries(self.scheduler_interval)))
+        if self.cleanup_interval is not None:
+            maintenance.append(asyncio.create_task(self._clean_registries(self.cleanup_interval)))
+        try:
+            while not self._stopping:
+                self._slot_freed.clear()
+                open_queues = [
+                    self.queues[name] for name, running in self._running.items()
+                    if len(running) < self.concurrency[name]
+                ]
+                if not open_queues:
+                    await self._slot_freed.wait()
+                    continue
+
+                dequeued = await asyncio.to_thread(self._dequeue, open_queues, None if burst else self.poll_timeout)
+                if dequeued is None:
+                    if burst:
+                        self._slot_freed.clear()
+                        if not self._in_flight():
+                            break
+                        # Running jobs may enqueue more work; look again once one finishes
+                        await self._slot_freed.wait()
+                    continue
+
+                job, queue = dequeued
+                name = JobQueue(queue.name)
+                task = asyncio.create_task(self._perform(job, queue))
+                self._running[name].add(task)
+                task.add_done_callback(partial(self._release, name))
+        finally:
+            for task in maintenance:
+                task.cancel()
+            await self._drain()
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "running": {name.value: len(tasks) for name, tasks in self._running.items()},
+            "finished": self.finished,
+            "failed": self.failed,
+        }
+
+    def _dequeue(self, queues: Iterable[Queue], timeout: Optional[int]):
+        try:
+            return Queue.dequeue_any(list(queues), timeout, connection=self.connection)
+        except DequeueTimeout:
+            return None
+
+    async def _perform(self, job: Job, queue: Queue) -> None:
+        execution = await asyncio.to_thread(self._mark_started, job, queue)
+        heartbeat = asyncio.create_task(self._heartbeat(job, execution))
+        try:
+            result = await asyncio.wait_for(self._call(job), job.timeout if job.timeout and job.timeout > 0 else None)
+        except asyncio.CancelledError:
+            heartbeat.cancel()
+            await asyncio.to_thread(self._requeue, job, queue, execution)
+            raise
+        except Exception:
+            heartbeat.cancel()
+            exc_string = traceback.format_exc()
+            logger.warning("Job %s (%s) failed", job.id, job.func_name, exc_info=True)
+            await asyncio.to_thread(self._mark_failed, job, queue, execution, exc_string)
+            self.failed += 1
+        else:
+            heartbeat.cancel()
+            await asyncio.to_thread(self._mark_finished, job, execution, result)
+            self.finished += 1
+
+    async def _heartbeat(self, job: Job, execution: Execution) -> None:
+        """Keep the job's StartedJobRegistry entry alive while it runs."""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                await asyncio.to_thread(self._refresh_execution, job, execution)
+            except Exception:
+                logger.warning("Heartbeat for job %s failed", job.id, exc_info=True)
+
+    @property
+    def _heartbeat_ttl(self) -> int:
+        # Same slack as RQ's worker: an entry outlives one missed heartbeat by a minute
+        return int(self.heartbeat_interval) + 60
+
+    async def _call(self, job: Job):
+        func = job.func
+        if inspect.iscoroutinefunction(func):
+            return await func(*job.args, **job.kwargs)
+        return await asyncio.to_thread(func, *job.args, **job.kwargs)
+
+    def _mark_started(self, job: Job, queue: Queue) -> Execution:
+        with self.connection.pipeline() as pipeline:
+            # Registers the job in StartedJobRegistry until the TTL runs out
+            execution = Execution.create(job, self._heartbeat_ttl, pipeline, worker_name=self.name)
+            job.prepare_for_execution(self.name, pipeline=pipeline)
+            # Single-queue dequeues move the id to RQ's intermediate list
+            pipeline.lrem(queue.intermediate_queue_key, 1, job.id)
+            pipeline.execute()
+        return execution
+
+    def _refresh_execution(self, job: Job, execution: Execution) -> None:
+        with self.connection.pipeline() as pipeline:
+            execution.heartbeat(job.started_job_registry, self._heartbeat_ttl, pipeline)
+            pipeline.execute()
+
+    def _mark_finished(self, job: Job, execution: Execution, result) -> None:
+        job._result = result
+        with self.connection.pipeline() as pipeline:
+            job._handle_success(job.get_result_ttl(DEFAULT_RESULT_TTL), pipeline)
+            execution.delete(job, pipeline)
+            pipeline.execute()
+
+    def _mark_failed(self, job: Job, queue: Queue, execution: Execution, exc_string: str) -> None:
+        with self.connection.pipeline() as pipeline:
+            execution.delete(job, pipeline)
+            if job.retries_left:
+                job.retry(queue, pipeline)
+            else:
+                job.set_status(JobStatus.FAILED, pipeline=pipeline)
+                job._handle_failure(exc_string, pipeline)
+            pipeline.execute()
+
+    def _requeue(self, job: Job, queue: Queue, execution: Execution) -> None:
+        logger.info("Requeueing unfinished job %s on shutdown", job.id)
+        with self.connection.pipeline() as pipeline:
+            execution.delete(job, pipeline)
+            pipeline.execute()
+        queue.enqueue_job(job, at_front=True)
+
+    def _release(self, name: JobQueue, task: asyncio.Task) -> None:
+        self._running[name].discard(task)
+        self._slot_freed.set()
+
+    def _in_flight(self) -> int:
+        return sum(len(tasks) for tasks in self._running.values())
+
+    async def _drain(self) -> None:
+        tasks = [task for running in self._running.values() for task in running]
+        if not tasks:
+            return
+        _, pending = await asyncio.wait(tasks, timeout=self.shutdown_grace)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _clean_registries(self, interval: float) -> None:
+        """Fail or retry jobs whose worker stopped heartbeating, as RQ's worker does."""
+        while True:
+            for queue in self.queues.values():
+                try:
+                    await asyncio.to_thread(clean_registries, queue)
+                except Exception:
+                    logger.warning("Cleaning registries of %s failed", queue.name, exc_info=True)
+            await asyncio.sleep(interval)
+
+    async def _schedule_retries(self, interval: float) -> None:
+        """Move retries scheduled with an interval back onto their queues when due."""
+        scheduler = RQScheduler(list(self.queues.values()), connection=self.connection)
+        try:
+            while True:
+                try:
+                    if await asyncio.to_thread(scheduler.acquire_locks):
+                        await asyncio.to_thread(scheduler.enqueue_scheduled_jobs)
+                except Exception:
+                    logger.warning("Enqueueing scheduled jobs failed", exc_info=True)
+                await asyncio.sleep(interval)
+        finally:
+            scheduler.release_locks()
+
+
+async def serve(connection, burst: bool = False) -> AsyncJobRunner:
+    """Run an AsyncJobRunner sized from settings, sharing one database engine across jobs."""
+    concurrency = {JobQueue(name): limit for name, limit in settings.worker_queue_concurrency.items()}
+    runner = AsyncJobRunner(connection, concurrency)
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, runner.request_stop)
+    use_session_maker(get_session_maker())
+    # Periodic jobs share the loop and engine; all are safe to run in every worker at once
+    periodic = [] if burst else start_periodic_jobs()
+    try:
+        await runner.run(burst=burst)
+    finally:
+        for task in periodic:
+            task.cancel()
+        await asyncio.gather(*periodic, return_exceptions=True)
+        use_session_maker(None)
+        await dispose_engine()
+    return runner
+
+
+def start_periodic_jobs() -> List[asyncio.Task]:
+    """Start the outbox relay, reminders, the expired-booking sweep and the idempotency key purge."""
+    return [
+        asyncio.create_task(get_outbox_relay().run_forever()),
+        asyncio.create_task(get_reminder_scheduler().run_forever()),
+        asyncio.create_task(get_booking_sweeper().run_forever()),
+        asyncio.create_task(run_idempotency_purge()),
+    ]
+
+
+async def serve_periodic() -> None:
+    """Run only the periodic jobs, sharing one database engine, until cancelled."""
+    use_session_maker(get_session_maker())
+    try:
+        await asyncio.gather(*start_periodic_jobs())
+    finally:
+        use_session_maker(None)
+        await dispose_engine()
@@ -0,0 +1,86 @@
+"""
+Pluggable delivery for notifications produced by jobs.
+
+Jobs build Notification records and hand them to the process-wide sender in
+batches. No email/SMS provider is integrated yet; NOTIFICATION_SENDER picks
+one of the local senders:
+    log          - log each notification (default)
+    file:<path>  - append each notification to <path> as a JSON line
+"""
+
+import asyncio
+import json
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from typing import List, Optional, Sequence
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Notification:
+    kind: str
+    booking_id: int
+    subject: str
+    recipients: List[str] = field(default_factory=list)
+
+
+class NotificationSender(ABC):
+    """Delivers a batch of notifications; raising fails the whole batch."""
+
+    @abstractmethod
+    async def send(self, notifications: Sequence[Notification]) -> None:
+        ...
+
+
+class LogSender(NotificationSender):
+    async def send(self, notifications: Sequence[Notification]) -> None:
+        for notification in notifications:
+            logger.info("Notification %s", asdict(notification))
+
+
+class FileSender(NotificationSender):
+    def __init__(self, path: str):
+        self.path = path
+
+    async def send(self, notifications: Sequence[Notification]) -> None:
+        lines = "".join(json.dumps(asdict(notification)) + "\n" for notification in notifications)
+        await asyncio.to_thread(self._append, lines)
+
+    def read(self) -> List[Notification]:
+        """Notifications written so far, oldest first."""
+        try:
+            with open(self.path) as handle:
+                return [Notification(**json.loads(line)) for line in handle if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    def _append(self, lines: str) -> None:
+        with open(self.path, "a") as handle:
+            handle.write(lines)
+
+
+_sender: Optional[NotificationSender] = None
+
+
+def get_sender() -> NotificationSender:
+    """Process-wide sender chosen by NOTIFICATION_SENDER."""
+    global _sender
+    if _sender is None:
+        configured = settings.notification_sender
+        if configured.startswith("file:"):
+            _sender = FileSender(configured[len("file:"):])
+        elif configured == "log":
+            _sender = LogSender()
+        else:
+            raise ValueError(f"Unknown NOTIFICATION_SENDER: {configured}")
+    return _sender
+
+
+def use_sender(sender: Optional[NotificationSender]) -> None:
+    """Send through ``sender`` from now on; None goes back to NOTIFICATION_SENDER."""
+    global _sender
+    _sender = sender
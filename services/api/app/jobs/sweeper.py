@@ -0,0 +1,174 @@
+"""
+Periodic sweep of bookings whose appointment time has passed.
+
+Nothing else moves a booking out of pending/confirmed once its time is over,
+so without the sweep they stay active forever (and keep showing up in every
+conflict check). Each rule below is applied with set-based
+UPDATE ... WHERE id IN (SELECT ... LIMIT n) ... RETURNING statements, one
+committed chunk at a time, oldest first:
+
+    pending, never confirmed          -> cancelled
+    confirmed, session was started    -> completed (in-progress session completed)
+    confirmed, session never started  -> no_show   (scheduled session no_show)
+
+The outer WHERE repeats the source status and Postgres picks the chunk with
+FOR UPDATE SKIP LOCKED, so concurrent sweepers (and a specialist completing a
+booking at the same moment) never move a booking twice. ``grace`` leaves
+specialists time to complete or cancel a booking themselves first. Each swept
+booking gets an outbox event in its chunk's transaction, so the patient is
+notified and the calendar updated as for a manual transition.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import delete, exists, func, or_, select, update
+
+from app.core.config import settings
+from app.jobs.context import job_session
+from app.jobs.definitions import BookingEvent
+from app.models.booking import Booking, BookingStatus
+from app.models.free_busy import BookingBucket
+from app.models.session import Session, SessionStatus
+from app.services.outbox import OutboxService
+from app.services.slot_cache import get_slot_cache
+
+logger = logging.getLogger(__name__)
+
+session_started = exists().where(
+    Session.booking_id == Booking.id,
+    or_(
+        Session.status.in_([SessionStatus.IN_PROGRESS, SessionStatus.COMPLETED]),
+        Session.actual_start_time.is_not(None),
+    ),
+)
+
+
+@dataclass(frozen=True)
+class SweepRule:
+    name: str
+    from_status: BookingStatus
+    to_status: BookingStatus
+    condition: Any = None
+    values: Dict[str, Any] = field(default_factory=dict)
+    # Sessions of swept bookings in ``session_from`` move to ``session_to``
+    session_from: Optional[SessionStatus] = None
+    session_to: Optional[SessionStatus] = None
+
+
+SWEEP_RULES: Tuple[SweepRule, ...] = (
+    SweepRule(
+        "cancelled", BookingStatus.PENDING, BookingStatus.CANCELLED,
+        values={"cancellation_reason": "Expired before it was confirmed"},
+    ),
+    SweepRule(
+        "completed", BookingStatus.CONFIRMED, BookingStatus.COMPLETED, condition=session_started,
+        session_from=SessionStatus.IN_PROGRESS, session_to=SessionStatus.COMPLETED,
+    ),
+    SweepRule(
+        "no_show", BookingStatus.CONFIRMED, BookingStatus.NO_SHOW, condition=~session_started,
+        session_from=SessionStatus.SCHEDULED, session_to=SessionStatus.NO_SHOW,
+    ),
+)
+
+
+class BookingSweeper:
+    def __init__(
+        self,
+        grace: timedelta = timedelta(hours=1),
+        chunk_size: int = 500,
+        interval: timedelta = timedelta(minutes=5),
+    ):
+        self.grace = grace
+        self.chunk_size = chunk_size
+        self.interval = interval
+
+    async def sweep(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Move every booking that ended before ``now - grace``; returns counts per rule plus sessions."""
+        cutoff = (now or datetime.utcnow()) - self.grace
+        counts = {rule.name: 0 for rule in SWEEP_RULES}
+        counts["sessions"] = 0
+        async with job_session() as db:
+            for rule in SWEEP_RULES:
+                while True:
+                    swept, sessions = await self._sweep_chunk(db, rule, cutoff)
+                    counts[rule.name] += swept
+                    counts["sessions"] += sessions
+                    if swept < self.chunk_size:
+                        break
+        if any(counts.values()):
+            logger.info("Swept bookings that ended before %s: %s", cutoff.isoformat(), counts)
+        return counts
+
+    async def run_forever(self) -> None:
+        """Sweep once per interval until cancelled."""
+        while True:
+            try:
+                await self.sweep()
+            except Exception:
+                logger.warning("Booking sweep failed", exc_info=True)
+            await asyncio.sleep(self.interval.total_seconds())
+
+    async def _sweep_chunk(self, db, rule: SweepRule, cutoff: datetime) -> Tuple[int, int]:
+        chunk = (
+            select(Booking.id)
+            .where(Booking.status == rule.from_status, Booking.end_time < cutoff)
+            .order_by(Booking.end_time)
+            .limit(self.chunk_size)
+            .with_for_update(skip_locked=True)
+        )
+        if rule.condition is not None:
+            chunk = chunk.where(rule.condition)
+        swept = (
+            await db.execute(
+                update(Booking)
+                .where(Booking.id.in_(chunk), Booking.status == rule.from_status)
+                .values(status=rule.to_status, **rule.values)
+                .returning(Booking.id, Booking.specialist_id, Booking.start_time, Booking.end_time)
+                .execution_options(synchronize_session=False)
+            )
+        ).all()
+        if not swept:
+            await db.rollback()
+            return 0, 0
+
+        booking_ids = [row.id for row in swept]
+        sessions = 0
+        if rule.session_from is not None:
+            values = {"status": rule.session_to}
+            if rule.session_to == SessionStatus.COMPLETED:
+                booking_end = select(Booking.end_time).where(Booking.id == Session.booking_id).scalar_subquery()
+                values["actual_end_time"] = func.coalesce(Session.actual_end_time, booking_end)
+            result = await db.execute(
+                update(Session)
+                .where(Session.booking_id.in_(booking_ids), Session.status == rule.session_from)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            sessions = result.rowcount
+        # Swept bookings are no longer active: drop their free/busy buckets like transition_booking does
+        await db.execute(delete(BookingBucket).where(BookingBucket.booking_id.in_(booking_ids)))
+        event = BookingEvent(rule.to_status.value)
+        for booking_id in booking_ids:
+            OutboxService.record_booking_event(db, booking_id, event)
+        await db.commit()
+
+        dates: Dict[int, set] = defaultdict(set)
+        for row in swept:
+            dates[row.specialist_id].update({row.start_time.date(), row.end_time.date()})
+        for specialist_id, specialist_dates in dates.items():
+            await get_slot_cache().invalidate_dates(specialist_id, specialist_dates)
+        return len(swept), sessions
+
+
+def get_booking_sweeper() -> BookingSweeper:
+    """Sweeper sized from settings."""
+    return BookingSweeper(
+        grace=timedelta(seconds=settings.booking_sweep_grace_seconds),
+        chunk_size=settings.booking_sweep_chunk_size,
+        interval=timedelta(seconds=settings.booking_sweep_interval_seconds),
+    )
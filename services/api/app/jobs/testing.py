@@ -0,0 +1,63 @@
+"""
+Run queued jobs synchronously against fakeredis, for tests.
+
+Jobs go through the real outbox relay and RQ serialization into an in-memory
+Redis; ``run_all`` then pops them in queue priority order and awaits each one
+on the caller's event loop, with the caller's database session factory.
+"""
+
+from typing import List, Tuple
+
+import fakeredis
+from rq.job import Job
+
+from app.jobs.context import use_session_maker
+from app.jobs.definitions import JobQueue
+from app.jobs.outbox import OutboxRelay
+from app.jobs.queue import get_queues, use_job_connection
+
+
+class JobHarness:
+    def __init__(self, session_maker):
+        self.connection = fakeredis.FakeStrictRedis()
+        self.queues = get_queues(self.connection)
+        self.session_maker = session_maker
+
+    def __enter__(self) -> "JobHarness":
+        use_job_connection(self.connection)
+        use_session_maker(self.session_maker)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        use_job_connection(None)
+        use_session_maker(None)
+
+    async def relay(self) -> int:
+        """Publish every pending outbox event to the queues; returns how many were published."""
+        relay, published = OutboxRelay(), 0
+        while True:
+            batch = await relay.relay()
+            published += batch
+            if batch < relay.batch_size:
+                return published
+
+    def queued(self) -> List[Job]:
+        """Jobs waiting on every queue, highest priority first."""
+        return [job for queue in self.queues.values() for job in queue.jobs]
+
+    async def run_all(self) -> List[Tuple[str, dict, object]]:
+        """Run queued jobs (including any they enqueue) until every queue is empty.
+
+        Returns (function path, kwargs, result) for each job, in execution order.
+        """
+        await self.relay()
+        ran = []
+        while True:
+            job = next((job for queue in self.queues.values() for job in queue.get_jobs(0, 1)), None)
+            if job is None:
+                return ran
+            self.queues[JobQueue(job.origin)].remove(job)
+            result = job.func(*job.args, **job.kwargs)
+            if hasattr(result, "__await__"):
+                result = await result
+            ran.append((job.func_name, job.kwargs, result))
@@ -3,25 +3,47 @@ Minimal FastAPI application for GroundedCounselling API.
 This is a placeholder implementation for Docker testing.
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
-from app.db.session import get_session
+from app.db.session import get_session, init_engine, dispose_engine
 from app.routers import auth as auth_router
 from app.routers import specialists as specialists_router
 from app.routers import bookings as bookings_router
 from app.routers import sessions as sessions_router
 from app.routers import availability as availability_router
+from app.security.password import get_password_hasher, shutdown_password_hasher
+from app.services.outbox import OutboxService
+from app.services.principal_cache import get_principal_cache
+from app.services.slot_cache import get_slot_cache
 from fastapi.middleware.cors import CORSMiddleware
 import os
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the database engine, password pool and cache listeners on startup; release them on shutdown."""
+    init_engine()
+    get_password_hasher()
+    get_principal_cache().start_listener()
+    get_slot_cache().start_listener()
+    yield
+    await get_slot_cache().stop_listener()
+    await get_principal_cache().stop_listener()
+    shutdown_password_hasher()
+    await dispose_engine()
+
+
 app = FastAPI(
     title="GroundedCounselling API",
     description="A secure, HIPAA-compliant platform for counselling practice management",
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -54,6 +76,16 @@ async def api_health(session: AsyncSession = Depends(get_session)):
         "environment": os.getenv("NODE_ENV", "development"),
     }
 
+@app.get("/api/v1/metrics")
+async def metrics(session: AsyncSession = Depends(get_session)):
+    """In-process cache and password pool counters, plus the outbox relay backlog"""
+    return {
+        "slot_cache": get_slot_cache().stats(),
+        "principal_cache": get_principal_cache().stats(),
+        "password_pool": get_password_hasher().stats(),
+        "outbox": await OutboxService.backlog(session),
+    }
+
 app.include_router(auth_router.router)
 app.include_router(specialists_router.router, prefix="/api/v1")
 app.include_router(bookings_router.router, prefix="/api/v1")
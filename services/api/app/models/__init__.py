@@ -1,16 +1,27 @@
 from .user import User
 from .specialist import Specialist
 from .booking import Booking, BookingStatus
+from .booking_series import BookingSeries
+from .booking_reminder import BookingReminder
 from .session import Session, SessionStatus
 from .availability import Availability, DayOfWeek
+from .free_busy import AvailabilityBucket, BookingBucket
+from .outbox import OutboxEvent
+from .idempotency_key import IdempotencyKey
 
 __all__ = [
     "User",
     "Specialist", 
     "Booking",
     "BookingStatus",
+    "BookingSeries",
+    "BookingReminder",
     "Session",
     "SessionStatus",
     "Availability",
     "DayOfWeek",
+    "AvailabilityBucket",
+    "BookingBucket",
+    "OutboxEvent",
+    "IdempotencyKey",
 ]
@@ -1,8 +1,8 @@
 from datetime import datetime, time
 from enum import Enum
 from typing import TYPE_CHECKING
-from sqlalchemy import String, DateTime, ForeignKey, Time, Boolean, Integer
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, DateTime, ForeignKey, Time, Boolean, Integer, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship, synonym
 
 from app.db.base import Base
 
@@ -22,6 +22,9 @@ class DayOfWeek(str, Enum):
 
 class Availability(Base):
     __tablename__ = "availabilities"
+    __table_args__ = (
+        Index("ix_availabilities_specialist_id_day_of_week_start_time", "specialist_id", "day_of_week", "start_time"),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True)
     specialist_id: Mapped[int] = mapped_column(ForeignKey("specialists.id"))
@@ -29,6 +32,8 @@ class Availability(Base):
     start_time: Mapped[time] = mapped_column(Time)
     end_time: Mapped[time] = mapped_column(Time)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    # Schemas and services refer to the flag as ``is_available``
+    is_available: Mapped[bool] = synonym("is_active")
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
@@ -1,7 +1,7 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
-from sqlalchemy import String, DateTime, Integer, ForeignKey, Text
+from sqlalchemy import String, DateTime, Integer, ForeignKey, Text, Index, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     from app.models.user import User
     from app.models.specialist import Specialist
     from app.models.session import Session
+    from app.models.booking_series import BookingSeries
 
 
 class BookingStatus(str, Enum):
@@ -20,17 +21,39 @@ class BookingStatus(str, Enum):
     NO_SHOW = "no_show"
 
 
+DEFAULT_DURATION_MINUTES = 60
+
+
 class Booking(Base):
     __tablename__ = "bookings"
+    __table_args__ = (
+        # Overlap checks seek on (specialist_id, end_time > :start) and filter start_time
+        Index("ix_bookings_specialist_id_end_time", "specialist_id", "end_time"),
+        # Keyset pagination seeks on (start_time, id) within a patient or specialist
+        Index("ix_bookings_patient_id_start_time_id", "patient_id", "start_time", "id"),
+        Index("ix_bookings_specialist_id_start_time_id", "specialist_id", "start_time", "id"),
+        # Status-filtered lists and slot/range lookups
+        Index("ix_bookings_patient_id_status_start_time", "patient_id", "status", "start_time"),
+        Index("ix_bookings_specialist_id_status_start_time", "specialist_id", "status", "start_time"),
+        # Reminder scheduling scans every specialist's confirmed bookings by start time
+        Index("ix_bookings_status_start_time", "status", "start_time"),
+        # The expired-booking sweep seeks on (status, end_time < cutoff)
+        Index("ix_bookings_status_end_time", "status", "end_time"),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True)
     patient_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
     specialist_id: Mapped[int] = mapped_column(ForeignKey("specialists.id"))
     start_time: Mapped[datetime] = mapped_column(DateTime)
-    duration_minutes: Mapped[int] = mapped_column(Integer, default=60)
+    duration_minutes: Mapped[int] = mapped_column(Integer, default=DEFAULT_DURATION_MINUTES)
+    # Denormalised start_time + duration_minutes, maintained on flush
+    end_time: Mapped[datetime] = mapped_column(DateTime)
     status: Mapped[BookingStatus] = mapped_column(String(20), default=BookingStatus.PENDING)
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     cancellation_reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    series_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("booking_series.id"), nullable=True, index=True
+    )
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
@@ -39,4 +62,13 @@ class Booking(Base):
     # Relationships
     patient: Mapped["User"] = relationship("User", back_populates="patient_bookings", foreign_keys=[patient_id])
     specialist: Mapped["Specialist"] = relationship("Specialist", back_populates="bookings")
-    session: Mapped[Optional["Session"]] = relationship("Session", back_populates="booking", uselist=False)
\ No newline at end of file
+    session: Mapped[Optional["Session"]] = relationship("Session", back_populates="booking", uselist=False)
+    series: Mapped[Optional["BookingSeries"]] = relationship("BookingSeries", back_populates="bookings")
+
+
+@event.listens_for(Booking, "before_insert")
+@event.listens_for(Booking, "before_update")
+def _set_end_time(mapper, connection, target: Booking) -> None:
+    if target.duration_minutes is None:
+        target.duration_minutes = DEFAULT_DURATION_MINUTES
+    target.end_time = target.start_time + timedelta(minutes=target.duration_minutes)
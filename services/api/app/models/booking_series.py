@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Optional
+from sqlalchemy import DateTime, Integer, ForeignKey, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.base import Base
+
+if TYPE_CHECKING:
+    from app.models.booking import Booking
+
+
+class BookingSeries(Base):
+    """A recurring booking: ``occurrences`` bookings every ``interval_weeks`` weeks."""
+    __tablename__ = "booking_series"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    patient_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
+    specialist_id: Mapped[int] = mapped_column(ForeignKey("specialists.id"), index=True)
+    start_time: Mapped[datetime] = mapped_column(DateTime)
+    duration_minutes: Mapped[int] = mapped_column(Integer)
+    interval_weeks: Mapped[int] = mapped_column(Integer, default=1)
+    occurrences: Mapped[int] = mapped_column(Integer)
+    notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    # Relationships
+    bookings: Mapped[List["Booking"]] = relationship(
+        "Booking", back_populates="series", order_by="Booking.start_time"
+    )
@@ -0,0 +1,30 @@
+from datetime import date
+from sqlalchemy import String, Date, Integer, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class AvailabilityBucket(Base):
+    """A 15-minute bucket of a specialist's weekly availability (minutes since midnight)."""
+    __tablename__ = "availability_buckets"
+    __table_args__ = (
+        Index("ix_availability_buckets_day_of_week_bucket", "day_of_week", "bucket"),
+    )
+
+    specialist_id: Mapped[int] = mapped_column(ForeignKey("specialists.id"), primary_key=True)
+    day_of_week: Mapped[str] = mapped_column(String(10), primary_key=True)
+    bucket: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+
+class BookingBucket(Base):
+    """A 15-minute bucket on a calendar date occupied by an active booking."""
+    __tablename__ = "booking_buckets"
+    __table_args__ = (
+        Index("ix_booking_buckets_specialist_id_slot_date", "specialist_id", "slot_date", "bucket"),
+    )
+
+    booking_id: Mapped[int] = mapped_column(ForeignKey("bookings.id"), primary_key=True)
+    slot_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    bucket: Mapped[int] = mapped_column(Integer, primary_key=True)
+    specialist_id: Mapped[int] = mapped_column(ForeignKey("specialists.id"))
@@ -0,0 +1,32 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import DateTime, Index, Integer, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class OutboxEvent(Base):
+    """A domain event written in the same transaction as the change it describes.
+
+    The outbox relay publishes unpublished rows to the job queues and stamps
+    ``published_at``; published rows are purged after the retention period.
+    """
+    __tablename__ = "outbox"
+    __table_args__ = (
+        # The relay seeks the oldest unpublished rows; published rows never enter this index
+        Index(
+            "ix_outbox_pending_id", "id",
+            postgresql_where=text("published_at IS NULL"),
+            sqlite_where=text("published_at IS NULL"),
+        ),
+        # Retention purge deletes by publish time
+        Index("ix_outbox_published_at", "published_at"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    aggregate: Mapped[str] = mapped_column(String(20))
+    aggregate_id: Mapped[int] = mapped_column(Integer)
+    event: Mapped[str] = mapped_column(String(30))
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    published_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
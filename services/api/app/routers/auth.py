@@ -1,11 +1,24 @@
+from typing import Union
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.db.session import get_session
+from app.core.config import settings
+from app.models.specialist import Specialist
 from app.models.user import User
+from app.schemas.auth import RefreshRequest, TokenResponse
 from app.schemas.user import UserCreate, UserOut
-from app.security.password import hash_password, verify_password
+from app.security.password import PasswordPoolSaturated, get_password_hasher
+from app.security.tokens import (
+    Principal,
+    TokenError,
+    create_access_token,
+    create_refresh_token,
+    decode_refresh_token,
+)
+from app.services.principal_cache import load_principal
 
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -16,16 +29,70 @@ async def register(payload: UserCreate, session: AsyncSession = Depends(get_sess
     existing = await session.scalar(select(User).where(User.email == payload.email))
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
-    user = User(email=payload.email, password_hash=hash_password(payload.password))
+    user = User(
+        email=payload.email,
+        password_hash=await _password_work(get_password_hasher().hash(payload.password)),
+    )
     session.add(user)
     await session.commit()
     await session.refresh(user)
     return user
 
 
-@router.post("/login", response_model=UserOut)
+@router.post("/login", response_model=TokenResponse)
 async def login(payload: UserCreate, session: AsyncSession = Depends(get_session)):
-    user = await session.scalar(select(User).where(User.email == payload.email))
-    if not user or not verify_password(payload.password, user.password_hash):
+    row = (await session.execute(_user_with_specialist_id(User.email == payload.email))).one_or_none()
+    if not row:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
-    return user
+    verified, new_hash = await _password_work(
+        get_password_hasher().verify_and_update(payload.password, row.User.password_hash)
+    )
+    if not verified:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    if new_hash:
+        # Hash was below the current cost policy; upgrade it while we have the plaintext
+        row.User.password_hash = new_hash
+        await session.commit()
+    return _issue_tokens(row.User, row.specialist_id)
+
+
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh(payload: RefreshRequest, session: AsyncSession = Depends(get_session)):
+    """Exchange a refresh token for new tokens carrying the user's current role."""
+    try:
+        user_id = decode_refresh_token(payload.refresh_token)
+    except TokenError:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token")
+    cached = await load_principal(session, user_id)
+    if not cached:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token")
+    return _issue_tokens(cached.user, cached.principal.specialist_id)
+
+
+async def _password_work(operation):
+    try:
+        return await operation
+    except PasswordPoolSaturated as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        )
+
+
+def _user_with_specialist_id(condition):
+    return (
+        select(User, Specialist.id.label("specialist_id"))
+        .outerjoin(Specialist, Specialist.user_id == User.id)
+        .where(condition)
+    )
+
+
+def _issue_tokens(user: Union[User, UserOut], specialist_id) -> TokenResponse:
+    principal = Principal(id=user.id, role=user.role, specialist_id=specialist_id)
+    return TokenResponse(
+        access_token=create_access_token(principal),
+        refresh_token=create_refresh_token(user.id),
+        expires_in=settings.access_token_expires_min * 60,
+        user=UserOut.model_validate(user),
+    )
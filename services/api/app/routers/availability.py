@@ -2,30 +2,32 @@
 Availability API endpoints.
 """
 
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 from uuid import UUID
 from datetime import date, datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_session
-from app.models.specialist import Specialist
+from app.routers.idempotency import IdempotentRoute
 from app.models.availability import DayOfWeek
 from app.schemas.availability import (
     AvailabilityCreate, AvailabilityUpdate, AvailabilityOut,
-    BulkAvailabilityCreate, AvailableSlot
+    BulkAvailabilityCreate, AvailableSlot, DaySlots
 )
 from app.services.availability import AvailabilityService
 from app.security.auth import get_current_specialist
+from app.security.tokens import SpecialistPrincipal
 
 
-router = APIRouter(prefix="/availability", tags=["availability"])
+router = APIRouter(prefix="/availability", tags=["availability"], route_class=IdempotentRoute)
 
 
 @router.post("", response_model=AvailabilityOut, status_code=status.HTTP_201_CREATED)
 async def create_availability(
     availability_data: AvailabilityCreate,
-    current_specialist: Specialist = Depends(get_current_specialist),
+    current_specialist: SpecialistPrincipal = Depends(get_current_specialist),
     session: AsyncSession = Depends(get_session),
 ):
     """Create an availability slot for the current specialist."""
@@ -41,7 +43,7 @@ async def create_availability(
 @router.post("/bulk", response_model=List[AvailabilityOut], status_code=status.HTTP_201_CREATED)
 async def create_bulk_availability(
     bulk_data: BulkAvailabilityCreate,
-    current_specialist: Specialist = Depends(get_current_specialist),
+    current_specialist: SpecialistPrincipal = Depends(get_current_specialist),
     session: AsyncSession = Depends(get_session),
 ):
     """Create multiple availability slots at once."""
@@ -58,7 +60,7 @@ async def create_bulk_availability(
 async def get_my_availability(
     day_of_week: Optional[DayOfWeek] = Query(None),
     is_available: Optional[bool] = Query(None),
-    current_specialist: Specialist = Depends(get_current_specialist),
+    current_specialist: SpecialistPrincipal = Depends(get_current_specialist),
     session: AsyncSession = Depends(get_session),
 ):
     """Get availability slots for the current specialist."""
@@ -113,10 +115,56 @@ async def get_available_slots(
         )
 
 
+@router.get(
+    "/specialist/{specialist_id}/slots/range",
+    response_class=StreamingResponse,
+    responses={200: {"model": List[DaySlots], "description": "Slots grouped by day"}},
+)
+async def get_available_slots_range(
+    specialist_id: int,
+    start_date: date = Query(...),
+    end_date: date = Query(...),
+    duration_minutes: int = Query(60, ge=15, le=480),
+    session: AsyncSession = Depends(get_session),
+):
+    """Get available time slots grouped by day for a bounded date range."""
+    try:
+        days = await AvailabilityService.get_available_slots_range(
+            session, specialist_id, start_date, end_date, duration_minutes
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return StreamingResponse(
+        _stream_day_slots(days, duration_minutes), media_type="application/json"
+    )
+
+
+def _stream_day_slots(
+    days: Iterator[Tuple[date, List[datetime]]], duration_minutes: int
+) -> Iterator[str]:
+    """Serialize days as a JSON array one element at a time."""
+    yield "["
+    for index, (day, slots) in enumerate(days):
+        day_slots = DaySlots(
+            date=day,
+            slots=[
+                AvailableSlot(
+                    start_time=slot,
+                    end_time=slot + timedelta(minutes=duration_minutes),
+                    duration_minutes=duration_minutes
+                )
+                for slot in slots
+            ],
+        )
+        yield ("," if index else "") + day_slots.model_dump_json()
+    yield "]"
+
+
 @router.get("/{availability_id}", response_model=AvailabilityOut)
 async def get_availability(
     availability_id: UUID,
-    current_specialist: Specialist = Depends(get_current_specialist),
+    current_specialist: SpecialistPrincipal = Depends(get_current_specialist),
     session: AsyncSession = Depends(get_session),
 ):
     """Get availability slot by ID (only for current specialist)."""
@@ -140,7 +188,7 @@ async def get_availability(
 async def update_availability(
     availability_id: UUID,
     availability_data: AvailabilityUpdate,
-    current_specialist: Specialist = Depends(get_current_specialist),
+    current_specialist: SpecialistPrincipal = Depends(get_current_specialist),
     session: AsyncSession = Depends(get_session),
 ):
     """Update availability slot (only for current specialist)."""
@@ -169,7 +217,7 @@ async def update_availability(
 @router.delete("/{availability_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_availability(
     availability_id: UUID,
-    current_specialist: Specialist = Depends(get_current_specialist),
+    current_specialist: SpecialistPrincipal = Depends(get_current_specialist),
     session: AsyncSession = Depends(get_session),
 ):
     """Delete availability slot (only for current specialist)."""
@@ -191,7 +239,7 @@ async def delete_availability(
 
 @router.delete("/me/all", status_code=status.HTTP_204_NO_CONTENT)
 async def clear_my_availability(
-    current_specialist: Specialist = Depends(get_current_specialist),
+    current_specialist: SpecialistPrincipal = Depends(get_current_specialist),
     session: AsyncSession = Depends(get_session),
 ):
     """Clear all availability slots for the current specialist."""
@@ -2,28 +2,39 @@
 Booking API endpoints.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Union
 from uuid import UUID
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_session
-from app.models.user import User
-from app.models.specialist import Specialist
+from app.routers.idempotency import IdempotentRoute
 from app.models.booking import BookingStatus
-from app.schemas.booking import BookingCreate, BookingUpdate, BookingOut
+from app.schemas.booking import (
+    BookingCreate,
+    BookingUpdate,
+    BookingOut,
+    BookingSummary,
+    BookingSeriesCreate,
+    BookingSeriesUpdate,
+    BookingSeriesOut,
+)
 from app.services.booking import BookingService
+from app.services.booking_series import BookingSeriesService
+from app.services.pagination import set_next_cursor
+from app.security.access import AccessRole, require_booking_access
 from app.security.auth import get_current_user, get_current_specialist
+from app.security.tokens import Principal, SpecialistPrincipal
 
 
-router = APIRouter(prefix="/bookings", tags=["bookings"])
+router = APIRouter(prefix="/bookings", tags=["bookings"], route_class=IdempotentRoute)
 
 
 @router.post("", response_model=BookingOut, status_code=status.HTTP_201_CREATED)
 async def create_booking(
     booking_data: BookingCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
     """Create a new booking as a patient."""
@@ -36,89 +47,170 @@ async def create_booking(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.get("/my-bookings", response_model=List[BookingOut])
+@router.post("/series", response_model=BookingSeriesOut, status_code=status.HTTP_201_CREATED)
+async def create_booking_series(
+    series_data: BookingSeriesCreate,
+    current_user: Principal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+):
+    """Create a recurring booking series as a patient."""
+    try:
+        series, skipped = await BookingSeriesService.create_series(
+            session, series_data, current_user.id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return BookingSeriesOut.model_validate(series).model_copy(update={"skipped": skipped})
+
+
+@router.get("/series/{series_id}", response_model=BookingSeriesOut)
+async def get_booking_series(
+    series_id: int,
+    current_user: Principal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+):
+    """Get a booking series with its bookings (patient or specialist only)."""
+    series = await BookingSeriesService.get_series(session, series_id)
+    if not series:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Booking series not found"
+        )
+    if not await BookingSeriesService.is_participant(session, series, current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
+    return series
+
+
+@router.put("/series/{series_id}", response_model=List[BookingOut])
+async def update_booking_series(
+    series_id: int,
+    series_data: BookingSeriesUpdate,
+    current_user: Principal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+):
+    """Update every upcoming booking of a series (only by the patient)."""
+    series = await BookingSeriesService.get_series(session, series_id)
+    if not series:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Booking series not found"
+        )
+    if series.patient_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only the patient can update booking details"
+        )
+    try:
+        return await BookingSeriesService.update_series(session, series_id, series_data)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.patch("/series/{series_id}/cancel", response_model=List[BookingOut])
+async def cancel_booking_series(
+    series_id: int,
+    current_user: Principal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+):
+    """Cancel every upcoming booking of a series (by patient or specialist)."""
+    try:
+        cancelled = await BookingSeriesService.cancel_series(
+            session, series_id, actor_user_id=current_user.id
+        )
+    except PermissionError:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
+    if cancelled is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Booking series not found"
+        )
+    return cancelled
+
+
+@router.get("/my-bookings", response_model=List[Union[BookingSummary, BookingOut]])
 async def get_my_bookings(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     status_filter: Optional[BookingStatus] = Query(None, alias="status"),
-    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from X-Next-Cursor; overrides skip"),
+    include: Optional[str] = Query(None, pattern="^notes$", description="Set to 'notes' to include note columns"),
+    current_user: Principal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
     """Get current user's bookings as a patient."""
-    bookings = await BookingService.get_bookings_for_patient(
-        session, current_user.id, skip=skip, limit=limit, status=status_filter
-    )
-    return bookings
+    try:
+        bookings = await BookingService.get_bookings_for_patient(
+            session, current_user.id, skip=skip, limit=limit, status=status_filter, cursor=cursor,
+            include_notes=include == "notes"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    set_next_cursor(response, bookings, limit, "start_time")
+    schema = BookingOut if include == "notes" else BookingSummary
+    return [schema.model_validate(booking) for booking in bookings]
 
 
-@router.get("/specialist-bookings", response_model=List[BookingOut])
+@router.get("/specialist-bookings", response_model=List[Union[BookingSummary, BookingOut]])
 async def get_specialist_bookings(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     status_filter: Optional[BookingStatus] = Query(None, alias="status"),
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
-    current_specialist: Specialist = Depends(get_current_specialist),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from X-Next-Cursor; overrides skip"),
+    include: Optional[str] = Query(None, pattern="^notes$", description="Set to 'notes' to include note columns"),
+    current_specialist: SpecialistPrincipal = Depends(get_current_specialist),
     session: AsyncSession = Depends(get_session),
 ):
     """Get bookings for the current specialist."""
-    bookings = await BookingService.get_bookings_for_specialist(
-        session, current_specialist.id, skip=skip, limit=limit,
-        status=status_filter, start_date=start_date, end_date=end_date
-    )
-    return bookings
+    try:
+        bookings = await BookingService.get_bookings_for_specialist(
+            session, current_specialist.id, skip=skip, limit=limit,
+            status=status_filter, start_date=start_date, end_date=end_date, cursor=cursor,
+            include_notes=include == "notes"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    set_next_cursor(response, bookings, limit, "start_time")
+    schema = BookingOut if include == "notes" else BookingSummary
+    return [schema.model_validate(booking) for booking in bookings]
 
 
 @router.get("/{booking_id}", response_model=BookingOut)
 async def get_booking(
     booking_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
     """Get booking by ID (only if user is patient or specialist for this booking)."""
-    booking = await BookingService.get_booking(session, booking_id)
-    if not booking:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Booking not found"
-        )
-    
-    # Check if user has access to this booking
-    if (booking.patient_id != current_user.id and 
-        booking.specialist.user_id != current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied"
-        )
-    
-    return booking
+    access = await require_booking_access(session, booking_id, current_user)
+    return access.booking
 
 
 @router.put("/{booking_id}", response_model=BookingOut)
 async def update_booking(
     booking_id: UUID,
     booking_data: BookingUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
     """Update booking (only by patient who created it)."""
-    booking = await BookingService.get_booking(session, booking_id)
-    if not booking:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Booking not found"
-        )
-    
-    # Only patient can update booking details
-    if booking.patient_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only the patient can update booking details"
-        )
+    access = await require_booking_access(
+        session, booking_id, current_user, AccessRole.PATIENT,
+        detail="Only the patient can update booking details",
+    )
     
     try:
         updated_booking = await BookingService.update_booking(
-            session, booking_id, booking_data
+            session, access.booking.id, booking_data
         )
         return updated_booking
     except ValueError as e:
@@ -128,83 +220,76 @@ async def update_booking(
 @router.patch("/{booking_id}/cancel", response_model=BookingOut)
 async def cancel_booking(
     booking_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
     """Cancel a booking (by patient or specialist)."""
-    booking = await BookingService.get_booking(session, booking_id)
-    if not booking:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Booking not found"
+    try:
+        cancelled_booking = await BookingService.cancel_booking(
+            session, booking_id, actor_user_id=current_user.id
         )
-    
-    # Check if user has permission to cancel
-    if (booking.patient_id != current_user.id and 
-        booking.specialist.user_id != current_user.id):
+    except PermissionError:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied"
         )
-    
-    try:
-        cancelled_booking = await BookingService.cancel_booking(session, booking_id)
-        return cancelled_booking
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if not cancelled_booking:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Booking not found"
+        )
+    return cancelled_booking
 
 
 @router.patch("/{booking_id}/confirm", response_model=BookingOut)
 async def confirm_booking(
     booking_id: UUID,
-    current_specialist: Specialist = Depends(get_current_specialist),
+    current_specialist: SpecialistPrincipal = Depends(get_current_specialist),
     session: AsyncSession = Depends(get_session),
 ):
     """Confirm a pending booking (only by specialist)."""
-    booking = await BookingService.get_booking(session, booking_id)
-    if not booking:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Booking not found"
+    try:
+        confirmed_booking = await BookingService.confirm_booking(
+            session, booking_id, actor_specialist_id=current_specialist.id
         )
-    
-    # Only the specialist for this booking can confirm
-    if booking.specialist_id != current_specialist.id:
+    except PermissionError:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only the specialist can confirm this booking"
         )
-    
-    try:
-        confirmed_booking = await BookingService.confirm_booking(session, booking_id)
-        return confirmed_booking
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if not confirmed_booking:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Booking not found"
+        )
+    return confirmed_booking
 
 
 @router.patch("/{booking_id}/complete", response_model=BookingOut)
 async def complete_booking(
     booking_id: UUID,
-    current_specialist: Specialist = Depends(get_current_specialist),
+    current_specialist: SpecialistPrincipal = Depends(get_current_specialist),
     session: AsyncSession = Depends(get_session),
 ):
     """Mark a booking as completed (only by specialist)."""
-    booking = await BookingService.get_booking(session, booking_id)
-    if not booking:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Booking not found"
+    try:
+        completed_booking = await BookingService.complete_booking(
+            session, booking_id, actor_specialist_id=current_specialist.id
         )
-    
-    # Only the specialist for this booking can complete
-    if booking.specialist_id != current_specialist.id:
+    except PermissionError:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only the specialist can complete this booking"
         )
-    
-    try:
-        completed_booking = await BookingService.complete_booking(session, booking_id)
-        return completed_booking
     except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if not completed_booking:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Booking not found"
+        )
+    return completed_booking
\ No newline at end of file
@@ -0,0 +1,166 @@
+"""
+Idempotency-Key support for mutating endpoints.
+
+Routers opt in with ``APIRouter(route_class=IdempotentRoute)``. A POST, PUT,
+PATCH or DELETE carrying an ``Idempotency-Key`` header from an authenticated
+user first claims the key (see IdempotencyService), then runs as usual, and
+its response (including 4xx errors) is stored for IDEMPOTENCY_TTL_SECONDS.
+A retry with the same key gets the stored response back, marked with
+``Idempotent-Replayed: true``, without running the endpoint again. A
+duplicate that arrives while the first request is still running waits for it
+(up to IDEMPOTENCY_WAIT_SECONDS, then 409). Reusing a key for a different
+method, path or body is a 422. 5xx errors and unexpected exceptions release
+the key so the retry runs for real.
+
+Only status, content type and body are replayed; headers set by the
+endpoint are not.
+"""
+
+import asyncio
+import hashlib
+import time
+from contextlib import asynccontextmanager
+from typing import Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+from app.core.config import settings
+from app.db.session import get_session
+from app.security.tokens import TokenError, decode_access_token
+from app.services.idempotency import IdempotencyService
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+IDEMPOTENT_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+MAX_KEY_LENGTH = 255
+
+# Requests in flight in this process, so a local duplicate wakes as soon as the first one finishes
+_inflight: Dict[Tuple[int, str], asyncio.Event] = {}
+
+
+class IdempotentRoute(APIRoute):
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def route(request: Request) -> Response:
+            key = request.headers.get(IDEMPOTENCY_HEADER)
+            user_id = _user_id(request)
+            if key is None or user_id is None or request.method not in IDEMPOTENT_METHODS:
+                return await handler(request)
+            if not key or len(key) > MAX_KEY_LENGTH:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"{IDEMPOTENCY_HEADER} must be 1-{MAX_KEY_LENGTH} characters",
+                )
+            fingerprint = await _fingerprint(request)
+            async with _session(request) as db:
+                claim_id = await _claim_or_replay(db, user_id, key, fingerprint)
+                if isinstance(claim_id, Response):
+                    return claim_id
+                return await _run_claimed(db, handler, request, (user_id, key), claim_id)
+
+        return route
+
+
+async def _claim_or_replay(db, user_id: int, key: str, fingerprint: str):
+    """Claim the key (returns its id) or wait for the request holding it (returns its stored Response)."""
+    deadline = time.monotonic() + settings.idempotency_wait_seconds
+    delay = 0.05
+    while True:
+        claim_id = await IdempotencyService.claim(db, user_id, key, fingerprint)
+        if claim_id is not None:
+            return claim_id
+        record = await IdempotencyService.get(db, user_id, key)
+        reused = record is not None and record.fingerprint != fingerprint
+        replay = None
+        if record is not None and not reused and record.status_code is not None:
+            replay = Response(
+                content=record.body,
+                status_code=record.status_code,
+                media_type=record.content_type,
+                headers={REPLAYED_HEADER: "true"},
+            )
+        # End the read so the next poll sees the other request's commit (and SQLite's lock is released)
+        await db.rollback()
+        if reused:
+            raise HTTPException(
+                status_code=422,
+                detail=f"{IDEMPOTENCY_HEADER} was already used for a different request",
+            )
+        if replay is not None:
+            return replay
+        if time.monotonic() >= deadline:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"A request with this {IDEMPOTENCY_HEADER} is still in progress",
+            )
+        # The holder may have released the key (then we claim it) or still be running
+        inflight = _inflight.get((user_id, key))
+        try:
+            if inflight is not None:
+                await asyncio.wait_for(inflight.wait(), timeout=delay)
+            else:
+                await asyncio.sleep(delay)
+        except TimeoutError:
+            pass
+        delay = min(delay * 2, 0.5)
+
+
+async def _run_claimed(db, handler, request: Request, inflight_key: Tuple[int, str], claim_id: int) -> Response:
+    done = _inflight[inflight_key] = asyncio.Event()
+    stored = False
+    try:
+        try:
+            response = await handler(request)
+        except HTTPException as exc:
+            if exc.status_code < 500:
+                body = bytes(JSONResponse(jsonable_encoder({"detail": exc.detail})).body)
+                await IdempotencyService.complete(db, claim_id, exc.status_code, "application/json", body)
+                stored = True
+            raise
+        # Streaming responses have no body to store
+        if response.status_code < 500 and hasattr(response, "body"):
+            await IdempotencyService.complete(
+                db, claim_id, response.status_code, response.headers.get("content-type"), response.body
+            )
+            stored = True
+        return response
+    finally:
+        if not stored:
+            await db.rollback()
+            await IdempotencyService.release(db, claim_id)
+        _inflight.pop(inflight_key, None)
+        done.set()
+
+
+def _user_id(request: Request) -> Optional[int]:
+    """The bearer token's user id; None lets the endpoint itself answer 401."""
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return decode_access_token(token).id
+    except TokenError:
+        return None
+
+
+async def _fingerprint(request: Request) -> str:
+    digest = hashlib.sha256()
+    for part in (request.method, request.url.path, request.url.query):
+        digest.update(part.encode() + b"\0")
+    digest.update(await request.body())
+    return digest.hexdigest()
+
+
+@asynccontextmanager
+async def _session(request: Request):
+    """A database session from get_session, honouring dependency overrides like the endpoint does."""
+    provider = request.app.dependency_overrides.get(get_session, get_session)
+    sessions = provider()
+    try:
+        yield await sessions.__anext__()
+    finally:
+        await sessions.aclose()
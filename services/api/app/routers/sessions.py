@@ -2,163 +2,135 @@
 Session API endpoints.
 """
 
-from typing import List
+from typing import List, Optional, Union
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_session
-from app.models.user import User
-from app.models.specialist import Specialist
-from app.schemas.session import SessionCreate, SessionUpdate, SessionOut
+from app.routers.idempotency import IdempotentRoute
+from app.schemas.session import SessionCreate, SessionUpdate, SessionOut, SessionSummary
 from app.services.session import SessionService
-from app.services.booking import BookingService
+from app.services.pagination import set_next_cursor
+from app.security.access import AccessRole, require_booking_access, require_session_access
 from app.security.auth import get_current_user, get_current_specialist
+from app.security.tokens import Principal, SpecialistPrincipal
 
 
-router = APIRouter(prefix="/sessions", tags=["sessions"])
+router = APIRouter(prefix="/sessions", tags=["sessions"], route_class=IdempotentRoute)
 
 
 @router.post("", response_model=SessionOut, status_code=status.HTTP_201_CREATED)
 async def create_session(
     session_data: SessionCreate,
     booking_id: UUID,
-    current_specialist: Specialist = Depends(get_current_specialist),
+    current_user: Principal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
     """Create a session for a booking (only by specialist)."""
-    # Verify specialist owns the booking
-    booking = await BookingService.get_booking(session, booking_id)
-    if not booking:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Booking not found"
-        )
-    
-    if booking.specialist_id != current_specialist.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only the specialist can create sessions for their bookings"
-        )
+    access = await require_booking_access(
+        session, booking_id, current_user, AccessRole.SPECIALIST,
+        detail="Only the specialist can create sessions for their bookings",
+    )
     
     try:
         session_record = await SessionService.create_session(
-            session, session_data, booking_id
+            session, session_data, access.booking.id
         )
         return session_record
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.get("/my-sessions", response_model=List[SessionOut])
+@router.get("/my-sessions", response_model=List[Union[SessionSummary, SessionOut]])
 async def get_my_sessions_as_patient(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from X-Next-Cursor; overrides skip"),
+    include: Optional[str] = Query(None, pattern="^notes$", description="Set to 'notes' to include note columns"),
+    current_user: Principal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
     """Get sessions for current user as a patient."""
-    sessions = await SessionService.get_sessions_for_patient(
-        session, current_user.id, skip=skip, limit=limit
-    )
-    return sessions
+    try:
+        sessions = await SessionService.get_sessions_for_patient(
+            session, current_user.id, skip=skip, limit=limit, cursor=cursor,
+            include_notes=include == "notes"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    set_next_cursor(response, sessions, limit, "booking.start_time", "booking_id")
+    schema = SessionOut if include == "notes" else SessionSummary
+    return [schema.model_validate(record) for record in sessions]
 
 
-@router.get("/specialist-sessions", response_model=List[SessionOut])
+@router.get("/specialist-sessions", response_model=List[Union[SessionSummary, SessionOut]])
 async def get_my_sessions_as_specialist(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    current_specialist: Specialist = Depends(get_current_specialist),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from X-Next-Cursor; overrides skip"),
+    include: Optional[str] = Query(None, pattern="^notes$", description="Set to 'notes' to include note columns"),
+    current_specialist: SpecialistPrincipal = Depends(get_current_specialist),
     session: AsyncSession = Depends(get_session),
 ):
     """Get sessions for current specialist."""
-    sessions = await SessionService.get_sessions_for_specialist(
-        session, current_specialist.id, skip=skip, limit=limit
-    )
-    return sessions
+    try:
+        sessions = await SessionService.get_sessions_for_specialist(
+            session, current_specialist.id, skip=skip, limit=limit, cursor=cursor,
+            include_notes=include == "notes"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    set_next_cursor(response, sessions, limit, "booking.start_time", "booking_id")
+    schema = SessionOut if include == "notes" else SessionSummary
+    return [schema.model_validate(record) for record in sessions]
 
 
 @router.get("/{session_id}", response_model=SessionOut)
 async def get_session(
     session_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db_session: AsyncSession = Depends(get_session),
 ):
     """Get session by ID (only if user is patient or specialist for this session)."""
-    session_record = await SessionService.get_session(db_session, session_id)
-    if not session_record:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Session not found"
-        )
-    
-    # Check if user has access to this session
-    if (session_record.booking.patient_id != current_user.id and 
-        session_record.booking.specialist.user_id != current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied"
-        )
-    
-    return session_record
+    access = await require_session_access(db_session, session_id, current_user)
+    return access.session
 
 
 @router.get("/booking/{booking_id}", response_model=SessionOut)
 async def get_session_by_booking(
     booking_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
     """Get session for a specific booking."""
-    # First verify user has access to the booking
-    booking = await BookingService.get_booking(session, booking_id)
-    if not booking:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Booking not found"
-        )
-    
-    if (booking.patient_id != current_user.id and 
-        booking.specialist.user_id != current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied"
-        )
-    
-    session_record = await SessionService.get_session_by_booking_id(session, booking_id)
-    if not session_record:
+    access = await require_booking_access(session, booking_id, current_user)
+    if not access.session:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Session not found for this booking"
         )
     
-    return session_record
+    return access.session
 
 
 @router.put("/{session_id}", response_model=SessionOut)
 async def update_session(
     session_id: UUID,
     session_data: SessionUpdate,
-    current_specialist: Specialist = Depends(get_current_specialist),
+    current_user: Principal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
     """Update session (only by specialist who created it)."""
-    session_record = await SessionService.get_session(session, session_id)
-    if not session_record:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Session not found"
-        )
-    
-    # Only the specialist can update session details
-    if session_record.booking.specialist_id != current_specialist.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only the specialist can update session details"
-        )
+    access = await require_session_access(
+        session, session_id, current_user, AccessRole.SPECIALIST,
+        detail="Only the specialist can update session details",
+    )
     
     updated_session = await SessionService.update_session(
-        session, session_id, session_data
+        session, access.session.id, session_data
     )
     return updated_session
 
@@ -166,49 +138,32 @@ async def update_session(
 @router.delete("/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_session(
     session_id: UUID,
-    current_specialist: Specialist = Depends(get_current_specialist),
+    current_user: Principal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
     """Delete session (only by specialist who created it)."""
-    session_record = await SessionService.get_session(session, session_id)
-    if not session_record:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Session not found"
-        )
-    
-    # Only the specialist can delete session
-    if session_record.booking.specialist_id != current_specialist.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only the specialist can delete sessions"
-        )
+    access = await require_session_access(
+        session, session_id, current_user, AccessRole.SPECIALIST,
+        detail="Only the specialist can delete sessions",
+    )
     
-    await SessionService.delete_session(session, session_id)
+    await SessionService.delete_session(session, access.session.id)
 
 
 @router.patch("/{session_id}/notes", response_model=SessionOut)
 async def update_session_notes(
     session_id: UUID,
     notes: str,
-    current_specialist: Specialist = Depends(get_current_specialist),
+    current_user: Principal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
     """Update session notes (only by specialist)."""
-    session_record = await SessionService.get_session(session, session_id)
-    if not session_record:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Session not found"
-        )
-    
-    if session_record.booking.specialist_id != current_specialist.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only the specialist can update session notes"
-        )
+    access = await require_session_access(
+        session, session_id, current_user, AccessRole.SPECIALIST,
+        detail="Only the specialist can update session notes",
+    )
     
-    updated_session = await SessionService.add_session_notes(session, session_id, notes)
+    updated_session = await SessionService.add_session_notes(session, access.session.id, notes)
     return updated_session
 
 
@@ -216,24 +171,16 @@ async def update_session_notes(
 async def set_recording_url(
     session_id: UUID,
     recording_url: str,
-    current_specialist: Specialist = Depends(get_current_specialist),
+    current_user: Principal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
     """Set recording URL for session (only by specialist)."""
-    session_record = await SessionService.get_session(session, session_id)
-    if not session_record:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Session not found"
-        )
-    
-    if session_record.booking.specialist_id != current_specialist.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only the specialist can set recording URL"
-        )
+    access = await require_session_access(
+        session, session_id, current_user, AccessRole.SPECIALIST,
+        detail="Only the specialist can set recording URL",
+    )
     
     updated_session = await SessionService.set_recording_url(
-        session, session_id, recording_url
+        session, access.session.id, recording_url
     )
-    return updated_session
\ No newline at end of file
+    return updated_session
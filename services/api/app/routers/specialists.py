@@ -4,24 +4,27 @@ Specialist API endpoints.
 
 from typing import List, Optional
 from uuid import UUID
+from datetime import date, time
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_session
-from app.models.user import User
-from app.models.specialist import Specialist
-from app.schemas.specialist import SpecialistCreate, SpecialistUpdate, SpecialistOut
+from app.routers.idempotency import IdempotentRoute
+from app.schemas.specialist import SpecialistCreate, SpecialistUpdate, SpecialistOut, FreeSpecialist
 from app.services.specialist import SpecialistService
+from app.services.free_busy import FreeBusyIndex
+from app.services.principal_cache import load_principal
 from app.security.auth import get_current_user, get_current_specialist
+from app.security.tokens import Principal, SpecialistPrincipal
 
 
-router = APIRouter(prefix="/specialists", tags=["specialists"])
+router = APIRouter(prefix="/specialists", tags=["specialists"], route_class=IdempotentRoute)
 
 
 @router.post("", response_model=SpecialistOut, status_code=status.HTTP_201_CREATED)
 async def create_specialist_profile(
     specialist_data: SpecialistCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
     """Create a specialist profile for the current user."""
@@ -50,12 +53,45 @@ async def list_specialists(
     return specialists
 
 
+@router.get("/search/free", response_model=List[FreeSpecialist])
+async def search_free_specialists(
+    target_date: date = Query(...),
+    start_time: time = Query(...),
+    end_time: time = Query(...),
+    duration_minutes: int = Query(60, ge=15, le=480),
+    specialization: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=100),
+    session: AsyncSession = Depends(get_session),
+):
+    """Find available specialists with a free slot between start_time and end_time on a date."""
+    if end_time <= start_time:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end_time must be after start_time"
+        )
+    matches = await FreeBusyIndex.search_free_specialists(
+        session, target_date, start_time, end_time,
+        duration_minutes=duration_minutes, specialization=specialization, limit=limit
+    )
+    return [
+        FreeSpecialist(specialist_id=specialist_id, earliest_start=earliest_start)
+        for specialist_id, earliest_start in matches
+    ]
+
+
 @router.get("/me", response_model=SpecialistOut)
 async def get_my_specialist_profile(
-    current_specialist: Specialist = Depends(get_current_specialist),
+    current_specialist: SpecialistPrincipal = Depends(get_current_specialist),
+    session: AsyncSession = Depends(get_session),
 ):
     """Get current user's specialist profile."""
-    return current_specialist
+    cached = await load_principal(session, current_specialist.user_id)
+    if not cached or not cached.specialist:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Specialist not found"
+        )
+    return cached.specialist
 
 
 @router.get("/{specialist_id}", response_model=SpecialistOut)
@@ -76,7 +112,7 @@ async def get_specialist(
 @router.put("/me", response_model=SpecialistOut)
 async def update_my_specialist_profile(
     specialist_data: SpecialistUpdate,
-    current_specialist: Specialist = Depends(get_current_specialist),
+    current_specialist: SpecialistPrincipal = Depends(get_current_specialist),
     session: AsyncSession = Depends(get_session),
 ):
     """Update current user's specialist profile."""
@@ -93,7 +129,7 @@ async def update_my_specialist_profile(
 async def update_specialist(
     specialist_id: UUID,
     specialist_data: SpecialistUpdate,
-    current_specialist: Specialist = Depends(get_current_specialist),
+    current_specialist: SpecialistPrincipal = Depends(get_current_specialist),
     session: AsyncSession = Depends(get_session),
 ):
     """Update specialist profile (only by the specialist themselves)."""
@@ -119,7 +155,7 @@ async def update_specialist(
 
 @router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_my_specialist_profile(
-    current_specialist: Specialist = Depends(get_current_specialist),
+    current_specialist: SpecialistPrincipal = Depends(get_current_specialist),
     session: AsyncSession = Depends(get_session),
 ):
     """Delete current user's specialist profile."""
@@ -129,7 +165,7 @@ async def delete_my_specialist_profile(
 @router.patch("/me/availability", response_model=SpecialistOut)
 async def toggle_my_availability(
     is_available: bool,
-    current_specialist: Specialist = Depends(get_current_specialist),
+    current_specialist: SpecialistPrincipal = Depends(get_current_specialist),
     session: AsyncSession = Depends(get_session),
 ):
     """Toggle current specialist's availability status."""
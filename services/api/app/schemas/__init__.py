@@ -1,20 +1,27 @@
 from .user import UserCreate, UserOut
+from .auth import TokenResponse, RefreshRequest
 from .specialist import (
     SpecialistCreate,
     SpecialistUpdate,
     SpecialistOut,
     SpecialistProfile,
+    FreeSpecialist,
 )
 from .booking import (
     BookingCreate,
     BookingUpdate,
     BookingOut,
+    BookingSummary,
     BookingWithDetails,
+    BookingSeriesCreate,
+    BookingSeriesUpdate,
+    BookingSeriesOut,
 )
 from .session import (
     SessionCreate,
     SessionUpdate,
     SessionOut,
+    SessionSummary,
     SessionWithBooking,
 )
 from .availability import (
@@ -23,6 +30,7 @@ from .availability import (
     AvailabilityOut,
     BulkAvailabilityCreate,
     AvailableSlot,
+    DaySlots,
     WeeklySchedule,
 )
 
@@ -30,20 +38,29 @@ __all__ = [
     # User schemas
     "UserCreate",
     "UserOut",
+    # Auth schemas
+    "TokenResponse",
+    "RefreshRequest",
     # Specialist schemas
     "SpecialistCreate",
     "SpecialistUpdate",
     "SpecialistOut",
     "SpecialistProfile",
+    "FreeSpecialist",
     # Booking schemas
     "BookingCreate",
     "BookingUpdate",
     "BookingOut",
+    "BookingSummary",
     "BookingWithDetails",
+    "BookingSeriesCreate",
+    "BookingSeriesUpdate",
+    "BookingSeriesOut",
     # Session schemas
     "SessionCreate",
     "SessionUpdate",
     "SessionOut",
+    "SessionSummary",
     "SessionWithBooking",
     # Availability schemas
     "AvailabilityCreate",
@@ -51,5 +68,6 @@ __all__ = [
     "AvailabilityOut",
     "BulkAvailabilityCreate",
     "AvailableSlot",
+    "DaySlots",
     "WeeklySchedule",
 ]
\ No newline at end of file
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+from app.schemas.user import UserOut
+
+
+class TokenResponse(BaseModel):
+    access_token: str
+    refresh_token: str
+    token_type: str = "bearer"
+    expires_in: int
+    user: UserOut
+
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
@@ -1,4 +1,4 @@
-from datetime import datetime, time
+from datetime import date, datetime, time
 from typing import List
 from pydantic import BaseModel, Field, ConfigDict
 from app.models.availability import DayOfWeek
@@ -43,6 +43,12 @@ class AvailableSlot(BaseModel):
     duration_minutes: int
 
 
+class DaySlots(BaseModel):
+    """Available time slots for one day of a date range"""
+    date: date
+    slots: List[AvailableSlot] = Field(default_factory=list)
+
+
 class WeeklySchedule(BaseModel):
     """Weekly schedule for a specialist"""
     specialist_id: int
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field, ConfigDict
 from app.models.booking import BookingStatus
 
@@ -28,14 +28,62 @@ class BookingOut(BookingBase):
     specialist_id: int
     status: BookingStatus
     cancellation_reason: Optional[str] = None
+    series_id: Optional[int] = None
     created_at: datetime
     updated_at: datetime
     
     model_config = ConfigDict(from_attributes=True)
 
 
+class BookingSummary(BaseModel):
+    """List-mode booking without the unbounded text columns."""
+    id: int
+    patient_id: int
+    specialist_id: int
+    start_time: datetime
+    duration_minutes: int
+    status: BookingStatus
+    series_id: Optional[int] = None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class BookingWithDetails(BookingOut):
     """Booking with patient and specialist details"""
     patient_email: Optional[str] = None
     specialist_bio: Optional[str] = None
-    specialist_license_number: Optional[str] = None
\ No newline at end of file
+    specialist_license_number: Optional[str] = None
+
+
+class BookingSeriesCreate(BookingCreate):
+    """A recurring booking, e.g. every Tuesday 10:00 for 12 weeks."""
+    interval_weeks: int = Field(default=1, ge=1, le=4)
+    occurrences: int = Field(ge=2, le=52)
+    skip_conflicts: bool = Field(
+        default=False,
+        description="Skip unavailable occurrences instead of rejecting the whole series",
+    )
+
+
+class BookingSeriesUpdate(BaseModel):
+    """Changes applied to every upcoming active occurrence of a series."""
+    duration_minutes: Optional[int] = Field(None, ge=15, le=480)
+    notes: Optional[str] = None
+
+
+class BookingSeriesOut(BaseModel):
+    id: int
+    patient_id: int
+    specialist_id: int
+    start_time: datetime
+    duration_minutes: int
+    interval_weeks: int
+    occurrences: int
+    notes: Optional[str] = None
+    created_at: datetime
+    bookings: List[BookingOut] = []
+    skipped: List[datetime] = []
+
+    model_config = ConfigDict(from_attributes=True)
@@ -37,6 +37,21 @@ class SessionOut(SessionBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class SessionSummary(BaseModel):
+    """List-mode session without the unbounded text columns."""
+    id: int
+    booking_id: int
+    actual_start_time: Optional[datetime] = None
+    actual_end_time: Optional[datetime] = None
+    status: SessionStatus
+    recording_url: Optional[str] = None
+    is_recorded: bool = False
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class SessionWithBooking(SessionOut):
     """Session with booking details"""
     booking_start_time: Optional[datetime] = None
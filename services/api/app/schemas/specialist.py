@@ -37,4 +37,10 @@ class SpecialistOut(SpecialistBase):
 class SpecialistProfile(SpecialistOut):
     """Extended specialist profile with user info"""
     user_email: Optional[str] = None
-    user_role: Optional[str] = None
\ No newline at end of file
+    user_role: Optional[str] = None
+
+
+class FreeSpecialist(BaseModel):
+    """Specialist with a free slot in a searched time window"""
+    specialist_id: int
+    earliest_start: datetime
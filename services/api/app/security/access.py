@@ -0,0 +1,108 @@
+"""
+Ownership checks for bookings and sessions.
+
+One narrow SELECT answers "may this user act on booking/session X, and as
+whom?". The returned handle carries the booking and session rows it loaded,
+so services called afterwards find them in the identity map instead of
+loading the relationship graph again. The identity map holds rows weakly, so
+keep the handle referenced until the service call (e.g. pass
+``access.session.id`` rather than the path parameter).
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import FrozenSet, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.booking import Booking
+from app.models.session import Session
+from app.models.specialist import Specialist
+from app.security.tokens import Principal
+
+
+class AccessRole(str, Enum):
+    PATIENT = "patient"
+    SPECIALIST = "specialist"
+
+
+@dataclass(frozen=True)
+class Access:
+    """A user's roles on one booking, with the booking and its session (if any)."""
+    booking: Booking
+    session: Optional[Session]
+    roles: FrozenSet[AccessRole]
+
+    def allows(self, *roles: AccessRole) -> bool:
+        """Whether the user holds any of ``roles`` (any role at all when none are given)."""
+        return bool(self.roles & set(roles)) if roles else bool(self.roles)
+
+
+async def get_booking_access(db: AsyncSession, booking_id: int, user_id: int) -> Optional[Access]:
+    """The user's access to a booking, or None when the booking does not exist."""
+    return await _load_access(db, Booking.id == booking_id, user_id)
+
+
+async def get_session_access(db: AsyncSession, session_id: int, user_id: int) -> Optional[Access]:
+    """The user's access to a session, or None when the session does not exist."""
+    return await _load_access(db, Session.id == session_id, user_id)
+
+
+async def require_booking_access(
+    db: AsyncSession,
+    booking_id: int,
+    user: Principal,
+    *roles: AccessRole,
+    detail: str = "Access denied",
+) -> Access:
+    """Router helper: 404 for a missing booking, 403 unless the user holds one of ``roles``."""
+    access = await get_booking_access(db, booking_id, user.id)
+    if access is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Booking not found"
+        )
+    if not access.allows(*roles):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+    return access
+
+
+async def require_session_access(
+    db: AsyncSession,
+    session_id: int,
+    user: Principal,
+    *roles: AccessRole,
+    detail: str = "Access denied",
+) -> Access:
+    """Router helper: 404 for a missing session, 403 unless the user holds one of ``roles``."""
+    access = await get_session_access(db, session_id, user.id)
+    if access is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Session not found"
+        )
+    if not access.allows(*roles):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+    return access
+
+
+async def _load_access(db: AsyncSession, condition, user_id: int) -> Optional[Access]:
+    result = await db.execute(
+        select(Booking, Session, Specialist.user_id)
+        .join(Specialist, Specialist.id == Booking.specialist_id)
+        .outerjoin(Session, Session.booking_id == Booking.id)
+        .where(condition)
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None
+
+    booking, session, specialist_user_id = row
+    roles = set()
+    if booking.patient_id == user_id:
+        roles.add(AccessRole.PATIENT)
+    if specialist_user_id == user_id:
+        roles.add(AccessRole.SPECIALIST)
+    return Access(booking=booking, session=session, roles=frozenset(roles))
@@ -4,69 +4,60 @@ Authentication dependencies and utilities.
 
 from typing import Optional
 from uuid import UUID
-from fastapi import Depends, HTTPException, status, Header
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from app.db.session import get_session
-from app.models.user import User
-from app.models.specialist import Specialist
+from app.security.tokens import (
+    Principal,
+    SpecialistPrincipal,
+    TokenError,
+    decode_access_token,
+)
+
+
+bearer_scheme = HTTPBearer(auto_error=False)
 
 
 async def get_current_user(
-    x_user_id: Optional[str] = Header(None),
-    session: AsyncSession = Depends(get_session)
-) -> User:
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+) -> Principal:
     """
-    Get current user from X-User-ID header.
-    This is a simplified auth system for demo purposes.
+    Get the current user from a Bearer access token.
+    Verifies the signature and expiry only; no database access.
     """
-    if not x_user_id:
+    if credentials is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="X-User-ID header required"
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
         )
     
     try:
-        user_id = UUID(x_user_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid user ID format"
-        )
-    
-    user = await session.get(User, user_id)
-    if not user:
+        return decode_access_token(credentials.credentials)
+    except TokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"},
         )
-    
-    return user
 
 
 async def get_current_specialist(
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session)
-) -> Specialist:
-    """Get current user's specialist profile."""
-    result = await session.execute(
-        select(Specialist).where(Specialist.user_id == current_user.id)
-    )
-    specialist = result.scalar_one_or_none()
-    
-    if not specialist:
+    current_user: Principal = Depends(get_current_user),
+) -> SpecialistPrincipal:
+    """Get current user's specialist profile id from the token claims."""
+    if current_user.specialist_id is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User is not a specialist"
         )
     
-    return specialist
+    return SpecialistPrincipal(id=current_user.specialist_id, user_id=current_user.id)
 
 
 def require_specialist_ownership(
     specialist_id: UUID,
-    current_specialist: Specialist = Depends(get_current_specialist)
+    current_specialist: SpecialistPrincipal = Depends(get_current_specialist)
 ) -> None:
     """Ensure current specialist owns the resource."""
     if current_specialist.id != specialist_id:
@@ -78,7 +69,7 @@ def require_specialist_ownership(
 
 def require_user_ownership(
     user_id: UUID,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ) -> None:
     """Ensure current user owns the resource."""
     if current_user.id != user_id:
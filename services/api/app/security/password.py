@@ -1,7 +1,25 @@
+import asyncio
+import statistics
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional, Tuple, TypeVar
+
 from passlib.context import CryptContext
 
+from app.core.config import settings
+
+T = TypeVar("T")
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# New hashes use BCRYPT_ROUNDS; hashes below it (or on any scheme listed after
+# bcrypt, which "auto" deprecates) report needs_update and are rehashed on login
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.bcrypt_rounds,
+    bcrypt__min_rounds=settings.bcrypt_rounds,
+)
 
 
 def hash_password(password: str) -> str:
@@ -10,3 +28,135 @@ def hash_password(password: str) -> str:
 
 def verify_password(password: str, hashed: str) -> bool:
     return pwd_context.verify(password, hashed)
+
+
+def verify_and_update(password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    """Verify ``password``; when it matches a hash below policy, also return its replacement."""
+    return pwd_context.verify_and_update(password, hashed)
+
+
+def hash_cost(hashed: str) -> str:
+    """Label a stored hash by scheme and cost, e.g. ``bcrypt/12``."""
+    scheme = pwd_context.identify(hashed)
+    if scheme is None:
+        return "unknown"
+    rounds = getattr(pwd_context.handler(scheme).from_string(hashed), "rounds", None)
+    return scheme if rounds is None else f"{scheme}/{rounds}"
+
+
+def cost_distribution(hashes: Iterable[str]) -> Dict[str, Tuple[int, bool]]:
+    """Count stored hashes per cost label, flagging labels that need a rehash."""
+    counts: Counter = Counter()
+    stale: Dict[str, bool] = {}
+    for hashed in hashes:
+        label = hash_cost(hashed)
+        counts[label] += 1
+        if label not in stale:
+            stale[label] = label == "unknown" or pwd_context.needs_update(hashed)
+    return {label: (count, stale[label]) for label, count in counts.most_common()}
+
+
+def calibrate_bcrypt_rounds(
+    target_ms: float,
+    min_rounds: int = 10,
+    max_rounds: int = 16,
+    samples: int = 3,
+    timer: Callable[[], float] = time.perf_counter,
+) -> Tuple[int, Dict[int, float]]:
+    """Pick the highest bcrypt cost whose median hash time fits ``target_ms`` on this host.
+
+    Each extra round doubles the work, so timing stops at the first cost over
+    budget. Never returns less than ``min_rounds``. Also returns the measured
+    median milliseconds per cost.
+    """
+    timings: Dict[int, float] = {}
+    chosen = min_rounds
+    for rounds in range(min_rounds, max_rounds + 1):
+        handler = pwd_context.handler("bcrypt").using(rounds=rounds)
+        durations = []
+        for _ in range(samples):
+            started = timer()
+            handler.hash("calibration-password")
+            durations.append((timer() - started) * 1000)
+        timings[rounds] = statistics.median(durations)
+        if timings[rounds] > target_ms:
+            break
+        chosen = rounds
+    return chosen, timings
+
+
+class PasswordPoolSaturated(RuntimeError):
+    """Raised when the password hashing queue is full; callers should answer 503."""
+
+
+class PasswordHasher:
+    """Runs bcrypt on a bounded thread pool so it never blocks the event loop.
+
+    bcrypt releases the GIL while hashing, so threads give real parallelism.
+    At most ``workers + max_queue`` calls may be in flight; further calls fail
+    fast with PasswordPoolSaturated instead of queueing without bound. With
+    ``workers=0`` hashing runs inline on the loop.
+    """
+
+    def __init__(self, workers: int = 4, max_queue: int = 32):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.rejected = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if workers > 0:
+            self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password")
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._run(verify_password, password, hashed)
+
+    async def verify_and_update(self, password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        return await self._run(verify_and_update, password, hashed)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "rejected": self.rejected,
+        }
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        if self._executor is None:
+            return func(*args)
+        if self.in_flight >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise PasswordPoolSaturated("Password hashing is saturated, retry shortly")
+        self.in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self.in_flight -= 1
+
+
+_password_hasher: Optional[PasswordHasher] = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Process-wide password hasher sized from settings."""
+    global _password_hasher
+    if _password_hasher is None:
+        _password_hasher = PasswordHasher(
+            workers=settings.password_hash_workers,
+            max_queue=settings.password_hash_max_queue,
+        )
+    return _password_hasher
+
+
+def shutdown_password_hasher() -> None:
+    global _password_hasher
+    if _password_hasher is not None:
+        _password_hasher.shutdown()
+        _password_hasher = None
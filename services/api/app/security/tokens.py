@@ -0,0 +1,103 @@
+"""
+Signed JWT access and refresh tokens.
+
+Access tokens carry everything request dependencies need (user id, role and
+specialist id), so authenticating a request never touches the database.
+Refresh tokens only identify the user; exchanging one looks the user up again
+(through the principal cache, which specialist writes invalidate) so role or
+specialist-profile changes show up in the next access token.
+"""
+
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from jose import JWTError, jwt
+
+from app.core.config import settings
+
+ACCESS_TOKEN_TYPE = "access"
+REFRESH_TOKEN_TYPE = "refresh"
+
+
+class TokenError(ValueError):
+    """Raised for malformed, tampered, expired or wrong-type tokens."""
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated user as described by an access token."""
+    id: int
+    role: str
+    specialist_id: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class SpecialistPrincipal:
+    """The authenticated specialist; ``id`` is the specialist profile id."""
+    id: int
+    user_id: int
+
+
+def create_access_token(principal: Principal, expires_minutes: Optional[int] = None) -> str:
+    """Sign a short-lived access token for ``principal``."""
+    claims = {"role": principal.role, "sid": principal.specialist_id}
+    lifetime = timedelta(minutes=expires_minutes or settings.access_token_expires_min)
+    return _encode(principal.id, ACCESS_TOKEN_TYPE, lifetime, claims)
+
+
+def create_refresh_token(user_id: int) -> str:
+    """Sign a long-lived refresh token for ``user_id``."""
+    lifetime = timedelta(hours=settings.refresh_token_expires_hr)
+    return _encode(user_id, REFRESH_TOKEN_TYPE, lifetime, {"jti": uuid.uuid4().hex})
+
+
+def decode_access_token(token: str) -> Principal:
+    """Verify an access token and return its principal."""
+    claims = _decode(token, ACCESS_TOKEN_TYPE)
+    try:
+        return Principal(
+            id=int(claims["sub"]),
+            role=claims["role"],
+            specialist_id=claims.get("sid"),
+        )
+    except (KeyError, TypeError, ValueError):
+        raise TokenError("Malformed token claims")
+
+
+def decode_refresh_token(token: str) -> int:
+    """Verify a refresh token and return its user id."""
+    claims = _decode(token, REFRESH_TOKEN_TYPE)
+    try:
+        return int(claims["sub"])
+    except (KeyError, TypeError, ValueError):
+        raise TokenError("Malformed token claims")
+
+
+def _encode(subject: int, token_type: str, lifetime: timedelta, claims: Dict[str, Any]) -> str:
+    now = datetime.now(timezone.utc)
+    payload = {
+        **claims,
+        "sub": str(subject),
+        "type": token_type,
+        "iat": now,
+        "exp": now + lifetime,
+    }
+    return jwt.encode(payload, _secret(token_type), algorithm=settings.jwt_algorithm)
+
+
+def _decode(token: str, token_type: str) -> Dict[str, Any]:
+    try:
+        claims = jwt.decode(token, _secret(token_type), algorithms=[settings.jwt_algorithm])
+    except JWTError as e:
+        raise TokenError(str(e))
+    if claims.get("type") != token_type:
+        raise TokenError(f"Expected a {token_type} token")
+    return claims
+
+
+def _secret(token_type: str) -> str:
+    if token_type == REFRESH_TOKEN_TYPE and settings.jwt_refresh_secret:
+        return settings.jwt_refresh_secret
+    return settings.jwt_secret
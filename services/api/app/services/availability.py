@@ -2,15 +2,26 @@
 Availability service for CRUD operations.
 """
 
-from typing import List, Optional
+import math
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime, date, time, timedelta
-from sqlalchemy import select, and_, or_, delete
+from sqlalchemy import select, and_, or_, delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.availability import Availability, DayOfWeek
 from app.models.specialist import Specialist
 from app.schemas.availability import AvailabilityCreate, AvailabilityUpdate
+from app.services import slots
+from app.services.free_busy import FreeBusyIndex
+from app.services.slot_cache import get_slot_cache
+
+
+# Upper bound on the number of days a single slot range query may cover
+MAX_SLOT_RANGE_DAYS = 31
+MINUTES_PER_DAY = 24 * 60
 
 
 class AvailabilityService:
@@ -43,7 +54,12 @@ class AvailabilityService:
         )
         
         db.add(availability)
+        await db.flush()
+        await FreeBusyIndex.index_availability(db, specialist_id)
         await db.commit()
+        await get_slot_cache().invalidate_weekdays(
+            specialist_id, [AvailabilityService._weekday(availability.day_of_week)]
+        )
         await db.refresh(availability)
         return availability
 
@@ -86,64 +102,106 @@ class AvailabilityService:
         duration_minutes: int = 60,
     ) -> List[datetime]:
         """Get available time slots for a specific date."""
-        day_of_week = DayOfWeek(target_date.weekday())
-        
-        # Get availability for the day
+        cache = get_slot_cache()
+        cached = await cache.get(specialist_id, target_date, duration_minutes)
+        if cached is not None:
+            return cached
+
+        # Taken before reading bookings: an invalidation after this point makes set() a no-op
+        generation = await cache.generation(specialist_id)
+        days = await AvailabilityService.get_available_slots_range(
+            db, specialist_id, target_date, target_date, duration_minutes
+        )
+        available_slots = next(days)[1]
+        await cache.set(specialist_id, target_date, duration_minutes, available_slots, generation)
+        return available_slots
+
+    @staticmethod
+    async def get_available_slots_range(
+        db: AsyncSession,
+        specialist_id: UUID,
+        start_date: date,
+        end_date: date,
+        duration_minutes: int = 60,
+    ) -> Iterator[Tuple[date, List[datetime]]]:
+        """Get available time slots for every day in an inclusive date range.
+
+        Loads the weekly availability and all overlapping active bookings with one
+        query each, then lazily yields ``(day, slots)`` pairs computed in memory.
+        """
+        if end_date < start_date:
+            raise ValueError("end_date must be on or after start_date")
+        if (end_date - start_date).days + 1 > MAX_SLOT_RANGE_DAYS:
+            raise ValueError(f"Date range cannot exceed {MAX_SLOT_RANGE_DAYS} days")
+
         availabilities = await AvailabilityService.get_specialist_availability(
-            db, specialist_id, day_of_week, is_available=True
+            db, specialist_id, is_available=True
         )
-        
-        if not availabilities:
-            return []
+        windows_by_day: Dict[str, List[slots.Interval]] = defaultdict(list)
+        for availability in availabilities:
+            windows_by_day[availability.day_of_week].append(
+                (slots.to_minutes(availability.start_time), slots.to_minutes(availability.end_time))
+            )
 
-        # Import here to avoid circular imports
-        from app.models.booking import Booking, BookingStatus
-        
-        # Get existing bookings for the date
-        start_of_day = datetime.combine(target_date, time.min)
-        end_of_day = datetime.combine(target_date, time.max)
-        
-        bookings = await db.execute(
-            select(Booking)
-            .where(
-                and_(
-                    Booking.specialist_id == specialist_id,
-                    Booking.start_time >= start_of_day,
-                    Booking.start_time <= end_of_day,
-                    Booking.status.in_([BookingStatus.PENDING, BookingStatus.CONFIRMED])
+        range_start = datetime.combine(start_date, time.min)
+        busy: List[slots.Interval] = []
+        if windows_by_day:
+            # Import here to avoid circular imports
+            from app.models.booking import Booking, BookingStatus
+
+            # Includes bookings that started before the range but run into it
+            bookings = await db.execute(
+                select(Booking.start_time, Booking.duration_minutes)
+                .where(
+                    and_(
+                        Booking.specialist_id == specialist_id,
+                        Booking.end_time > range_start,
+                        Booking.start_time < datetime.combine(end_date + timedelta(days=1), time.min),
+                        Booking.status.in_([BookingStatus.PENDING, BookingStatus.CONFIRMED])
+                    )
                 )
+                .order_by(Booking.start_time)
             )
+            busy = [
+                AvailabilityService._booking_interval(range_start, start_time, booking_duration)
+                for start_time, booking_duration in bookings.all()
+            ]
+
+        return AvailabilityService._iter_day_slots(
+            windows_by_day, busy, start_date, end_date, duration_minutes
         )
-        existing_bookings = bookings.scalars().all()
 
-        available_slots = []
-        
-        for availability in availabilities:
-            # Generate time slots within availability window
-            slot_start = datetime.combine(target_date, availability.start_time)
-            slot_end = datetime.combine(target_date, availability.end_time)
-            
-            current_slot = slot_start
-            while current_slot + timedelta(minutes=duration_minutes) <= slot_end:
-                slot_finish = current_slot + timedelta(minutes=duration_minutes)
-                
-                # Check if this slot conflicts with existing bookings
-                is_conflicted = any(
-                    AvailabilityService._times_overlap(
-                        current_slot, slot_finish,
-                        booking.start_time, 
-                        booking.start_time + timedelta(minutes=booking.duration_minutes)
-                    )
-                    for booking in existing_bookings
-                )
-                
-                if not is_conflicted:
-                    available_slots.append(current_slot)
-                
-                # Move to next slot (15-minute intervals)
-                current_slot += timedelta(minutes=15)
-        
-        return sorted(available_slots)
+    @staticmethod
+    def _iter_day_slots(
+        windows_by_day: Dict[str, List[slots.Interval]],
+        busy: List[slots.Interval],
+        start_date: date,
+        end_date: date,
+        duration_minutes: int,
+    ) -> Iterator[Tuple[date, List[datetime]]]:
+        """Yield slots per day from range-relative busy intervals sorted by start."""
+        day_names = list(DayOfWeek)
+        starts = [start for start, _ in busy]
+        longest = max((end - start for start, end in busy), default=0)
+
+        for index in range((end_date - start_date).days + 1):
+            day = start_date + timedelta(days=index)
+            windows = windows_by_day.get(day_names[day.weekday()], [])
+            if not windows:
+                yield day, []
+                continue
+
+            day_offset = index * MINUTES_PER_DAY
+            first = bisect_left(starts, day_offset - longest)
+            last = bisect_left(starts, day_offset + MINUTES_PER_DAY)
+            day_busy = [
+                (start - day_offset, end - day_offset)
+                for start, end in busy[first:last]
+                if end > day_offset
+            ]
+            yield day, slots.offsets_to_datetimes(
+                day, slots.compute_slot_offsets(windows, day_busy, duration_minutes)
+            )
 
     @staticmethod
     async def update_availability(
@@ -170,11 +228,18 @@ class AvailabilityService:
             if conflicts:
                 raise ValueError("Updated availability conflicts with existing availability")
 
+        previous_day = availability.day_of_week
         update_data = availability_data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(availability, field, value)
 
+        await db.flush()
+        await FreeBusyIndex.index_availability(db, availability.specialist_id)
         await db.commit()
+        await get_slot_cache().invalidate_weekdays(
+            availability.specialist_id,
+            {AvailabilityService._weekday(previous_day), AvailabilityService._weekday(availability.day_of_week)},
+        )
         await db.refresh(availability)
         return availability
 
@@ -186,7 +251,12 @@ class AvailabilityService:
             return False
 
         await db.delete(availability)
+        await db.flush()
+        await FreeBusyIndex.index_availability(db, availability.specialist_id)
         await db.commit()
+        await get_slot_cache().invalidate_weekdays(
+            availability.specialist_id, [AvailabilityService._weekday(availability.day_of_week)]
+        )
         return True
 
     @staticmethod
@@ -201,32 +271,42 @@ class AvailabilityService:
         if not specialist:
             raise ValueError("Specialist not found")
 
-        created_availabilities = []
-        for availability_data in availabilities:
-            # Check for conflicts
-            conflicts = await AvailabilityService._check_availability_conflicts(
-                db, specialist_id, availability_data.day_of_week,
-                availability_data.start_time, availability_data.end_time
-            )
-            if conflicts:
-                raise ValueError(
-                    f"Availability slot for {availability_data.day_of_week} "
-                    f"{availability_data.start_time}-{availability_data.end_time} conflicts"
-                )
+        if not availabilities:
+            return []
 
-            availability = Availability(
-                specialist_id=specialist_id,
-                day_of_week=availability_data.day_of_week,
-                start_time=availability_data.start_time,
-                end_time=availability_data.end_time,
-                is_available=availability_data.is_available,
+        # Load existing windows once and sweep them together with the new ones
+        result = await db.execute(
+            select(Availability.day_of_week, Availability.start_time, Availability.end_time)
+            .where(Availability.specialist_id == specialist_id)
+        )
+        conflict = AvailabilityService._find_bulk_conflict(result.all(), availabilities)
+        if conflict is not None:
+            raise ValueError(
+                f"Availability slot for {conflict.day_of_week} "
+                f"{conflict.start_time}-{conflict.end_time} conflicts"
             )
-            db.add(availability)
-            created_availabilities.append(availability)
 
+        # Single multi-row INSERT ... RETURNING, committed together with the index refresh
+        created_availabilities = list(
+            await db.scalars(
+                insert(Availability).returning(Availability, sort_by_parameter_order=True),
+                [
+                    {
+                        "specialist_id": specialist_id,
+                        "day_of_week": availability_data.day_of_week,
+                        "start_time": availability_data.start_time,
+                        "end_time": availability_data.end_time,
+                        "is_active": availability_data.is_available,
+                    }
+                    for availability_data in availabilities
+                ],
+            )
+        )
+        await FreeBusyIndex.index_availability(db, specialist_id)
         await db.commit()
-        for availability in created_availabilities:
-            await db.refresh(availability)
+        await get_slot_cache().invalidate_weekdays(
+            specialist_id, {AvailabilityService._weekday(a.day_of_week) for a in created_availabilities}
+        )
         
         return created_availabilities
 
@@ -238,7 +318,9 @@ class AvailabilityService:
         result = await db.execute(
             delete(Availability).where(Availability.specialist_id == specialist_id)
         )
+        await FreeBusyIndex.index_availability(db, specialist_id)
         await db.commit()
+        await get_slot_cache().invalidate_specialist(specialist_id)
         return result.rowcount
 
     @staticmethod
@@ -284,6 +366,61 @@ class AvailabilityService:
         result = await db.execute(query)
         return result.scalars().all()
 
+    @staticmethod
+    def _find_bulk_conflict(
+        existing: Iterable[Tuple[str, time, time]],
+        new: List[AvailabilityCreate],
+    ) -> Optional[AvailabilityCreate]:
+        """Return a new slot that overlaps an existing or another new slot, if any.
+
+        Sorts all windows per day and sweeps them once, tracking the furthest
+        end reached by existing and by new windows separately so pre-existing
+        overlaps between stored rows are not reported.
+        """
+        by_day: Dict[str, List[Tuple[time, time, Optional[int]]]] = defaultdict(list)
+        for day_of_week, start_time, end_time in existing:
+            by_day[day_of_week].append((start_time, end_time, None))
+        for index, availability_data in enumerate(new):
+            by_day[availability_data.day_of_week].append(
+                (availability_data.start_time, availability_data.end_time, index)
+            )
+
+        conflicts = []
+        for windows in by_day.values():
+            windows.sort(key=lambda window: (window[0], window[1]))
+            existing_end: Optional[time] = None
+            new_end: Optional[time] = None
+            new_owner: Optional[int] = None
+            for start_time, end_time, index in windows:
+                if index is None:
+                    if new_end is not None and start_time < new_end:
+                        conflicts.append(new_owner)
+                    if existing_end is None or end_time > existing_end:
+                        existing_end = end_time
+                else:
+                    if (existing_end is not None and start_time < existing_end) or (
+                        new_end is not None and start_time < new_end
+                    ):
+                        conflicts.append(index)
+                    if new_end is None or end_time > new_end:
+                        new_end, new_owner = end_time, index
+
+        return new[min(conflicts)] if conflicts else None
+
+    @staticmethod
+    def _weekday(day_of_week: str) -> int:
+        """Weekday number (Monday == 0) for a DayOfWeek value."""
+        return list(DayOfWeek).index(DayOfWeek(day_of_week))
+
+    @staticmethod
+    def _booking_interval(
+        day_start: datetime, start_time: datetime, duration_minutes: int
+    ) -> slots.Interval:
+        """Booking as whole-minute offsets from ``day_start``, widened to cover partial minutes."""
+        start_seconds = (start_time - day_start).total_seconds()
+        end_seconds = start_seconds + duration_minutes * 60
+        return math.floor(start_seconds / 60), math.ceil(end_seconds / 60)
+
     @staticmethod
     def _times_overlap(
         start1: datetime, end1: datetime, start2: datetime, end2: datetime
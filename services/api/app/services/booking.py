@@ -2,17 +2,39 @@
 Booking service for CRUD operations.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
 from uuid import UUID
-from datetime import datetime, timedelta
-from sqlalchemy import select, and_, or_
+from datetime import date, datetime, timedelta
+from sqlalchemy import select, update, and_, or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from app.core.config import settings
+from app.db.loaders import defer_text, load_profile
+from app.db.locks import is_exclusion_violation, lock_specialist, run_with_retries
+from app.jobs.definitions import BookingEvent
 from app.models.booking import Booking, BookingStatus
 from app.models.specialist import Specialist
 from app.models.user import User
 from app.schemas.booking import BookingCreate, BookingUpdate
+from app.services.free_busy import ACTIVE_BOOKING_STATUSES, FreeBusyIndex
+from app.services.outbox import OutboxService
+from app.services.pagination import paginate
+from app.services.slot_cache import get_slot_cache
+
+
+# Allowed source states for each target status
+BOOKING_TRANSITIONS = {
+    BookingStatus.CONFIRMED: (BookingStatus.PENDING,),
+    BookingStatus.COMPLETED: (BookingStatus.CONFIRMED,),
+    BookingStatus.CANCELLED: (BookingStatus.PENDING, BookingStatus.CONFIRMED, BookingStatus.NO_SHOW),
+}
+
+TRANSITION_ERRORS = {
+    BookingStatus.CONFIRMED: "Can only confirm pending bookings, current status: {status}",
+    BookingStatus.COMPLETED: "Can only complete confirmed bookings, current status: {status}",
+    BookingStatus.CANCELLED: "Cannot cancel booking with status: {status}",
+}
 
 
 class BookingService:
@@ -22,7 +44,33 @@ class BookingService:
     async def create_booking(
         db: AsyncSession, booking_data: BookingCreate, patient_id: UUID
     ) -> Booking:
-        """Create a new booking."""
+        """Create a new booking.
+
+        The conflict check and insert run under a per-specialist lock, retried a
+        bounded number of times on transient lock or serialization failures.
+        """
+        try:
+            booking = await run_with_retries(
+                db,
+                lambda: BookingService._create_booking_locked(db, booking_data, patient_id),
+                settings.booking_max_retries,
+            )
+        except IntegrityError as e:
+            if is_exclusion_violation(e):
+                raise ValueError("Time slot is not available")
+            raise
+
+        await get_slot_cache().invalidate_dates(
+            booking.specialist_id, BookingService._booking_dates(booking)
+        )
+        await db.refresh(booking)
+        return booking
+
+    @staticmethod
+    async def _create_booking_locked(
+        db: AsyncSession, booking_data: BookingCreate, patient_id: UUID
+    ) -> Booking:
+        """Check and insert a booking in one transaction holding the specialist lock."""
         # Validate specialist exists
         specialist = await db.get(Specialist, booking_data.specialist_id)
         if not specialist:
@@ -31,6 +79,8 @@ class BookingService:
         if not specialist.is_available:
             raise ValueError("Specialist is not currently available")
 
+        await lock_specialist(db, booking_data.specialist_id)
+
         # Check for conflicting bookings
         end_time = booking_data.start_time + timedelta(minutes=booking_data.duration_minutes)
         
@@ -50,8 +100,10 @@ class BookingService:
         )
         
         db.add(booking)
+        await db.flush()
+        await FreeBusyIndex.index_booking(db, booking)
+        OutboxService.record_booking_event(db, booking.id, BookingEvent.CREATED)
         await db.commit()
-        await db.refresh(booking)
         return booking
 
     @staticmethod
@@ -59,11 +111,7 @@ class BookingService:
         """Get booking by ID with related data."""
         result = await db.execute(
             select(Booking)
-            .options(
-                selectinload(Booking.patient),
-                selectinload(Booking.specialist).selectinload(Specialist.user),
-                selectinload(Booking.session)
-            )
+            .options(*load_profile("booking.detail"))
             .where(Booking.id == booking_id)
         )
         return result.scalar_one_or_none()
@@ -75,21 +123,26 @@ class BookingService:
         skip: int = 0,
         limit: int = 100,
         status: Optional[BookingStatus] = None,
+        cursor: Optional[str] = None,
+        include_notes: bool = False,
     ) -> List[Booking]:
-        """Get bookings for a specific patient."""
+        """Get bookings for a specific patient, newest first.
+
+        Pages by ``cursor`` (keyset) when given, otherwise by ``skip`` (offset).
+        Note columns are deferred unless ``include_notes`` is set.
+        """
         query = (
             select(Booking)
-            .options(
-                selectinload(Booking.specialist).selectinload(Specialist.user),
-                selectinload(Booking.session)
-            )
+            .options(*load_profile("booking.patient_list"))
             .where(Booking.patient_id == patient_id)
         )
+        if not include_notes:
+            query = query.options(*defer_text(Booking))
         
         if status:
             query = query.where(Booking.status == status)
         
-        query = query.offset(skip).limit(limit).order_by(Booking.start_time.desc())
+        query = paginate(query, Booking.start_time, Booking.id, skip, limit, cursor, descending=True)
         
         result = await db.execute(query)
         return result.scalars().all()
@@ -103,16 +156,21 @@ class BookingService:
         status: Optional[BookingStatus] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        include_notes: bool = False,
     ) -> List[Booking]:
-        """Get bookings for a specific specialist."""
+        """Get bookings for a specific specialist, earliest first.
+
+        Pages by ``cursor`` (keyset) when given, otherwise by ``skip`` (offset).
+        Note columns are deferred unless ``include_notes`` is set.
+        """
         query = (
             select(Booking)
-            .options(
-                selectinload(Booking.patient),
-                selectinload(Booking.session)
-            )
+            .options(*load_profile("booking.specialist_list"))
             .where(Booking.specialist_id == specialist_id)
         )
+        if not include_notes:
+            query = query.options(*defer_text(Booking))
         
         conditions = []
         if status:
@@ -125,7 +183,7 @@ class BookingService:
         if conditions:
             query = query.where(and_(*conditions))
         
-        query = query.offset(skip).limit(limit).order_by(Booking.start_time.asc())
+        query = paginate(query, Booking.start_time, Booking.id, skip, limit, cursor)
         
         result = await db.execute(query)
         return result.scalars().all()
@@ -135,12 +193,38 @@ class BookingService:
         db: AsyncSession, booking_id: UUID, booking_data: BookingUpdate
     ) -> Optional[Booking]:
         """Update booking information."""
-        booking = await BookingService.get_booking(db, booking_id)
+        try:
+            result = await run_with_retries(
+                db,
+                lambda: BookingService._update_booking_locked(db, booking_id, booking_data),
+                settings.booking_max_retries,
+            )
+        except IntegrityError as e:
+            if is_exclusion_violation(e):
+                raise ValueError("New time slot is not available")
+            raise
+        if result is None:
+            return None
+
+        booking, previous_dates = result
+        await get_slot_cache().invalidate_dates(
+            booking.specialist_id, previous_dates | BookingService._booking_dates(booking)
+        )
+        await db.refresh(booking)
+        return booking
+
+    @staticmethod
+    async def _update_booking_locked(
+        db: AsyncSession, booking_id: UUID, booking_data: BookingUpdate
+    ) -> Optional[Tuple[Booking, Set[date]]]:
+        """Apply a booking update in one transaction, locking the specialist when rescheduling."""
+        booking = await db.get(Booking, booking_id)
         if not booking:
             return None
 
         # If updating time, check for conflicts
         if booking_data.start_time or booking_data.duration_minutes:
+            await lock_specialist(db, booking.specialist_id)
             new_start = booking_data.start_time or booking.start_time
             new_duration = booking_data.duration_minutes or booking.duration_minutes
             new_end = new_start + timedelta(minutes=new_duration)
@@ -151,58 +235,132 @@ class BookingService:
             if conflicts:
                 raise ValueError("New time slot is not available")
 
+        previous_dates = BookingService._booking_dates(booking)
         update_data = booking_data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(booking, field, value)
 
+        await FreeBusyIndex.index_booking(db, booking)
+        if booking_data.start_time or booking_data.duration_minutes:
+            OutboxService.record_booking_event(db, booking.id, BookingEvent.RESCHEDULED)
         await db.commit()
-        await db.refresh(booking)
-        return booking
+        return booking, previous_dates
 
     @staticmethod
-    async def cancel_booking(db: AsyncSession, booking_id: UUID) -> Optional[Booking]:
-        """Cancel a booking."""
-        booking = await BookingService.get_booking(db, booking_id)
-        if not booking:
-            return None
+    async def cancel_booking(
+        db: AsyncSession,
+        booking_id: UUID,
+        actor_user_id: Optional[int] = None,
+        cancellation_reason: Optional[str] = None,
+    ) -> Optional[Booking]:
+        """Cancel a booking (as its patient or specialist when ``actor_user_id`` is given)."""
+        values = {"cancellation_reason": cancellation_reason} if cancellation_reason else {}
+        return await BookingService.transition_booking(
+            db, booking_id, BookingStatus.CANCELLED, actor_user_id=actor_user_id, values=values
+        )
 
-        if booking.status in [BookingStatus.CANCELLED, BookingStatus.COMPLETED]:
-            raise ValueError(f"Cannot cancel booking with status: {booking.status}")
+    @staticmethod
+    async def confirm_booking(
+        db: AsyncSession, booking_id: UUID, actor_specialist_id: Optional[int] = None
+    ) -> Optional[Booking]:
+        """Confirm a pending booking (as its specialist when ``actor_specialist_id`` is given)."""
+        return await BookingService.transition_booking(
+            db, booking_id, BookingStatus.CONFIRMED, actor_specialist_id=actor_specialist_id
+        )
 
-        booking.status = BookingStatus.CANCELLED
-        await db.commit()
-        await db.refresh(booking)
-        return booking
+    @staticmethod
+    async def complete_booking(
+        db: AsyncSession, booking_id: UUID, actor_specialist_id: Optional[int] = None
+    ) -> Optional[Booking]:
+        """Mark a booking as completed (as its specialist when ``actor_specialist_id`` is given)."""
+        return await BookingService.transition_booking(
+            db, booking_id, BookingStatus.COMPLETED, actor_specialist_id=actor_specialist_id
+        )
 
     @staticmethod
-    async def confirm_booking(db: AsyncSession, booking_id: UUID) -> Optional[Booking]:
-        """Confirm a pending booking."""
-        booking = await BookingService.get_booking(db, booking_id)
-        if not booking:
-            return None
+    async def transition_booking(
+        db: AsyncSession,
+        booking_id: UUID,
+        new_status: BookingStatus,
+        actor_user_id: Optional[int] = None,
+        actor_specialist_id: Optional[int] = None,
+        values: Optional[dict] = None,
+    ) -> Optional[Booking]:
+        """Move a booking to ``new_status`` with one conditional UPDATE ... RETURNING.
 
-        if booking.status != BookingStatus.PENDING:
-            raise ValueError(f"Can only confirm pending bookings, current status: {booking.status}")
+        The allowed source states and the caller's ownership are part of the WHERE
+        clause, so nothing can change between check and write. When no row matches,
+        one narrow lookup tells the cases apart: missing returns None, not owned
+        raises PermissionError and a disallowed source state raises ValueError.
+        """
+        ownership = BookingService._ownership_clauses(actor_user_id, actor_specialist_id)
+        statement = (
+            update(Booking)
+            .where(
+                Booking.id == booking_id,
+                Booking.status.in_(BOOKING_TRANSITIONS[new_status]),
+                *ownership,
+            )
+            .values(status=new_status, **(values or {}))
+            .returning(Booking)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        booking = (await db.scalars(statement)).one_or_none()
+        if booking is None:
+            await BookingService._raise_for_failed_transition(db, booking_id, new_status, ownership)
+            return None
 
-        booking.status = BookingStatus.CONFIRMED
+        if new_status not in ACTIVE_BOOKING_STATUSES:
+            await FreeBusyIndex.index_booking(db, booking)
+        OutboxService.record_booking_event(db, booking.id, BookingEvent(new_status.value))
         await db.commit()
-        await db.refresh(booking)
+        if new_status not in ACTIVE_BOOKING_STATUSES:
+            await get_slot_cache().invalidate_dates(
+                booking.specialist_id, BookingService._booking_dates(booking)
+            )
         return booking
 
     @staticmethod
-    async def complete_booking(db: AsyncSession, booking_id: UUID) -> Optional[Booking]:
-        """Mark a booking as completed."""
-        booking = await BookingService.get_booking(db, booking_id)
-        if not booking:
-            return None
+    def _ownership_clauses(
+        actor_user_id: Optional[int], actor_specialist_id: Optional[int]
+    ) -> list:
+        """WHERE clauses restricting a booking to the acting patient or specialist."""
+        clauses = []
+        if actor_specialist_id is not None:
+            clauses.append(Booking.specialist_id == actor_specialist_id)
+        if actor_user_id is not None:
+            clauses.append(
+                or_(
+                    Booking.patient_id == actor_user_id,
+                    Booking.specialist_id.in_(
+                        select(Specialist.id).where(Specialist.user_id == actor_user_id)
+                    ),
+                )
+            )
+        return clauses
 
-        if booking.status != BookingStatus.CONFIRMED:
-            raise ValueError(f"Can only complete confirmed bookings, current status: {booking.status}")
+    @staticmethod
+    async def _raise_for_failed_transition(
+        db: AsyncSession, booking_id: UUID, new_status: BookingStatus, ownership: list
+    ) -> None:
+        """Explain why a conditional transition matched no row."""
+        row = (
+            await db.execute(
+                select(Booking.status, and_(True, *ownership).label("is_owner"))
+                .where(Booking.id == booking_id)
+            )
+        ).one_or_none()
+        if row is None:
+            return
+        if not row.is_owner:
+            raise PermissionError("Access denied")
+        raise ValueError(TRANSITION_ERRORS[new_status].format(status=row.status))
 
-        booking.status = BookingStatus.COMPLETED
-        await db.commit()
-        await db.refresh(booking)
-        return booking
+    @staticmethod
+    def _booking_dates(booking: Booking) -> Set[date]:
+        """Calendar dates a booking touches, for slot cache invalidation."""
+        end_time = booking.start_time + timedelta(minutes=booking.duration_minutes)
+        return {booking.start_time.date(), end_time.date()}
 
     @staticmethod
     async def _check_booking_conflicts(
@@ -213,11 +371,13 @@ class BookingService:
         exclude_booking_id: Optional[UUID] = None,
     ) -> List[Booking]:
         """Check for conflicting bookings in the given time range."""
-        # Get all active bookings for the specialist
+        # Overlap is evaluated in the database against the indexed end_time column
         query = select(Booking).where(
             and_(
                 Booking.specialist_id == specialist_id,
-                Booking.status.in_([BookingStatus.PENDING, BookingStatus.CONFIRMED])
+                Booking.status.in_([BookingStatus.PENDING, BookingStatus.CONFIRMED]),
+                Booking.end_time > start_time,
+                Booking.start_time < end_time,
             )
         )
         
@@ -225,15 +385,4 @@ class BookingService:
             query = query.where(Booking.id != exclude_booking_id)
         
         result = await db.execute(query)
-        existing_bookings = result.scalars().all()
-        
-        # Check for conflicts in Python
-        conflicts = []
-        for booking in existing_bookings:
-            booking_end = booking.start_time + timedelta(minutes=booking.duration_minutes)
-            
-            # Check if bookings overlap
-            if (start_time < booking_end and end_time > booking.start_time):
-                conflicts.append(booking)
-                
-        return conflicts
\ No newline at end of file
+        return result.scalars().all()
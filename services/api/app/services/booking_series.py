@@ -0,0 +1,369 @@
+"""
+Recurring booking series: validate and create every occurrence in one transaction.
+"""
+
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.config import settings
+from app.db.locks import is_exclusion_violation, lock_specialist, run_with_retries
+from app.jobs.definitions import BookingEvent
+from app.models.availability import Availability, DayOfWeek
+from app.models.booking import Booking, BookingStatus
+from app.models.booking_series import BookingSeries
+from app.models.specialist import Specialist
+from app.schemas.booking import BookingSeriesCreate, BookingSeriesUpdate
+from app.services.booking import BOOKING_TRANSITIONS, BookingService
+from app.services.free_busy import ACTIVE_BOOKING_STATUSES, FreeBusyIndex
+from app.services.outbox import OutboxService
+from app.services.slot_cache import get_slot_cache
+from app.services.slots import free_gaps, merge_intervals
+
+Occurrence = Tuple[datetime, datetime]
+
+
+class BookingSeriesService:
+    """Service class for recurring booking series."""
+
+    @staticmethod
+    def occurrences(
+        first_start: datetime, duration_minutes: int, interval_weeks: int, count: int
+    ) -> List[Occurrence]:
+        """(start, end) of each occurrence of a series."""
+        step = timedelta(weeks=interval_weeks)
+        duration = timedelta(minutes=duration_minutes)
+        return [
+            (first_start + step * index, first_start + step * index + duration)
+            for index in range(count)
+        ]
+
+    @staticmethod
+    async def create_series(
+        db: AsyncSession, series_data: BookingSeriesCreate, patient_id: int
+    ) -> Tuple[BookingSeries, List[datetime]]:
+        """Create a series and all of its bookings in one transaction.
+
+        Every occurrence is checked against the specialist's weekly availability
+        and existing bookings with one query each. By default any unavailable
+        occurrence rejects the whole series; with ``skip_conflicts`` those
+        occurrences are left out and their start times returned alongside it.
+        """
+        try:
+            series, skipped = await run_with_retries(
+                db,
+                lambda: BookingSeriesService._create_series_locked(db, series_data, patient_id),
+                settings.booking_max_retries,
+            )
+        except IntegrityError as e:
+            if is_exclusion_violation(e):
+                raise ValueError("Time slot is not available")
+            raise
+
+        await get_slot_cache().invalidate_dates(
+            series.specialist_id,
+            {day for booking in series.bookings for day in BookingService._booking_dates(booking)},
+        )
+        return series, skipped
+
+    @staticmethod
+    async def _create_series_locked(
+        db: AsyncSession, series_data: BookingSeriesCreate, patient_id: int
+    ) -> Tuple[BookingSeries, List[datetime]]:
+        """Validate and insert a series holding the specialist lock."""
+        specialist = await db.get(Specialist, series_data.specialist_id)
+        if not specialist:
+            raise ValueError("Specialist not found")
+
+        if not specialist.is_available:
+            raise ValueError("Specialist is not currently available")
+
+        await lock_specialist(db, series_data.specialist_id)
+
+        occurrences = BookingSeriesService.occurrences(
+            series_data.start_time,
+            series_data.duration_minutes,
+            series_data.interval_weeks,
+            series_data.occurrences,
+        )
+        rejected = await BookingSeriesService._find_unavailable(
+            db, series_data.specialist_id, occurrences
+        )
+        if rejected and not series_data.skip_conflicts:
+            start_time, reason = next(iter(sorted(rejected.items())))
+            raise ValueError(f"Occurrence at {start_time.isoformat()} {reason}")
+
+        accepted = [occurrence for occurrence in occurrences if occurrence[0] not in rejected]
+        if not accepted:
+            raise ValueError("No occurrence of the series is available")
+
+        series = BookingSeries(
+            patient_id=patient_id,
+            specialist_id=series_data.specialist_id,
+            start_time=series_data.start_time,
+            duration_minutes=series_data.duration_minutes,
+            interval_weeks=series_data.interval_weeks,
+            occurrences=series_data.occurrences,
+            notes=series_data.notes,
+        )
+        db.add(series)
+        await db.flush()
+
+        # Single multi-row INSERT ... RETURNING; end_time is set here since the
+        # ORM flush hook does not run for Core inserts
+        bookings = list(
+            await db.scalars(
+                insert(Booking).returning(Booking, sort_by_parameter_order=True),
+                [
+                    {
+                        "patient_id": patient_id,
+                        "specialist_id": series_data.specialist_id,
+                        "series_id": series.id,
+                        "start_time": start_time,
+                        "end_time": end_time,
+                        "duration_minutes": series_data.duration_minutes,
+                        "notes": series_data.notes,
+                        "status": BookingStatus.PENDING,
+                    }
+                    for start_time, end_time in accepted
+                ],
+            )
+        )
+        await FreeBusyIndex.index_bookings(db, bookings)
+        for booking in bookings:
+            OutboxService.record_booking_event(db, booking.id, BookingEvent.CREATED)
+        await db.commit()
+        set_committed_value(series, "bookings", bookings)
+        return series, sorted(rejected)
+
+    @staticmethod
+    async def get_series(db: AsyncSession, series_id: int) -> Optional[BookingSeries]:
+        """Get a series by ID with its bookings."""
+        result = await db.execute(
+            select(BookingSeries)
+            .options(selectinload(BookingSeries.bookings))
+            .where(BookingSeries.id == series_id)
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def is_participant(db: AsyncSession, series: BookingSeries, user_id: int) -> bool:
+        """Whether the user is the series' patient or its specialist."""
+        if series.patient_id == user_id:
+            return True
+        specialist = await db.get(Specialist, series.specialist_id)
+        return specialist is not None and specialist.user_id == user_id
+
+    @staticmethod
+    async def update_series(
+        db: AsyncSession,
+        series_id: int,
+        series_data: BookingSeriesUpdate,
+        from_time: Optional[datetime] = None,
+    ) -> Optional[List[Booking]]:
+        """Apply changes to every active occurrence starting at or after ``from_time`` (now).
+
+        A duration change is validated for all affected occurrences at once and
+        is all-or-nothing.
+        """
+        try:
+            result = await run_with_retries(
+                db,
+                lambda: BookingSeriesService._update_series_locked(
+                    db, series_id, series_data, from_time or datetime.utcnow()
+                ),
+                settings.booking_max_retries,
+            )
+        except IntegrityError as e:
+            if is_exclusion_violation(e):
+                raise ValueError("New time slot is not available")
+            raise
+        if result is None:
+            return None
+
+        series, bookings = result
+        await get_slot_cache().invalidate_dates(
+            series.specialist_id,
+            {day for booking in bookings for day in BookingService._booking_dates(booking)},
+        )
+        return bookings
+
+    @staticmethod
+    async def _update_series_locked(
+        db: AsyncSession, series_id: int, series_data: BookingSeriesUpdate, from_time: datetime
+    ) -> Optional[Tuple[BookingSeries, List[Booking]]]:
+        """Apply a series update in one transaction holding the specialist lock."""
+        series = await db.get(BookingSeries, series_id)
+        if not series:
+            return None
+
+        await lock_specialist(db, series.specialist_id)
+        result = await db.execute(
+            select(Booking)
+            .where(
+                and_(
+                    Booking.series_id == series_id,
+                    Booking.status.in_(ACTIVE_BOOKING_STATUSES),
+                    Booking.start_time >= from_time,
+                )
+            )
+            .order_by(Booking.start_time)
+        )
+        bookings = list(result.scalars().all())
+
+        update_data = series_data.model_dump(exclude_unset=True)
+        if bookings and update_data.get("duration_minutes"):
+            duration = timedelta(minutes=update_data["duration_minutes"])
+            rejected = await BookingSeriesService._find_unavailable(
+                db,
+                series.specialist_id,
+                [(booking.start_time, booking.start_time + duration) for booking in bookings],
+                exclude_series_id=series_id,
+            )
+            if rejected:
+                start_time, reason = next(iter(sorted(rejected.items())))
+                raise ValueError(f"Occurrence at {start_time.isoformat()} {reason}")
+
+        for field, value in update_data.items():
+            setattr(series, field, value)
+            for booking in bookings:
+                setattr(booking, field, value)
+
+        await db.flush()
+        await FreeBusyIndex.index_bookings(db, bookings)
+        if update_data.get("duration_minutes"):
+            for booking in bookings:
+                OutboxService.record_booking_event(db, booking.id, BookingEvent.RESCHEDULED)
+        await db.commit()
+        return series, bookings
+
+    @staticmethod
+    async def cancel_series(
+        db: AsyncSession,
+        series_id: int,
+        actor_user_id: Optional[int] = None,
+        cancellation_reason: Optional[str] = None,
+        from_time: Optional[datetime] = None,
+    ) -> Optional[List[Booking]]:
+        """Cancel every cancellable occurrence starting at or after ``from_time`` (now).
+
+        Runs one conditional UPDATE ... RETURNING over the series. Raises
+        PermissionError when ``actor_user_id`` is neither its patient nor its
+        specialist.
+        """
+        series = await db.get(BookingSeries, series_id)
+        if not series:
+            return None
+        if actor_user_id is not None and not await BookingSeriesService.is_participant(
+            db, series, actor_user_id
+        ):
+            raise PermissionError("Access denied")
+
+        values: Dict[str, object] = {"status": BookingStatus.CANCELLED}
+        if cancellation_reason:
+            values["cancellation_reason"] = cancellation_reason
+        statement = (
+            update(Booking)
+            .where(
+                Booking.series_id == series_id,
+                Booking.status.in_(BOOKING_TRANSITIONS[BookingStatus.CANCELLED]),
+                Booking.start_time >= (from_time or datetime.utcnow()),
+            )
+            .values(**values)
+            .returning(Booking)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        bookings = (await db.scalars(statement)).all()
+        await FreeBusyIndex.index_bookings(db, bookings)
+        for booking in bookings:
+            OutboxService.record_booking_event(db, booking.id, BookingEvent.CANCELLED)
+        await db.commit()
+        await get_slot_cache().invalidate_dates(
+            series.specialist_id,
+            {day for booking in bookings for day in BookingService._booking_dates(booking)},
+        )
+        return sorted(bookings, key=lambda booking: booking.start_time)
+
+    @staticmethod
+    async def _find_unavailable(
+        db: AsyncSession,
+        specialist_id: int,
+        occurrences: List[Occurrence],
+        exclude_series_id: Optional[int] = None,
+    ) -> Dict[datetime, str]:
+        """Map each unavailable occurrence start to the reason it is rejected.
+
+        Loads the specialist's weekly windows and the active bookings spanning
+        the whole series with one query each, then checks occurrences in memory.
+        """
+        windows_result = await db.execute(
+            select(Availability.day_of_week, Availability.start_time, Availability.end_time)
+            .where(
+                and_(
+                    Availability.specialist_id == specialist_id,
+                    Availability.is_active.is_(True),
+                )
+            )
+        )
+        busy_query = select(Booking.start_time, Booking.end_time).where(
+            and_(
+                Booking.specialist_id == specialist_id,
+                Booking.status.in_(ACTIVE_BOOKING_STATUSES),
+                Booking.end_time > min(start for start, _ in occurrences),
+                Booking.start_time < max(end for _, end in occurrences),
+            )
+        )
+        if exclude_series_id is not None:
+            busy_query = busy_query.where(
+                (Booking.series_id.is_(None)) | (Booking.series_id != exclude_series_id)
+            )
+        busy_result = await db.execute(busy_query)
+
+        return BookingSeriesService._check_occurrences(
+            windows_result.all(), busy_result.all(), occurrences
+        )
+
+    @staticmethod
+    def _check_occurrences(
+        windows: Iterable[Tuple[str, time, time]],
+        busy: Iterable[Occurrence],
+        occurrences: List[Occurrence],
+    ) -> Dict[datetime, str]:
+        """Pure availability and overlap check behind _find_unavailable.
+
+        Busy intervals are merged with the slot engine's helpers, on integer
+        second offsets from the first occurrence.
+        """
+        windows_by_day: Dict[str, List[Tuple[time, time]]] = defaultdict(list)
+        for day_of_week, window_start, window_end in windows:
+            windows_by_day[day_of_week].append((window_start, window_end))
+
+        origin = min(start for start, _ in occurrences)
+
+        def offset(value: datetime) -> int:
+            return int((value - origin).total_seconds())
+
+        merged = merge_intervals((offset(start), offset(end)) for start, end in busy)
+        busy_ends = [end for _, end in merged]
+
+        days = list(DayOfWeek)
+        rejected: Dict[datetime, str] = {}
+        for start, end in occurrences:
+            day_windows = windows_by_day.get(days[start.weekday()].value, ())
+            if end.date() != start.date() or not any(
+                window_start <= start.time() and end.time() <= window_end
+                for window_start, window_end in day_windows
+            ):
+                rejected[start] = "is outside the specialist's availability"
+                continue
+            occurrence = (offset(start), offset(end))
+            # Free only if no busy interval cuts into it
+            if free_gaps(occurrence, merged, busy_ends) != [occurrence]:
+                rejected[start] = "conflicts with an existing booking"
+        return rejected
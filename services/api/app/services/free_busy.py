@@ -0,0 +1,201 @@
+"""
+Free/busy search index for cross-specialist availability lookups.
+
+Weekly availability is expanded into 15-minute buckets per weekday and active
+bookings into 15-minute buckets per calendar date. Availability and booking
+writes keep both tables up to date, so "who is free at this time" is a single
+gaps-and-islands query instead of one slot computation per specialist.
+"""
+
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import Integer, and_, cast, delete, exists, func, insert, literal, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.availability import Availability, DayOfWeek
+from app.models.booking import Booking, BookingStatus
+from app.models.free_busy import AvailabilityBucket, BookingBucket
+from app.models.specialist import Specialist
+from app.services.slots import SLOT_STEP_MINUTES, to_minutes
+
+
+BUCKET_MINUTES = SLOT_STEP_MINUTES
+ACTIVE_BOOKING_STATUSES = (BookingStatus.PENDING, BookingStatus.CONFIRMED)
+
+
+class FreeBusyIndex:
+    """Maintains and queries the bucketed free/busy index."""
+
+    @staticmethod
+    def availability_buckets(start_time: time, end_time: time) -> range:
+        """Buckets fully covered by an availability window."""
+        first = -(-to_minutes(start_time) // BUCKET_MINUTES) * BUCKET_MINUTES
+        return range(first, to_minutes(end_time) - BUCKET_MINUTES + 1, BUCKET_MINUTES)
+
+    @staticmethod
+    def booking_buckets(start_time: datetime, duration_minutes: int) -> List[Tuple[date, int]]:
+        """(date, bucket) pairs touched by a booking, split across midnight."""
+        end_time = start_time + timedelta(minutes=duration_minutes)
+        midnight = datetime.combine(start_time.date(), time.min)
+        minute = int((start_time - midnight).total_seconds() // 60)
+        current = midnight + timedelta(minutes=minute - minute % BUCKET_MINUTES)
+
+        buckets = []
+        while current < end_time:
+            buckets.append((current.date(), current.hour * 60 + current.minute))
+            current += timedelta(minutes=BUCKET_MINUTES)
+        return buckets
+
+    @staticmethod
+    async def index_availability(db: AsyncSession, specialist_id: int) -> None:
+        """Rebuild a specialist's weekly availability buckets (does not commit)."""
+        await db.execute(
+            delete(AvailabilityBucket).where(AvailabilityBucket.specialist_id == specialist_id)
+        )
+        result = await db.execute(
+            select(Availability.day_of_week, Availability.start_time, Availability.end_time)
+            .where(
+                and_(
+                    Availability.specialist_id == specialist_id,
+                    Availability.is_active.is_(True),
+                )
+            )
+        )
+        rows = {
+            (day_of_week, bucket)
+            for day_of_week, start_time, end_time in result.all()
+            for bucket in FreeBusyIndex.availability_buckets(start_time, end_time)
+        }
+        if rows:
+            await db.execute(
+                insert(AvailabilityBucket),
+                [
+                    {"specialist_id": specialist_id, "day_of_week": day_of_week, "bucket": bucket}
+                    for day_of_week, bucket in sorted(rows)
+                ],
+            )
+
+    @staticmethod
+    async def index_booking(db: AsyncSession, booking: Booking) -> None:
+        """Replace a booking's busy buckets; inactive bookings are removed (does not commit)."""
+        await FreeBusyIndex.index_bookings(db, [booking])
+
+    @staticmethod
+    async def index_bookings(db: AsyncSession, bookings: Iterable[Booking]) -> None:
+        """Replace busy buckets for several bookings at once (does not commit)."""
+        bookings = list(bookings)
+        if not bookings:
+            return
+        await db.execute(
+            delete(BookingBucket).where(BookingBucket.booking_id.in_([b.id for b in bookings]))
+        )
+        rows = [
+            {
+                "booking_id": booking.id,
+                "specialist_id": booking.specialist_id,
+                "slot_date": slot_date,
+                "bucket": bucket,
+            }
+            for booking in bookings
+            if booking.status in ACTIVE_BOOKING_STATUSES
+            for slot_date, bucket in FreeBusyIndex.booking_buckets(
+                booking.start_time, booking.duration_minutes
+            )
+        ]
+        if rows:
+            await db.execute(insert(BookingBucket), rows)
+
+    @staticmethod
+    async def rebuild(db: AsyncSession) -> None:
+        """Rebuild the whole index from availabilities and bookings, then commit."""
+        await db.execute(delete(BookingBucket))
+        specialist_ids = (await db.execute(select(Specialist.id))).scalars().all()
+        for specialist_id in specialist_ids:
+            await FreeBusyIndex.index_availability(db, specialist_id)
+
+        result = await db.execute(
+            select(Booking).where(Booking.status.in_(ACTIVE_BOOKING_STATUSES))
+        )
+        await FreeBusyIndex.index_bookings(db, result.scalars().all())
+        await db.commit()
+
+    @staticmethod
+    async def search_free_specialists(
+        db: AsyncSession,
+        target_date: date,
+        window_start: time,
+        window_end: time,
+        duration_minutes: int = 60,
+        specialization: Optional[str] = None,
+        limit: int = 50,
+    ) -> List[Tuple[int, datetime]]:
+        """Find available specialists with a free run of ``duration_minutes`` in a window.
+
+        Returns ``(specialist_id, earliest_start)`` pairs ordered by earliest start,
+        computed in a single query regardless of directory size.
+        """
+        needed = -(-duration_minutes // BUCKET_MINUTES)
+        day_of_week = list(DayOfWeek)[target_date.weekday()].value
+
+        conditions = [
+            AvailabilityBucket.day_of_week == day_of_week,
+            AvailabilityBucket.bucket >= to_minutes(window_start),
+            AvailabilityBucket.bucket <= to_minutes(window_end) - BUCKET_MINUTES,
+            Specialist.is_available.is_(True),
+            ~exists().where(
+                and_(
+                    BookingBucket.specialist_id == AvailabilityBucket.specialist_id,
+                    BookingBucket.slot_date == target_date,
+                    BookingBucket.bucket == AvailabilityBucket.bucket,
+                )
+            ),
+        ]
+        if specialization:
+            conditions.append(FreeBusyIndex._has_specialization(db, specialization))
+
+        free = (
+            select(
+                AvailabilityBucket.specialist_id,
+                AvailabilityBucket.bucket,
+                (
+                    AvailabilityBucket.bucket
+                    - literal(BUCKET_MINUTES, Integer) * func.row_number().over(
+                        partition_by=AvailabilityBucket.specialist_id,
+                        order_by=AvailabilityBucket.bucket,
+                    )
+                ).label("island"),
+            )
+            .join(Specialist, Specialist.id == AvailabilityBucket.specialist_id)
+            .where(and_(*conditions))
+            .cte("free")
+        )
+        runs = (
+            select(free.c.specialist_id, func.min(free.c.bucket).label("run_start"))
+            .group_by(free.c.specialist_id, free.c.island)
+            .having(func.count() >= needed)
+            .cte("runs")
+        )
+        earliest = func.min(runs.c.run_start).label("earliest")
+        query = (
+            select(runs.c.specialist_id, earliest)
+            .group_by(runs.c.specialist_id)
+            .order_by(earliest, runs.c.specialist_id)
+            .limit(limit)
+        )
+
+        midnight = datetime.combine(target_date, time.min)
+        result = await db.execute(query)
+        return [
+            (specialist_id, midnight + timedelta(minutes=bucket))
+            for specialist_id, bucket in result.all()
+        ]
+
+    @staticmethod
+    def _has_specialization(db: AsyncSession, specialization: str):
+        """Dialect-aware "JSON list contains value" predicate on Specialist.specializations."""
+        if db.get_bind().dialect.name == "postgresql":
+            return cast(Specialist.specializations, JSONB).contains([specialization])
+        values = func.json_each(Specialist.specializations).table_valued("value")
+        return exists().select_from(values).where(values.c.value == specialization)
@@ -0,0 +1,106 @@
+"""
+Idempotency key service: claim a client's key, store and look up its response.
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional, cast
+
+from sqlalchemy import and_, delete, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.idempotency_key import IdempotencyKey
+
+
+class IdempotencyService:
+    """Service class for idempotency keys."""
+
+    @staticmethod
+    async def claim(
+        db: AsyncSession, user_id: int, key: str, fingerprint: str, now: Optional[datetime] = None
+    ) -> Optional[int]:
+        """Claim ``key`` for a new request and commit; returns the claim id, or None if it is taken.
+
+        An expired key, or one whose request has been in flight longer than
+        IDEMPOTENCY_LOCK_SECONDS (its process died), is dropped and claimed afresh.
+        """
+        now = now or datetime.utcnow()
+        await db.execute(
+            delete(IdempotencyKey).where(
+                IdempotencyKey.user_id == user_id,
+                IdempotencyKey.key == key,
+                or_(
+                    IdempotencyKey.expires_at <= now,
+                    and_(
+                        IdempotencyKey.status_code.is_(None),
+                        IdempotencyKey.created_at <= now - timedelta(seconds=settings.idempotency_lock_seconds),
+                    ),
+                ),
+            )
+        )
+        dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+        claim_id = (
+            await db.execute(
+                dialect.insert(IdempotencyKey)
+                .values(
+                    user_id=user_id,
+                    key=key,
+                    fingerprint=fingerprint,
+                    created_at=now,
+                    expires_at=now + timedelta(seconds=settings.idempotency_ttl_seconds),
+                )
+                .on_conflict_do_nothing(index_elements=["user_id", "key"])
+                .returning(IdempotencyKey.id)
+            )
+        ).scalar_one_or_none()
+        await db.commit()
+        return claim_id
+
+    @staticmethod
+    async def get(db: AsyncSession, user_id: int, key: str) -> Optional[IdempotencyKey]:
+        """The live record for ``key``, in flight or completed."""
+        result = await db.execute(
+            select(IdempotencyKey)
+            .where(
+                IdempotencyKey.user_id == user_id,
+                IdempotencyKey.key == key,
+                IdempotencyKey.expires_at > datetime.utcnow(),
+            )
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def complete(
+        db: AsyncSession, claim_id: int, status_code: int, content_type: Optional[str], body: bytes
+    ) -> None:
+        """Store the response for a claimed key and commit."""
+        await db.execute(
+            update(IdempotencyKey)
+            .where(IdempotencyKey.id == claim_id)
+            .values(status_code=status_code, content_type=content_type, body=body)
+        )
+        await db.commit()
+
+    @staticmethod
+    async def release(db: AsyncSession, claim_id: int) -> None:
+        """Drop a claim whose request failed, so a retry runs it again, and commit."""
+        await db.execute(delete(IdempotencyKey).where(IdempotencyKey.id == claim_id))
+        await db.commit()
+
+    @staticmethod
+    async def purge_expired(db: AsyncSession, now: Optional[datetime] = None, batch_size: int = 1000) -> int:
+        """Delete expired keys one batch per transaction; returns how many were deleted."""
+        now = now or datetime.utcnow()
+        purged = 0
+        while True:
+            expired = select(IdempotencyKey.id).where(IdempotencyKey.expires_at <= now).limit(batch_size)
+            result = cast(
+                CursorResult, await db.execute(delete(IdempotencyKey).where(IdempotencyKey.id.in_(expired)))
+            )
+            await db.commit()
+            purged += result.rowcount
+            if result.rowcount < batch_size:
+                return purged
@@ -0,0 +1,38 @@
+"""
+Outbox service: record domain events inside the caller's transaction.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.jobs.definitions import BookingEvent, SessionEvent
+from app.models.outbox import OutboxEvent
+
+
+class OutboxService:
+    """Service class for the transactional outbox."""
+
+    @staticmethod
+    def record_booking_event(db: AsyncSession, booking_id: int, event: BookingEvent) -> None:
+        """Add a booking event to the current transaction (does not commit)."""
+        db.add(OutboxEvent(aggregate="booking", aggregate_id=booking_id, event=event.value))
+
+    @staticmethod
+    def record_session_event(db: AsyncSession, session_id: int, event: SessionEvent) -> None:
+        """Add a session event to the current transaction (does not commit)."""
+        db.add(OutboxEvent(aggregate="session", aggregate_id=session_id, event=event.value))
+
+    @staticmethod
+    async def backlog(db: AsyncSession, now: Optional[datetime] = None) -> dict:
+        """Unpublished event count and the age of the oldest one, in seconds."""
+        pending, oldest = (
+            await db.execute(
+                select(func.count(OutboxEvent.id), func.min(OutboxEvent.created_at))
+                .where(OutboxEvent.published_at.is_(None))
+            )
+        ).one()
+        lag = ((now or datetime.utcnow()) - oldest).total_seconds() if oldest else 0.0
+        return {"pending": pending, "oldest_pending_seconds": round(lag, 3)}
@@ -0,0 +1,82 @@
+"""
+Keyset (cursor) pagination helpers.
+
+Cursors are opaque URL-safe tokens encoding the (sort value, id) of the last
+row of a page. The next page seeks past that row with a row-value comparison,
+so it costs the same however deep the client has paged.
+"""
+
+import base64
+import json
+from datetime import datetime
+from functools import reduce
+from typing import Any, Optional, Sequence, Tuple
+
+from sqlalchemy import Select, tuple_
+from starlette.responses import Response
+
+Cursor = Tuple[datetime, int]
+
+
+def encode_cursor(sort_value: datetime, row_id: int) -> str:
+    payload = json.dumps([sort_value.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Cursor:
+    """Decode a cursor token, raising ValueError if it is malformed."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(sort_value), int(row_id)
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def paginate(
+    query: Select,
+    sort_column: Any,
+    id_column: Any,
+    skip: int,
+    limit: int,
+    cursor: Optional[str] = None,
+    descending: bool = False,
+) -> Select:
+    """Order by (sort_column, id_column) and page by cursor when given, else by offset."""
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+
+    if cursor is None:
+        return query.offset(skip).limit(limit)
+
+    sort_value, row_id = decode_cursor(cursor)
+    key = tuple_(sort_column, id_column)
+    seek = key < tuple_(sort_value, row_id) if descending else key > tuple_(sort_value, row_id)
+    return query.where(seek).limit(limit)
+
+
+def next_cursor(rows: Sequence[Any], limit: int, sort_attr: str, id_attr: str = "id") -> Optional[str]:
+    """Cursor for the page after ``rows``, or None when this page was the last.
+
+    Attributes may be dotted paths (``"booking.start_time"``) for rows paged on
+    a related row's keys.
+    """
+    if len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(_attr(last, sort_attr), _attr(last, id_attr))
+
+
+def set_next_cursor(
+    response: Response, rows: Sequence[Any], limit: int, sort_attr: str, id_attr: str = "id"
+) -> None:
+    """Expose the cursor for the following page in the X-Next-Cursor header, if any."""
+    token = next_cursor(rows, limit, sort_attr, id_attr)
+    if token:
+        response.headers["X-Next-Cursor"] = token
+
+
+def _attr(row: Any, path: str) -> Any:
+    return reduce(getattr, path.split("."), row)
@@ -0,0 +1,209 @@
+"""
+Per-process cache of user principals and specialist profiles.
+
+Entries are keyed by user id and hold detached snapshots (UserOut plus the
+SpecialistOut profile, if any), never ORM objects, so they are safe to share
+across sessions. Request authentication itself reads the signed access token;
+this cache serves the paths that still need the user's current state, such as
+token refresh and /specialists/me. Specialist writes invalidate the owner's
+entry after they commit and, when REDIS_URL is set, publish the user id so
+every other API worker drops its copy too. The TTL bounds staleness if a
+message is lost.
+"""
+
+import asyncio
+import logging
+import time as clock
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.specialist import Specialist
+from app.models.user import User
+from app.schemas.specialist import SpecialistOut
+from app.schemas.user import UserOut
+from app.security.tokens import Principal
+
+logger = logging.getLogger(__name__)
+
+# A miss costs one query (users LEFT JOIN specialists); each hit saves it
+QUERIES_PER_LOAD = 1
+
+
+@dataclass(frozen=True)
+class CachedPrincipal:
+    """A user and their specialist profile as of the last load."""
+    user: UserOut
+    specialist: Optional[SpecialistOut] = None
+
+    @property
+    def principal(self) -> Principal:
+        specialist_id = self.specialist.id if self.specialist else None
+        return Principal(id=self.user.id, role=self.user.role, specialist_id=specialist_id)
+
+
+class PrincipalCache:
+    """TTL'd LRU of CachedPrincipal by user id, with Redis pub/sub invalidation."""
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: float = 60,
+        redis=None,
+        channel: str = "principals:invalidate",
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.redis = redis
+        self.channel = channel
+        self.instance_id = uuid.uuid4().hex
+        self._entries: "OrderedDict[int, Tuple[float, CachedPrincipal]]" = OrderedDict()
+        # Bumped on every invalidation so a load that raced one is not cached
+        self._generation = 0
+        self._listener: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.remote_invalidations = 0
+
+    def get(self, user_id: int) -> Optional[CachedPrincipal]:
+        entry = self._entries.get(user_id)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > clock.monotonic():
+                self._entries.move_to_end(user_id)
+                self.hits += 1
+                return value
+            del self._entries[user_id]
+        self.misses += 1
+        return None
+
+    def set(self, user_id: int, value: CachedPrincipal, generation: Optional[int] = None) -> None:
+        """Store ``value``; skipped if an invalidation happened since ``generation``."""
+        if generation is not None and generation != self._generation:
+            return
+        self._entries[user_id] = (clock.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    async def invalidate(self, user_id: int) -> None:
+        """Drop a user's entry here and, via Redis, in every other worker."""
+        self._drop(user_id)
+        self.invalidations += 1
+        if self.redis is None:
+            return
+        try:
+            await self.redis.publish(self.channel, f"{self.instance_id}:{user_id}")
+        except Exception:
+            logger.warning("Principal cache invalidation publish failed", exc_info=True)
+
+    def start_listener(self) -> None:
+        """Subscribe to invalidations from other workers (no-op without Redis)."""
+        if self.redis is not None and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop_listener(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._generation += 1
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "remote_invalidations": self.remote_invalidations,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "queries_saved": self.hits * QUERIES_PER_LOAD,
+        }
+
+    def _drop(self, user_id: int) -> None:
+        self._entries.pop(user_id, None)
+        self._generation += 1
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    data = message["data"]
+                    sender, _, user_id = (data.decode() if isinstance(data, bytes) else data).partition(":")
+                    if sender != self.instance_id:
+                        self._drop(int(user_id))
+                        self.remote_invalidations += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Principal cache subscription failed; resubscribing", exc_info=True)
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+
+async def load_principal(db: AsyncSession, user_id: int) -> Optional[CachedPrincipal]:
+    """Cached user + specialist profile for ``user_id``; one query on a miss."""
+    cache = get_principal_cache()
+    cached = cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    generation = cache.generation
+    row = (
+        await db.execute(
+            select(User, Specialist)
+            .outerjoin(Specialist, Specialist.user_id == User.id)
+            .where(User.id == user_id)
+        )
+    ).one_or_none()
+    if row is None:
+        return None
+    value = CachedPrincipal(
+        user=UserOut.model_validate(row.User),
+        specialist=SpecialistOut.model_validate(row.Specialist) if row.Specialist else None,
+    )
+    cache.set(user_id, value, generation)
+    return value
+
+
+_principal_cache: Optional[PrincipalCache] = None
+
+
+def get_principal_cache() -> PrincipalCache:
+    """Process-wide principal cache, publishing invalidations when REDIS_URL is configured."""
+    global _principal_cache
+    if _principal_cache is None:
+        redis_client = None
+        if settings.redis_url:
+            from redis import asyncio as redis_asyncio
+
+            redis_client = redis_asyncio.from_url(settings.redis_url)
+        _principal_cache = PrincipalCache(
+            max_entries=settings.principal_cache_max_entries,
+            ttl_seconds=settings.principal_cache_ttl,
+            redis=redis_client,
+            channel=settings.principal_cache_channel,
+        )
+    return _principal_cache
@@ -6,11 +6,14 @@ from typing import List, Optional
 from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from app.db.loaders import defer_text, load_profile
+from app.jobs.definitions import SessionEvent
 from app.models.session import Session
 from app.models.booking import Booking, BookingStatus
 from app.schemas.session import SessionCreate, SessionUpdate
+from app.services.outbox import OutboxService
+from app.services.pagination import paginate
 
 
 class SessionService:
@@ -44,6 +47,8 @@ class SessionService:
         )
         
         db.add(session)
+        await db.flush()
+        OutboxService.record_session_event(db, session.id, SessionEvent.CREATED)
         await db.commit()
         await db.refresh(session)
         return session
@@ -53,13 +58,7 @@ class SessionService:
         """Get session by ID with related data."""
         result = await db.execute(
             select(Session)
-            .options(
-                selectinload(Session.booking)
-                .selectinload(Booking.patient),
-                selectinload(Session.booking)
-                .selectinload(Booking.specialist)
-                .selectinload(Booking.specialist.user)
-            )
+            .options(*load_profile("session.detail"))
             .where(Session.id == session_id)
         )
         return result.scalar_one_or_none()
@@ -71,13 +70,7 @@ class SessionService:
         """Get session by booking ID."""
         result = await db.execute(
             select(Session)
-            .options(
-                selectinload(Session.booking)
-                .selectinload(Booking.patient),
-                selectinload(Session.booking)
-                .selectinload(Booking.specialist)
-                .selectinload(Booking.specialist.user)
-            )
+            .options(*load_profile("session.detail"))
             .where(Session.booking_id == booking_id)
         )
         return result.scalar_one_or_none()
@@ -88,21 +81,27 @@ class SessionService:
         patient_id: UUID,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = None,
+        include_notes: bool = False,
     ) -> List[Session]:
-        """Get sessions for a specific patient."""
-        result = await db.execute(
+        """Get sessions for a specific patient, latest appointment first.
+
+        Pages by ``cursor`` (keyset) when given, otherwise by ``skip`` (offset).
+        Sessions are ordered and paged on their booking's (start_time, id), so
+        the patient's bookings index serves both the filter and the order.
+        Note columns are deferred unless ``include_notes`` is set.
+        """
+        query = (
             select(Session)
             .join(Booking)
-            .options(
-                selectinload(Session.booking)
-                .selectinload(Booking.specialist)
-                .selectinload(Booking.specialist.user)
-            )
+            .options(*load_profile("session.patient_list"))
             .where(Booking.patient_id == patient_id)
-            .offset(skip)
-            .limit(limit)
-            .order_by(Session.created_at.desc())
         )
+        if not include_notes:
+            query = query.options(*defer_text(Session))
+        query = paginate(query, Booking.start_time, Booking.id, skip, limit, cursor, descending=True)
+        
+        result = await db.execute(query)
         return result.scalars().all()
 
     @staticmethod
@@ -111,20 +110,27 @@ class SessionService:
         specialist_id: UUID,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = None,
+        include_notes: bool = False,
     ) -> List[Session]:
-        """Get sessions for a specific specialist."""
-        result = await db.execute(
+        """Get sessions for a specific specialist, latest appointment first.
+
+        Pages by ``cursor`` (keyset) when given, otherwise by ``skip`` (offset).
+        Sessions are ordered and paged on their booking's (start_time, id), so
+        the specialist's bookings index serves both the filter and the order.
+        Note columns are deferred unless ``include_notes`` is set.
+        """
+        query = (
             select(Session)
             .join(Booking)
-            .options(
-                selectinload(Session.booking)
-                .selectinload(Booking.patient)
-            )
+            .options(*load_profile("session.specialist_list"))
             .where(Booking.specialist_id == specialist_id)
-            .offset(skip)
-            .limit(limit)
-            .order_by(Session.created_at.desc())
         )
+        if not include_notes:
+            query = query.options(*defer_text(Session))
+        query = paginate(query, Booking.start_time, Booking.id, skip, limit, cursor, descending=True)
+        
+        result = await db.execute(query)
         return result.scalars().all()
 
     @staticmethod
@@ -132,7 +138,7 @@ class SessionService:
         db: AsyncSession, session_id: UUID, session_data: SessionUpdate
     ) -> Optional[Session]:
         """Update session information."""
-        session = await SessionService.get_session(db, session_id)
+        session = await db.get(Session, session_id)
         if not session:
             return None
 
@@ -140,6 +146,7 @@ class SessionService:
         for field, value in update_data.items():
             setattr(session, field, value)
 
+        OutboxService.record_session_event(db, session.id, SessionEvent.UPDATED)
         await db.commit()
         await db.refresh(session)
         return session
@@ -147,11 +154,12 @@ class SessionService:
     @staticmethod
     async def delete_session(db: AsyncSession, session_id: UUID) -> bool:
         """Delete session record."""
-        session = await SessionService.get_session(db, session_id)
+        session = await db.get(Session, session_id)
         if not session:
             return False
 
         await db.delete(session)
+        OutboxService.record_session_event(db, session_id, SessionEvent.DELETED)
         await db.commit()
         return True
 
@@ -160,11 +168,12 @@ class SessionService:
         db: AsyncSession, session_id: UUID, notes: str
     ) -> Optional[Session]:
         """Add or update session notes."""
-        session = await SessionService.get_session(db, session_id)
+        session = await db.get(Session, session_id)
         if not session:
             return None
 
         session.notes = notes
+        OutboxService.record_session_event(db, session.id, SessionEvent.UPDATED)
         await db.commit()
         await db.refresh(session)
         return session
@@ -174,11 +183,12 @@ class SessionService:
         db: AsyncSession, session_id: UUID, recording_url: str
     ) -> Optional[Session]:
         """Set the recording URL for a session."""
-        session = await SessionService.get_session(db, session_id)
+        session = await db.get(Session, session_id)
         if not session:
             return None
 
         session.recording_url = recording_url
+        OutboxService.record_session_event(db, session.id, SessionEvent.UPDATED)
         await db.commit()
         await db.refresh(session)
         return session
\ No newline at end of file
@@ -0,0 +1,306 @@
+"""
+Two-tier cache for computed available slots.
+
+Entries are keyed by (specialist_id, date, duration_minutes). The first tier is
+an in-process LRU; the optional second tier is Redis, shared by every API
+worker. Booking and availability writes invalidate exactly the affected
+specialist/date entries after they commit and, when REDIS_URL is set, publish
+the invalidation so every other API worker drops its LRU copies too.
+
+Each invalidation also bumps a per-specialist generation (locally and in
+Redis). Readers take the generation before computing slots and pass it to
+``set``, which skips the write if an invalidation happened in between, so a
+slot list computed before a booking committed is never cached after it.
+"""
+
+import asyncio
+import json
+import logging
+import time as clock
+import uuid
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from redis.exceptions import WatchError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[int, date, int]
+# (local generation, Redis generation or None if it could not be read)
+Generation = Tuple[int, Optional[int]]
+
+
+class SlotCache:
+    """LRU + optional Redis cache for AvailabilityService.get_available_slots."""
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        local_ttl_seconds: float = 30,
+        redis_ttl_seconds: int = 300,
+        redis=None,
+        prefix: str = "slots",
+        channel: str = "slots:invalidate",
+    ):
+        self.max_entries = max_entries
+        self.local_ttl_seconds = local_ttl_seconds
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self.redis = redis
+        self.prefix = prefix
+        self.channel = channel
+        self.instance_id = uuid.uuid4().hex
+        self._entries: "OrderedDict[CacheKey, Tuple[float, List[datetime]]]" = OrderedDict()
+        self._keys_by_specialist: Dict[int, Set[CacheKey]] = {}
+        self._generations: Dict[int, int] = {}
+        self._listener: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.remote_invalidations = 0
+        self.stale_writes_skipped = 0
+
+    async def get(self, specialist_id: int, target_date: date, duration_minutes: int) -> Optional[List[datetime]]:
+        key = (specialist_id, target_date, duration_minutes)
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > clock.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return list(value)
+            self._discard(key)
+
+        if self.redis is not None:
+            try:
+                raw = await self.redis.hget(self._redis_key(specialist_id, target_date), str(duration_minutes))
+            except Exception:
+                logger.warning("Slot cache Redis read failed", exc_info=True)
+                raw = None
+            if raw is not None:
+                value = [datetime.fromisoformat(item) for item in json.loads(raw)]
+                self._store(key, value)
+                self.redis_hits += 1
+                return list(value)
+
+        self.misses += 1
+        return None
+
+    async def generation(self, specialist_id: int) -> Generation:
+        """The specialist's current generation; take it before computing slots to ``set``."""
+        local = self._generations.get(specialist_id, 0)
+        if self.redis is None:
+            return local, None
+        try:
+            raw = await self.redis.get(self._generation_key(specialist_id))
+        except Exception:
+            logger.warning("Slot cache Redis generation read failed", exc_info=True)
+            return local, None
+        return local, int(raw or 0)
+
+    async def set(
+        self,
+        specialist_id: int,
+        target_date: date,
+        duration_minutes: int,
+        value: List[datetime],
+        generation: Optional[Generation] = None,
+    ) -> None:
+        """Store ``value``; skipped if the specialist was invalidated since ``generation``."""
+        if generation is not None and generation[0] != self._generations.get(specialist_id, 0):
+            self.stale_writes_skipped += 1
+            return
+        self._store((specialist_id, target_date, duration_minutes), list(value))
+        if self.redis is None or (generation is not None and generation[1] is None):
+            return
+        redis_key = self._redis_key(specialist_id, target_date)
+        dates_key = self._dates_key(specialist_id)
+        generation_key = self._generation_key(specialist_id)
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                # WATCH makes the write fail if an invalidation bumps the generation before EXEC
+                await pipe.watch(generation_key)
+                if generation is not None and int(await pipe.get(generation_key) or 0) != generation[1]:
+                    self._discard((specialist_id, target_date, duration_minutes))
+                    self.stale_writes_skipped += 1
+                    return
+                pipe.multi()
+                pipe.hset(redis_key, str(duration_minutes), json.dumps([slot.isoformat() for slot in value]))
+                pipe.expire(redis_key, self.redis_ttl_seconds)
+                pipe.sadd(dates_key, target_date.isoformat())
+                pipe.expire(dates_key, self.redis_ttl_seconds)
+                await pipe.execute()
+        except WatchError:
+            self._discard((specialist_id, target_date, duration_minutes))
+            self.stale_writes_skipped += 1
+        except Exception:
+            logger.warning("Slot cache Redis write failed", exc_info=True)
+
+    async def invalidate_dates(self, specialist_id: int, dates: Iterable[date]) -> None:
+        """Drop cached slots for the given dates of one specialist, here and in every other worker."""
+        dates = set(dates)
+        self._invalidate_local(specialist_id, lambda cached: cached in dates)
+        if self.redis is not None and dates:
+            await self._invalidate_redis(specialist_id, lambda cached: cached in dates, known_dates=dates)
+            await self._publish(specialist_id, dates=[cached.isoformat() for cached in dates])
+
+    async def invalidate_weekdays(self, specialist_id: int, weekdays: Iterable[int]) -> None:
+        """Drop cached slots on every date falling on the given weekdays (Monday == 0)."""
+        weekdays = set(weekdays)
+        self._invalidate_local(specialist_id, lambda cached: cached.weekday() in weekdays)
+        if self.redis is not None and weekdays:
+            await self._invalidate_redis(specialist_id, lambda cached: cached.weekday() in weekdays)
+            await self._publish(specialist_id, weekdays=sorted(weekdays))
+
+    async def invalidate_specialist(self, specialist_id: int) -> None:
+        """Drop every cached slot list for a specialist."""
+        await self.invalidate_weekdays(specialist_id, range(7))
+
+    def start_listener(self) -> None:
+        """Subscribe to invalidations from other workers (no-op without Redis)."""
+        if self.redis is not None and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop_listener(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_specialist.clear()
+        for specialist_id in self._generations:
+            self._generations[specialist_id] += 1
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.redis_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "remote_invalidations": self.remote_invalidations,
+            "stale_writes_skipped": self.stale_writes_skipped,
+            "hit_ratio": (self.hits + self.redis_hits) / lookups if lookups else 0.0,
+        }
+
+    def _store(self, key: CacheKey, value: List[datetime]) -> None:
+        self._entries[key] = (clock.monotonic() + self.local_ttl_seconds, value)
+        self._entries.move_to_end(key)
+        self._keys_by_specialist.setdefault(key[0], set()).add(key)
+        while len(self._entries) > self.max_entries:
+            oldest, _ = next(iter(self._entries.items()))
+            self._discard(oldest)
+
+    def _discard(self, key: CacheKey) -> None:
+        self._entries.pop(key, None)
+        keys = self._keys_by_specialist.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_specialist[key[0]]
+
+    def _invalidate_local(self, specialist_id: int, matches) -> None:
+        self._generations[specialist_id] = self._generations.get(specialist_id, 0) + 1
+        for key in list(self._keys_by_specialist.get(specialist_id, ())):
+            if matches(key[1]):
+                self._discard(key)
+                self.invalidations += 1
+
+    async def _invalidate_redis(self, specialist_id: int, matches, known_dates: Optional[Set[date]] = None) -> None:
+        dates_key = self._dates_key(specialist_id)
+        generation_key = self._generation_key(specialist_id)
+        try:
+            # Bump first, so a reader that computed before this point cannot write back
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.incr(generation_key)
+                pipe.expire(generation_key, self.redis_ttl_seconds)
+                await pipe.execute()
+            if known_dates is None:
+                members = await self.redis.smembers(dates_key)
+                known_dates = {
+                    date.fromisoformat(member.decode() if isinstance(member, bytes) else member)
+                    for member in members
+                }
+            stale = [cached for cached in known_dates if matches(cached)]
+            if stale:
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    pipe.delete(*(self._redis_key(specialist_id, cached) for cached in stale))
+                    pipe.srem(dates_key, *(cached.isoformat() for cached in stale))
+                    await pipe.execute()
+        except Exception:
+            logger.warning("Slot cache Redis invalidation failed", exc_info=True)
+
+    async def _publish(self, specialist_id: int, **matches) -> None:
+        message = {"sender": self.instance_id, "specialist_id": specialist_id, **matches}
+        try:
+            await self.redis.publish(self.channel, json.dumps(message))
+        except Exception:
+            logger.warning("Slot cache invalidation publish failed", exc_info=True)
+
+    def _apply_remote(self, message: dict) -> None:
+        if message.get("sender") == self.instance_id:
+            return
+        specialist_id = message["specialist_id"]
+        if "dates" in message:
+            dates = {date.fromisoformat(cached) for cached in message["dates"]}
+            self._invalidate_local(specialist_id, lambda cached: cached in dates)
+        else:
+            weekdays = set(message["weekdays"])
+            self._invalidate_local(specialist_id, lambda cached: cached.weekday() in weekdays)
+        self.remote_invalidations += 1
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self._apply_remote(json.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Slot cache subscription failed; resubscribing", exc_info=True)
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+    def _redis_key(self, specialist_id: int, target_date: date) -> str:
+        return f"{self.prefix}:{specialist_id}:{target_date.isoformat()}"
+
+    def _dates_key(self, specialist_id: int) -> str:
+        return f"{self.prefix}:{specialist_id}:dates"
+
+    def _generation_key(self, specialist_id: int) -> str:
+        return f"{self.prefix}:{specialist_id}:generation"
+
+
+_slot_cache: Optional[SlotCache] = None
+
+
+def get_slot_cache() -> SlotCache:
+    """Process-wide slot cache, with a Redis tier and pub/sub invalidation when REDIS_URL is configured."""
+    global _slot_cache
+    if _slot_cache is None:
+        redis_client = None
+        if settings.redis_url:
+            from redis import asyncio as redis_asyncio
+
+            redis_client = redis_asyncio.from_url(settings.redis_url)
+        _slot_cache = SlotCache(
+            max_entries=settings.slot_cache_max_entries,
+            local_ttl_seconds=settings.slot_cache_local_ttl,
+            redis_ttl_seconds=settings.slot_cache_redis_ttl,
+            redis=redis_client,
+            channel=settings.slot_cache_channel,
+        )
+    return _slot_cache
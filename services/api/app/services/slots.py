@@ -0,0 +1,91 @@
+"""
+Slot engine for computing bookable start times.
+
+All arithmetic is done on integer minute offsets from the start of a day so the
+hot loop never touches datetime objects. Busy intervals are merged once and
+subtracted from each availability window in a single linear sweep; slots are
+then stepped out of the remaining gaps on the window's own 15-minute grid.
+"""
+
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, List, Sequence, Tuple
+
+Interval = Tuple[int, int]
+
+SLOT_STEP_MINUTES = 15
+
+
+def to_minutes(value: time) -> int:
+    """Convert a time of day to minutes since midnight."""
+    return value.hour * 60 + value.minute
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    """Sort and merge overlapping or touching intervals."""
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def free_gaps(window: Interval, busy: Sequence[Interval], busy_ends: Sequence[int]) -> List[Interval]:
+    """Subtract merged busy intervals from a window, returning the free gaps.
+
+    ``busy_ends`` is the list of end offsets of ``busy`` and is used to jump
+    straight to the first busy interval that can touch the window.
+    """
+    window_start, window_end = window
+    gaps: List[Interval] = []
+    cursor = window_start
+    # Busy intervals ending at or before the window start can never overlap it,
+    # but a zero-length interval sitting exactly on it can't either, so skip both.
+    index = bisect_right(busy_ends, window_start)
+    while index < len(busy) and busy[index][0] < window_end:
+        busy_start, busy_end = busy[index]
+        if busy_start > cursor:
+            gaps.append((cursor, busy_start))
+        cursor = max(cursor, busy_end)
+        index += 1
+    if cursor <= window_end:
+        gaps.append((cursor, window_end))
+    return gaps
+
+
+def compute_slot_offsets(
+    windows: Iterable[Interval],
+    busy: Iterable[Interval],
+    duration_minutes: int,
+    step_minutes: int = SLOT_STEP_MINUTES,
+) -> List[int]:
+    """Return sorted slot start offsets that fit a window without touching busy time.
+
+    Slots are aligned to each window's start in ``step_minutes`` increments and a
+    slot may end exactly where a busy interval begins (and vice versa).
+    """
+    merged = merge_intervals(busy)
+    busy_ends = [end for _, end in merged]
+    offsets: List[int] = []
+
+    for window in windows:
+        window_start = window[0]
+        for gap_start, gap_end in free_gaps(window, merged, busy_ends):
+            # First grid point at or after the gap start
+            lag = (gap_start - window_start) % step_minutes
+            current = gap_start if lag == 0 else gap_start + step_minutes - lag
+            last_start = gap_end - duration_minutes
+            if current <= last_start:
+                offsets.extend(range(current, last_start + 1, step_minutes))
+
+    offsets.sort()
+    return offsets
+
+
+def offsets_to_datetimes(target_date: date, offsets: Iterable[int]) -> List[datetime]:
+    """Convert minute offsets back to datetimes on ``target_date``."""
+    midnight = datetime.combine(target_date, time.min)
+    return [midnight + timedelta(minutes=offset) for offset in offsets]
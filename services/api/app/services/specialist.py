@@ -6,11 +6,12 @@ from typing import List, Optional
 from uuid import UUID
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from app.db.loaders import load_profile
 from app.models.specialist import Specialist
 from app.models.user import User
 from app.schemas.specialist import SpecialistCreate, SpecialistUpdate
+from app.services.principal_cache import get_principal_cache
 
 
 class SpecialistService:
@@ -39,6 +40,7 @@ class SpecialistService:
         db.add(specialist)
         await db.commit()
         await db.refresh(specialist)
+        await get_principal_cache().invalidate(specialist.user_id)
         return specialist
 
     @staticmethod
@@ -46,7 +48,7 @@ class SpecialistService:
         """Get specialist by ID with user details."""
         result = await db.execute(
             select(Specialist)
-            .options(selectinload(Specialist.user))
+            .options(*load_profile("specialist.detail"))
             .where(Specialist.id == specialist_id)
         )
         return result.scalar_one_or_none()
@@ -56,7 +58,7 @@ class SpecialistService:
         """Get specialist by user ID."""
         result = await db.execute(
             select(Specialist)
-            .options(selectinload(Specialist.user))
+            .options(*load_profile("specialist.detail"))
             .where(Specialist.user_id == user_id)
         )
         return result.scalar_one_or_none()
@@ -70,7 +72,7 @@ class SpecialistService:
         specializations: Optional[List[str]] = None,
     ) -> List[Specialist]:
         """Get list of specialists with optional filtering."""
-        query = select(Specialist).options(selectinload(Specialist.user))
+        query = select(Specialist).options(*load_profile("specialist.list"))
         
         conditions = []
         if is_available is not None:
@@ -105,6 +107,7 @@ class SpecialistService:
 
         await db.commit()
         await db.refresh(specialist)
+        await get_principal_cache().invalidate(specialist.user_id)
         return specialist
 
     @staticmethod
@@ -114,8 +117,10 @@ class SpecialistService:
         if not specialist:
             return False
 
+        user_id = specialist.user_id
         await db.delete(specialist)
         await db.commit()
+        await get_principal_cache().invalidate(user_id)
         return True
 
     @staticmethod
@@ -130,4 +135,5 @@ class SpecialistService:
         specialist.is_available = is_available
         await db.commit()
         await db.refresh(specialist)
+        await get_principal_cache().invalidate(specialist.user_id)
         return specialist
\ No newline at end of file
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark booking conflict detection as a specialist's history grows.
+
+Compares the previous approach (load every active booking, check overlap in
+Python) with the SQL overlap predicate on the indexed end_time column.
+
+Usage (from services/api):
+    python scripts/bench_booking_conflicts.py --sizes 1000 10000 100000
+    ASYNC_DATABASE_URL=postgresql+asyncpg://... python scripts/bench_booking_conflicts.py
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time as timer
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import and_, delete, insert, select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+from app.models import Booking, BookingStatus, Specialist, User  # noqa: E402
+from app.services.booking import BookingService  # noqa: E402
+
+ACTIVE = [BookingStatus.PENDING, BookingStatus.CONFIRMED]
+
+
+async def legacy_conflicts(db, specialist_id, start_time, end_time):
+    result = await db.execute(
+        select(Booking).where(and_(Booking.specialist_id == specialist_id, Booking.status.in_(ACTIVE)))
+    )
+    return [
+        booking for booking in result.scalars().all()
+        if start_time < booking.start_time + timedelta(minutes=booking.duration_minutes)
+        and end_time > booking.start_time
+    ]
+
+
+async def seed(db, specialist_id, patient_id, count):
+    await db.execute(delete(Booking))
+    first = datetime(2020, 1, 1, 9)
+    rows = []
+    for index in range(count):
+        start = first + timedelta(hours=2 * index)
+        rows.append({
+            "patient_id": patient_id,
+            "specialist_id": specialist_id,
+            "start_time": start,
+            "end_time": start + timedelta(minutes=60),
+            "duration_minutes": 60,
+            "status": BookingStatus.CONFIRMED,
+        })
+    for offset in range(0, count, 5000):
+        await db.execute(insert(Booking), rows[offset:offset + 5000])
+    await db.commit()
+    return first + timedelta(hours=2 * count)
+
+
+async def measure(func, db, specialist_id, start, repeats):
+    started = timer.perf_counter()
+    for _ in range(repeats):
+        db.expunge_all()
+        await func(db, specialist_id, start, start + timedelta(minutes=60))
+    return (timer.perf_counter() - started) / repeats
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    default_path = os.path.join(tempfile.gettempdir(), "bench_conflicts.db")
+    url = os.environ.get("ASYNC_DATABASE_URL", f"sqlite+aiosqlite:///{default_path}")
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as db:
+        user = User(email="bench@example.com", password_hash="x")
+        specialist = Specialist(user=user, specializations=[])
+        db.add(specialist)
+        await db.commit()
+
+        print(f"{'history':>10} {'legacy ms':>12} {'sql ms':>10}")
+        for size in args.sizes:
+            probe = await seed(db, specialist.id, user.id, size)
+            legacy = await measure(legacy_conflicts, db, specialist.id, probe, args.repeats)
+            indexed = await measure(BookingService._check_booking_conflicts, db, specialist.id, probe, args.repeats)
+            print(f"{size:>10} {legacy * 1000:>12.2f} {indexed * 1000:>10.3f}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
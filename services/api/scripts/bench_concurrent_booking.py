@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Fire parallel bookings at one specialist and report winners and throughput.
+
+Two rounds: every request targets the same slot (exactly one must win), then
+every request targets a distinct slot (all must win) to show the per-specialist
+lock doesn't collapse throughput.
+
+Usage (from services/api):
+    python scripts/bench_concurrent_booking.py --requests 300
+    ASYNC_DATABASE_URL=postgresql+asyncpg://... python scripts/bench_concurrent_booking.py
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time as timer
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+from app.models import Specialist, User  # noqa: E402
+from app.schemas.booking import BookingCreate  # noqa: E402
+from app.services.booking import BookingService  # noqa: E402
+
+
+async def fire(SessionLocal, payloads, patient_id):
+    async def attempt(payload):
+        async with SessionLocal() as db:
+            try:
+                await BookingService.create_booking(db, payload, patient_id)
+                return True
+            except ValueError:
+                return False
+
+    started = timer.perf_counter()
+    outcomes = await asyncio.gather(*(attempt(payload) for payload in payloads))
+    return sum(outcomes), len(payloads) / (timer.perf_counter() - started)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=300)
+    args = parser.parse_args()
+
+    default_path = os.path.join(tempfile.gettempdir(), "bench_concurrent_booking.db")
+    url = os.environ.get("ASYNC_DATABASE_URL", f"sqlite+aiosqlite:///{default_path}")
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    SessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with SessionLocal() as db:
+        user = User(email="bench@example.com", password_hash="x")
+        specialist = Specialist(user=user, specializations=[])
+        db.add(specialist)
+        await db.commit()
+        patient_id, specialist_id = user.id, specialist.id
+
+    hot = datetime(2030, 1, 7, 9)
+    same_slot = [BookingCreate(specialist_id=specialist_id, start_time=hot)] * args.requests
+    winners, rate = await fire(SessionLocal, same_slot, patient_id)
+    print(f"same slot:      {winners} winner(s) of {args.requests}, {rate:8.1f} req/s")
+    assert winners == 1
+
+    distinct = [
+        BookingCreate(specialist_id=specialist_id, start_time=hot + timedelta(hours=index + 1))
+        for index in range(args.requests)
+    ]
+    winners, rate = await fire(SessionLocal, distinct, patient_id)
+    print(f"distinct slots: {winners} winner(s) of {args.requests}, {rate:8.1f} req/s")
+    assert winners == args.requests
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
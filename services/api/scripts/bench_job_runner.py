@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Compare job throughput of the forking RQ Worker and the asyncio job runner.
+
+Starts fakeredis as a local TCP Redis stand-in and a temporary SQLite database,
+enqueues I/O-bound jobs (a simulated provider call plus one database query)
+and drains the queues in burst mode with each worker kind in turn.
+
+Usage (from services/api):
+    python scripts/bench_job_runner.py --jobs 300 --io-ms 20 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time as timer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import redis  # noqa: E402
+from fakeredis import TcpFakeServer  # noqa: E402
+from rq import Queue, Worker  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+from app.jobs.context import job_session, use_session_maker  # noqa: E402
+from app.jobs.definitions import JobQueue  # noqa: E402
+from app.jobs.runner import AsyncJobRunner  # noqa: E402
+from app.db.session import dispose_engine, get_session_maker  # noqa: E402
+
+
+class LocalRedis(TcpFakeServer):
+    """fakeredis over TCP with Nagle off, so pipelined replies are not held back ~40 ms."""
+
+    def get_request(self):
+        sock, address = super().get_request()
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock, address
+
+
+async def io_job(io_ms: int) -> int:
+    """Stand-in for a notification send followed by a status write."""
+    await asyncio.sleep(io_ms / 1000)
+    async with job_session() as db:
+        return (await db.execute(text("SELECT 1"))).scalar_one()
+
+
+def enqueue(connection, jobs: int, io_ms: int) -> None:
+    queue = Queue(JobQueue.DEFAULT.value, connection=connection)
+    for _ in range(jobs):
+        # By module path: workers cannot import functions from __main__
+        queue.enqueue("bench_job_runner.io_job", io_ms)
+
+
+def run_forking(connection, jobs: int, io_ms: int) -> float:
+    enqueue(connection, jobs, io_ms)
+    worker = Worker([Queue(name.value, connection=connection) for name in JobQueue], connection=connection)
+    started = timer.perf_counter()
+    worker.work(burst=True)
+    return timer.perf_counter() - started
+
+
+async def run_async(connection, jobs: int, io_ms: int, concurrency: int) -> float:
+    enqueue(connection, jobs, io_ms)
+    use_session_maker(get_session_maker())
+    # fakeredis has no Lua, which RQ's scheduler locks need; nothing is scheduled here anyway
+    runner = AsyncJobRunner(connection, {name: concurrency for name in JobQueue}, scheduler_interval=None)
+    started = timer.perf_counter()
+    await runner.run(burst=True)
+    elapsed = timer.perf_counter() - started
+    use_session_maker(None)
+    await dispose_engine()
+    assert runner.finished == jobs, runner.stats()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=300)
+    parser.add_argument("--io-ms", type=int, default=20, help="simulated I/O wait per job")
+    parser.add_argument("--concurrency", type=int, default=50, help="async runner jobs in flight")
+    parser.add_argument("--port", type=int, default=16379)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.gettempdir(), 'bench_job_runner.db')}"
+    server = LocalRedis(("127.0.0.1", args.port), server_type="redis")
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    connection = redis.Redis(port=args.port)
+
+    print(f"{args.jobs} jobs, {args.io_ms} ms simulated I/O + 1 query each\n")
+    print(f"{'worker':32} {'seconds':>8} {'jobs/s':>8}")
+    elapsed = run_forking(connection, args.jobs, args.io_ms)
+    print(f"{'forking RQ Worker':32} {elapsed:>8.2f} {args.jobs / elapsed:>8.1f}")
+    elapsed = asyncio.run(run_async(connection, args.jobs, args.io_ms, args.concurrency))
+    label = f"async runner ({args.concurrency} concurrent)"
+    print(f"{label:32} {elapsed:>8.2f} {args.jobs / elapsed:>8.1f}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Measure bytes transferred per list call with and without ``include=notes``.
+
+Seeds one patient/specialist pair with bookings and sessions carrying long
+notes, then calls the four list endpoints in-process. For each call it reports
+the response body size and the bytes the database returned (re-running every
+captured SELECT and summing the size of each fetched value).
+
+Usage (from services/api):
+    python scripts/bench_list_payloads.py --rows 100 --notes-bytes 4000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx  # noqa: E402
+from sqlalchemy import event, insert  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+from app.db.session import get_session  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Booking, BookingStatus, Session, Specialist, User  # noqa: E402
+from app.security.auth import get_current_specialist, get_current_user  # noqa: E402
+
+ENDPOINTS = (
+    "/api/v1/bookings/my-bookings",
+    "/api/v1/bookings/specialist-bookings",
+    "/api/v1/sessions/my-sessions",
+    "/api/v1/sessions/specialist-sessions",
+)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--notes-bytes", type=int, default=4000)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.gettempdir(), "bench_list_payloads.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    captured = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    SessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with SessionLocal() as db:
+        patient = User(email="bench@example.com", password_hash="x")
+        specialist = Specialist(user=User(email="s@example.com", password_hash="x"), specializations=[])
+        db.add_all([patient, specialist])
+        await db.commit()
+
+        notes = "n" * args.notes_bytes
+        first = datetime(2025, 1, 6, 9)
+        await db.execute(insert(Booking), [
+            {
+                "patient_id": patient.id,
+                "specialist_id": specialist.id,
+                "start_time": first + timedelta(days=index),
+                "end_time": first + timedelta(days=index, minutes=60),
+                "duration_minutes": 60,
+                "status": BookingStatus.COMPLETED,
+                "notes": notes,
+                "cancellation_reason": None,
+            }
+            for index in range(args.rows)
+        ])
+        await db.execute(insert(Session), [
+            {"booking_id": index + 1, "notes": notes, "session_summary": notes}
+            for index in range(args.rows)
+        ])
+        await db.commit()
+
+    async def scoped_db():
+        async with SessionLocal() as db:
+            yield db
+
+    app.dependency_overrides[get_session] = scoped_db
+    app.dependency_overrides[get_current_user] = lambda: patient
+    app.dependency_overrides[get_current_specialist] = lambda: specialist
+
+    print(f"{args.rows} rows per page, {args.notes_bytes} bytes per note column\n")
+    print(f"{'endpoint':40} {'include':>8} {'response B':>12} {'db B':>12}")
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for endpoint in ENDPOINTS:
+            for include in (None, "notes"):
+                captured.clear()
+                params = {"limit": args.rows}
+                if include:
+                    params["include"] = include
+                response = await client.get(endpoint, params=params)
+                response.raise_for_status()
+                db_bytes = await fetched_bytes(engine, list(captured))
+                print(f"{endpoint:40} {include or '-':>8} {len(response.content):>12,} {db_bytes:>12,}")
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+async def fetched_bytes(engine, statements) -> int:
+    total = 0
+    async with engine.connect() as conn:
+        for statement, parameters in statements:
+            result = await conn.exec_driver_sql(statement, parameters)
+            total += sum(len(str(value).encode()) for row in result.all() for value in row if value is not None)
+    return total
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
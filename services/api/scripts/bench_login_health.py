@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark /api/v1/health latency while login traffic runs in parallel.
+
+Runs the app in-process against a temporary SQLite database. Several clients
+log in back to back while a probe calls /api/v1/health every few
+milliseconds; the probe's p50/p99 latency is reported with bcrypt inline on
+the event loop (the old behaviour) and on the bounded password pool.
+
+Usage (from services/api):
+    python scripts/bench_login_health.py --logins 8 --seconds 5 --workers 4
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time as timer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+from app.db.session import get_session  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import User  # noqa: E402
+from app.security import password  # noqa: E402
+
+PASSWORD = "bench-password"
+
+
+async def run(client, logins: int, seconds: float):
+    deadline = timer.perf_counter() + seconds
+    outcomes = {"ok": 0, "503": 0}
+    latencies = []
+
+    async def login_loop():
+        while timer.perf_counter() < deadline:
+            response = await client.post("/auth/login", json={"email": "bench@example.com", "password": PASSWORD})
+            outcomes["ok" if response.status_code == 200 else str(response.status_code)] += 1
+
+    async def probe():
+        while timer.perf_counter() < deadline:
+            started = timer.perf_counter()
+            await client.get("/api/v1/health")
+            latencies.append((timer.perf_counter() - started) * 1000)
+            await asyncio.sleep(0.005)
+
+    await asyncio.gather(probe(), *(login_loop() for _ in range(logins)))
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return statistics.median(latencies), p99, outcomes
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=8, help="concurrent login clients")
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--max-queue", type=int, default=32)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.gettempdir(), "bench_login_health.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    SessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with SessionLocal() as db:
+        db.add(User(email="bench@example.com", password_hash=password.hash_password(PASSWORD)))
+        await db.commit()
+
+    async def scoped_db():
+        async with SessionLocal() as db:
+            yield db
+
+    app.dependency_overrides[get_session] = scoped_db
+    transport = httpx.ASGITransport(app=app)
+    print(f"{args.logins} concurrent login clients for {args.seconds:.0f}s\n")
+    print(f"{'mode':28} {'health p50 ms':>14} {'health p99 ms':>14} {'logins':>8} {'503s':>6}")
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+        for label, workers in (("inline on event loop", 0), (f"pool ({args.workers} workers)", args.workers)):
+            password._password_hasher = password.PasswordHasher(workers=workers, max_queue=args.max_queue)
+            p50, p99, outcomes = await run(client, args.logins, args.seconds)
+            password.shutdown_password_hasher()
+            print(f"{label:28} {p50:>14.1f} {p99:>14.1f} {outcomes['ok']:>8} {outcomes['503']:>6}")
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark page 1 versus page 500 latency for offset and cursor pagination.
+
+Seeds one patient with enough bookings for 500 pages and times
+BookingService.get_bookings_for_patient in both modes.
+
+Usage (from services/api):
+    python scripts/bench_pagination.py --page-size 100 --pages 500
+    ASYNC_DATABASE_URL=postgresql+asyncpg://... python scripts/bench_pagination.py
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time as timer
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import insert, select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+from app.models import Booking, BookingStatus, Specialist, User  # noqa: E402
+from app.services.booking import BookingService  # noqa: E402
+from app.services.pagination import encode_cursor  # noqa: E402
+
+
+async def timed(db, repeats, **kwargs):
+    started = timer.perf_counter()
+    for _ in range(repeats):
+        db.expunge_all()
+        await BookingService.get_bookings_for_patient(db, **kwargs)
+    return (timer.perf_counter() - started) / repeats * 1000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    default_path = os.path.join(tempfile.gettempdir(), "bench_pagination.db")
+    url = os.environ.get("ASYNC_DATABASE_URL", f"sqlite+aiosqlite:///{default_path}")
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as db:
+        patient = User(email="bench@example.com", password_hash="x")
+        specialist = Specialist(user=User(email="s@example.com", password_hash="x"), specializations=[])
+        db.add_all([patient, specialist])
+        await db.commit()
+
+        total = args.page_size * args.pages
+        first = datetime(2015, 1, 1, 9)
+        rows = [
+            {
+                "patient_id": patient.id,
+                "specialist_id": specialist.id,
+                "start_time": first + timedelta(hours=index),
+                "end_time": first + timedelta(hours=index, minutes=60),
+                "duration_minutes": 60,
+                "status": BookingStatus.COMPLETED,
+            }
+            for index in range(total)
+        ]
+        for offset in range(0, total, 5000):
+            await db.execute(insert(Booking), rows[offset:offset + 5000])
+        await db.commit()
+
+        # Cursor pointing at the last row of page (pages - 1), i.e. the start of the final page
+        skip = args.page_size * (args.pages - 1)
+        last_start, last_id = (
+            await db.execute(
+                select(Booking.start_time, Booking.id)
+                .where(Booking.patient_id == patient.id)
+                .order_by(Booking.start_time.desc(), Booking.id.desc())
+                .offset(skip - 1)
+                .limit(1)
+            )
+        ).one()
+        cursor = encode_cursor(last_start, last_id)
+
+        common = {"patient_id": patient.id, "limit": args.page_size}
+        print(f"{total} bookings, page size {args.page_size}")
+        print(f"offset page 1:          {await timed(db, args.repeats, skip=0, **common):8.2f} ms")
+        print(f"offset page {args.pages}:        {await timed(db, args.repeats, skip=skip, **common):8.2f} ms")
+        print(f"cursor page 1:          {await timed(db, args.repeats, cursor=None, **common):8.2f} ms")
+        print(f"cursor page {args.pages}:        {await timed(db, args.repeats, cursor=cursor, **common):8.2f} ms")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark the slot engine against the original datetime overlap scan.
+
+Simulates a busy week: several availability windows per day and a booking in
+most of the hourly slots, computing 15-minute-grid slots for every day.
+
+Usage (from services/api):
+    python scripts/bench_slots.py --rounds 50
+"""
+
+import argparse
+import os
+import random
+import sys
+import time as timer
+from datetime import date, datetime, time, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services import slots  # noqa: E402
+
+
+def legacy_slots(target_date, windows, bookings, duration_minutes):
+    """Original AvailabilityService.get_available_slots inner loop."""
+    available_slots = []
+    for window_start, window_end in windows:
+        slot_start = datetime.combine(target_date, window_start)
+        slot_end = datetime.combine(target_date, window_end)
+        current_slot = slot_start
+        while current_slot + timedelta(minutes=duration_minutes) <= slot_end:
+            slot_finish = current_slot + timedelta(minutes=duration_minutes)
+            is_conflicted = any(
+                current_slot < start + timedelta(minutes=length) and start < slot_finish
+                for start, length in bookings
+            )
+            if not is_conflicted:
+                available_slots.append(current_slot)
+            current_slot += timedelta(minutes=15)
+    return sorted(available_slots)
+
+
+def engine_slots(target_date, windows, bookings, duration_minutes):
+    day_start = datetime.combine(target_date, time.min)
+    minute_windows = [(slots.to_minutes(start), slots.to_minutes(end)) for start, end in windows]
+    busy = []
+    for start, length in bookings:
+        offset = int((start - day_start).total_seconds() // 60)
+        busy.append((offset, offset + length))
+    return slots.offsets_to_datetimes(
+        target_date, slots.compute_slot_offsets(minute_windows, busy, duration_minutes)
+    )
+
+
+def build_week(rng):
+    week = []
+    monday = date(2025, 1, 6)
+    windows = [(time(7), time(12)), (time(12, 30), time(17)), (time(17, 30), time(21))]
+    for offset in range(7):
+        day = monday + timedelta(days=offset)
+        bookings = []
+        for hour in range(7, 21):
+            for quarter in (0, 30):
+                if rng.random() < 0.6:
+                    bookings.append((datetime.combine(day, time(hour, quarter)), rng.choice([30, 45, 60])))
+        week.append((day, windows, bookings))
+    return week
+
+
+def measure(func, week, rounds, duration):
+    started = timer.perf_counter()
+    for _ in range(rounds):
+        for day, windows, bookings in week:
+            func(day, windows, bookings, duration)
+    return (timer.perf_counter() - started) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--duration", type=int, default=60)
+    args = parser.parse_args()
+
+    week = build_week(random.Random(42))
+    for day, windows, bookings in week:
+        expected = legacy_slots(day, windows, bookings, args.duration)
+        assert engine_slots(day, windows, bookings, args.duration) == expected, day
+
+    legacy = measure(legacy_slots, week, args.rounds, args.duration)
+    engine = measure(engine_slots, week, args.rounds, args.duration)
+    bookings = sum(len(b) for _, _, b in week)
+    print(f"busy week: {bookings} bookings across 7 days")
+    print(f"legacy scan:  {legacy * 1000:8.3f} ms/week")
+    print(f"slot engine:  {engine * 1000:8.3f} ms/week")
+    print(f"speedup:      {legacy / engine:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
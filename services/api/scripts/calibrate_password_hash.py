@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Pick a bcrypt cost for this host and report the cost of stored password hashes.
+
+Times bcrypt at increasing costs and recommends the highest one whose median
+hash time stays within the latency budget; set it as BCRYPT_ROUNDS. Stored
+hashes below that policy are upgraded the next time their owner logs in.
+With --report, also counts users.password_hash by scheme/cost against the
+current BCRYPT_ROUNDS. Run it on production hardware. Usage (from services/api):
+    python scripts/calibrate_password_hash.py --target-ms 250 --report
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import select  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.db.session import dispose_engine, get_session_maker  # noqa: E402
+from app.models import User  # noqa: E402
+from app.security.password import calibrate_bcrypt_rounds, cost_distribution  # noqa: E402
+
+
+async def report() -> None:
+    async with get_session_maker()() as session:
+        hashes = (await session.scalars(select(User.password_hash))).all()
+    await dispose_engine()
+    distribution = cost_distribution(hashes)
+    total = sum(count for count, _ in distribution.values())
+    print(f"\nStored hashes ({total} users, policy bcrypt/{settings.bcrypt_rounds}):")
+    print(f"{'cost':14} {'users':>8} {'share':>7}  status")
+    for label, (count, stale) in distribution.items():
+        share = count / total * 100
+        if label == "unknown":
+            status = "unrecognised scheme, cannot log in"
+        else:
+            status = "rehash on next login" if stale else "ok"
+        print(f"{label:14} {count:>8} {share:>6.1f}%  {status}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--target-ms", type=float, default=250, help="latency budget per hash")
+    parser.add_argument("--min-rounds", type=int, default=10)
+    parser.add_argument("--max-rounds", type=int, default=16)
+    parser.add_argument("--samples", type=int, default=3)
+    parser.add_argument("--report", action="store_true", help="also report stored hash costs")
+    args = parser.parse_args()
+
+    rounds, timings = calibrate_bcrypt_rounds(args.target_ms, args.min_rounds, args.max_rounds, args.samples)
+    print(f"{'rounds':>6} {'median ms':>10}")
+    for cost, ms in timings.items():
+        print(f"{cost:>6} {ms:>10.1f}{'  <- over budget' if ms > args.target_ms else ''}")
+    if timings[rounds] > args.target_ms:
+        print(f"\nEven {rounds} rounds exceeds {args.target_ms:.0f} ms; not recommending less than that")
+    print(f"\nBCRYPT_ROUNDS={rounds}  (currently {settings.bcrypt_rounds})")
+
+    if args.report:
+        asyncio.run(report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Rebuild the free/busy search index from availabilities and active bookings.
+
+Run once after applying the 7b2e4f9a1c3d migration, or whenever the index is
+suspected to have drifted. Usage (from services/api):
+    python scripts/rebuild_free_busy_index.py
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.db.session import get_session_maker, dispose_engine  # noqa: E402
+from app.services.free_busy import FreeBusyIndex  # noqa: E402
+
+
+async def main() -> None:
+    async with get_session_maker()() as session:
+        await FreeBusyIndex.rebuild(session)
+    await dispose_engine()
+    print("Free/busy index rebuilt")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
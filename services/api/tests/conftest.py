@@ -0,0 +1,142 @@
+from datetime import datetime
+
+import httpx
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.db.base import Base
+from app.db.session import get_session
+from app.jobs.testing import JobHarness
+from app.main import app as api_app
+import app.models  # noqa: F401  (register all mappers)
+from app.models import Booking, BookingStatus, Session, Specialist, User
+from app.schemas.booking import BookingCreate
+from app.services.booking import BookingService
+from app.services.principal_cache import get_principal_cache
+from app.services.slot_cache import get_slot_cache
+
+
+@pytest_asyncio.fixture
+async def db():
+    get_slot_cache().clear()
+    get_principal_cache().clear()
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def queries(db):
+    """SQL statements executed on ``db``'s engine while the test runs."""
+    statements = []
+    engine = db.get_bind()
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest_asyncio.fixture
+async def api(db):
+    """HTTP client for the app, sharing the test's database session."""
+    async def current_db():
+        yield db
+
+    api_app.dependency_overrides[get_session] = current_db
+    transport = httpx.ASGITransport(app=api_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+    api_app.dependency_overrides.clear()
+
+
+@pytest_asyncio.fixture
+async def jobs(db):
+    """Capture enqueued jobs in fakeredis; ``await jobs.run_all()`` runs them against ``db``."""
+    session_maker = async_sessionmaker(db.bind, class_=AsyncSession, expire_on_commit=False)
+    with JobHarness(session_maker) as harness:
+        yield harness
+
+
+@pytest_asyncio.fixture
+async def make_specialist(db):
+    """``await make_specialist(email=...)`` adds a specialist and returns (its user, the specialist).
+
+    Pass ``session`` to add it through a session other than ``db``.
+    """
+    async def make(email="s@example.com", session=None):
+        session = session or db
+        user = User(email=email, password_hash="x")
+        specialist = Specialist(user=user, specializations=[])
+        session.add(specialist)
+        await session.commit()
+        return user, specialist
+
+    return make
+
+
+@pytest_asyncio.fixture
+async def make_booking(db, make_specialist):
+    """``await make_booking()`` adds a patient's pending hour-long booking; returns (booking, specialist)."""
+    async def make(start_time=datetime(2025, 1, 6, 9)):
+        patient = User(email="p@example.com", password_hash="x")
+        db.add(patient)
+        _, specialist = await make_specialist()
+        return await BookingService.create_booking(
+            db, BookingCreate(specialist_id=specialist.id, start_time=start_time, duration_minutes=60), patient.id
+        ), specialist
+
+    return make
+
+
+class BookingFactory:
+    """``await booking_for(start_time)`` adds a confirmed booking and returns it.
+
+    Every booking is between one patient and one specialist, added on first use
+    and kept on ``patient`` and ``specialist``. ``session_status`` also adds the
+    booking's session in that status.
+    """
+
+    def __init__(self, db, make_specialist):
+        self.db = db
+        self.make_specialist = make_specialist
+        self.patient = self.specialist = None
+
+    async def participants(self, session=None):
+        """(patient, specialist), added to ``db`` once; a ``session`` gets a fresh pair."""
+        if session is None and self.specialist is not None:
+            return self.patient, self.specialist
+        session = session or self.db
+        patient = User(email="p@example.com", password_hash="x")
+        session.add(patient)
+        _, specialist = await self.make_specialist(session=session)
+        if session is self.db:
+            self.patient, self.specialist = patient, specialist
+        return patient, specialist
+
+    async def __call__(self, start_time, status=BookingStatus.CONFIRMED, session_status=None):
+        patient, specialist = await self.participants()
+        booking = Booking(patient_id=patient.id, specialist_id=specialist.id, start_time=start_time, status=status)
+        self.db.add(booking)
+        await self.db.flush()
+        if session_status is not None:
+            self.db.add(Session(booking_id=booking.id, status=session_status))
+        await self.db.commit()
+        return booking
+
+
+@pytest_asyncio.fixture
+async def booking_for(db, make_specialist):
+    """Confirmed-booking factory; see BookingFactory."""
+    return BookingFactory(db, make_specialist)
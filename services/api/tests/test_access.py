@@ -0,0 +1,56 @@
+from datetime import datetime
+
+import pytest
+
+from app.models import Booking, BookingStatus, Session, User
+from app.schemas.session import SessionUpdate
+from app.security.access import AccessRole, get_booking_access, get_session_access
+from app.services.session import SessionService
+
+NINE = datetime(2025, 1, 6, 9)
+
+
+async def make_session(db, make_specialist):
+    patient = User(email="p@example.com", password_hash="x")
+    specialist_user, specialist = await make_specialist()
+    booking = Booking(patient=patient, specialist=specialist, start_time=NINE,
+                      status=BookingStatus.CONFIRMED)
+    record = Session(booking=booking)
+    db.add(record)
+    await db.commit()
+    return patient, specialist_user, booking, record
+
+
+@pytest.mark.asyncio
+async def test_access_roles_come_from_one_query(db, queries, make_specialist):
+    patient, specialist_user, booking, record = await make_session(db, make_specialist)
+    queries.clear()
+
+    access = await get_session_access(db, record.id, specialist_user.id)
+    assert len(queries) == 1
+    assert access.roles == {AccessRole.SPECIALIST}
+    assert access.session is record and access.booking is booking
+    assert access.allows() and not access.allows(AccessRole.PATIENT)
+
+    patient_access = await get_booking_access(db, booking.id, patient.id)
+    assert patient_access.roles == {AccessRole.PATIENT}
+    assert patient_access.session is record
+
+    stranger = await get_booking_access(db, booking.id, 999)
+    assert not stranger.allows()
+    assert await get_session_access(db, 999, patient.id) is None
+
+
+@pytest.mark.asyncio
+async def test_services_reuse_rows_loaded_by_the_access_check(db, queries, make_specialist):
+    _, specialist_user, _, record = await make_session(db, make_specialist)
+    db.expunge_all()
+    queries.clear()
+
+    access = await get_session_access(db, record.id, specialist_user.id)
+    updated = await SessionService.update_session(db, access.session.id, SessionUpdate(notes="ok"))
+
+    assert updated.notes == "ok"
+    selects = [q for q in queries if q.lstrip().upper().startswith("SELECT")]
+    # The access check, then only the post-commit refresh
+    assert len(selects) == 2
@@ -0,0 +1,86 @@
+import pytest
+from jose import jwt
+from passlib.hash import bcrypt
+
+from app.core.config import settings
+from app.models import User
+from app.security.password import hash_password
+from app.security.tokens import Principal, create_access_token, create_refresh_token
+
+PASSWORD = "S3cureP@ssw0rd!"
+
+
+async def make_user(db, email="p@example.com"):
+    user = User(email=email, password_hash=hash_password(PASSWORD))
+    db.add(user)
+    await db.commit()
+    return user
+
+
+def bearer(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.mark.asyncio
+async def test_login_issues_tokens_and_requests_skip_the_database(db, api, queries):
+    user = await make_user(db)
+
+    login = await api.post("/auth/login", json={"email": user.email, "password": PASSWORD})
+    assert login.status_code == 200
+    body = login.json()
+    assert body["user"]["id"] == user.id and body["token_type"] == "bearer"
+    claims = jwt.get_unverified_claims(body["access_token"])
+    assert (claims["sub"], claims["role"], claims["sid"]) == (str(user.id), "patient", None)
+
+    queries.clear()
+    response = await api.get("/api/v1/bookings/my-bookings", headers=bearer(body["access_token"]))
+    assert response.status_code == 200
+    assert not any("FROM users" in q or "FROM specialists" in q for q in queries)
+
+    specialist_only = await api.get("/api/v1/bookings/specialist-bookings", headers=bearer(body["access_token"]))
+    assert specialist_only.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_invalid_tokens_are_rejected(db, api):
+    user = await make_user(db)
+    principal = Principal(id=user.id, role="patient")
+    forged = jwt.encode({"sub": str(user.id), "role": "patient", "type": "access"}, "not-the-secret")
+    url = "/api/v1/bookings/my-bookings"
+
+    assert (await api.get(url)).status_code == 401
+    assert (await api.get(url, headers=bearer(forged))).status_code == 401
+    assert (await api.get(url, headers=bearer(create_refresh_token(user.id)))).status_code == 401
+    assert (await api.get(url, headers=bearer(create_access_token(principal, expires_minutes=-1)))).status_code == 401
+    assert (await api.post("/auth/login", json={"email": user.email, "password": "wrong"})).status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_refresh_picks_up_a_new_specialist_profile(db, api):
+    user = await make_user(db)
+    tokens = (await api.post("/auth/login", json={"email": user.email, "password": PASSWORD})).json()
+
+    created = await api.post(
+        "/api/v1/specialists", json={"specializations": ["grief"]}, headers=bearer(tokens["access_token"])
+    )
+    assert created.status_code == 201
+
+    refreshed = await api.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert refreshed.status_code == 200
+    assert jwt.get_unverified_claims(refreshed.json()["access_token"])["sid"] == created.json()["id"]
+
+    rejected = await api.post("/auth/refresh", json={"refresh_token": tokens["access_token"]})
+    assert rejected.status_code == 401
+    assert settings.access_token_expires_min * 60 == refreshed.json()["expires_in"]
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_passwords_below_cost_policy(db, api):
+    user = User(email="old@example.com", password_hash=bcrypt.using(rounds=4).hash(PASSWORD))
+    db.add(user)
+    await db.commit()
+
+    assert (await api.post("/auth/login", json={"email": user.email, "password": PASSWORD})).status_code == 200
+    await db.refresh(user)
+    assert user.password_hash.startswith(f"$2b${settings.bcrypt_rounds:02d}$")
+    assert (await api.post("/auth/login", json={"email": user.email, "password": PASSWORD})).status_code == 200
@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models import Booking, BookingStatus
+from app.schemas.booking import BookingCreate, BookingUpdate
+from app.services.booking import BookingService
+
+NINE = datetime(2025, 1, 6, 9)
+
+
+@pytest.mark.asyncio
+async def test_end_time_is_maintained_on_flush(db, make_specialist):
+    patient, specialist = await make_specialist()
+    booking = await BookingService.create_booking(
+        db, BookingCreate(specialist_id=specialist.id, start_time=NINE, duration_minutes=45), patient.id
+    )
+    assert booking.end_time == NINE + timedelta(minutes=45)
+
+    await BookingService.update_booking(db, booking.id, BookingUpdate(duration_minutes=90))
+    assert booking.end_time == NINE + timedelta(minutes=90)
+
+
+@pytest.mark.asyncio
+async def test_conflict_check_uses_half_open_ranges(db, make_specialist):
+    patient, specialist = await make_specialist()
+    db.add_all([
+        Booking(patient=patient, specialist=specialist, start_time=NINE, status=BookingStatus.CONFIRMED),
+        Booking(patient=patient, specialist=specialist, start_time=NINE + timedelta(hours=3),
+                status=BookingStatus.CANCELLED),
+    ])
+    await db.commit()
+
+    check = BookingService._check_booking_conflicts
+    assert len(await check(db, specialist.id, NINE + timedelta(minutes=30), NINE + timedelta(minutes=90))) == 1
+    assert await check(db, specialist.id, NINE + timedelta(hours=1), NINE + timedelta(hours=2)) == []
+    assert await check(db, specialist.id, NINE - timedelta(hours=1), NINE) == []
+    assert await check(db, specialist.id, NINE + timedelta(hours=3), NINE + timedelta(hours=4)) == []
+
+
+@pytest.mark.asyncio
+async def test_transitions_are_conditional_on_state_and_owner(db, make_specialist):
+    patient, specialist = await make_specialist()
+    _, other = await make_specialist(email="other@example.com")
+    booking = await BookingService.create_booking(
+        db, BookingCreate(specialist_id=specialist.id, start_time=NINE), patient.id
+    )
+
+    with pytest.raises(PermissionError):
+        await BookingService.confirm_booking(db, booking.id, actor_specialist_id=other.id)
+    with pytest.raises(ValueError, match="Can only complete confirmed bookings"):
+        await BookingService.complete_booking(db, booking.id, actor_specialist_id=specialist.id)
+    assert await BookingService.confirm_booking(db, 999, actor_specialist_id=specialist.id) is None
+
+    confirmed = await BookingService.confirm_booking(db, booking.id, actor_specialist_id=specialist.id)
+    assert confirmed.status == BookingStatus.CONFIRMED
+
+    cancelled = await BookingService.cancel_booking(
+        db, booking.id, actor_user_id=specialist.user_id, cancellation_reason="sick"
+    )
+    assert (cancelled.status, cancelled.cancellation_reason) == (BookingStatus.CANCELLED, "sick")
+    with pytest.raises(ValueError, match="Cannot cancel booking with status"):
+        await BookingService.cancel_booking(db, booking.id, actor_user_id=patient.id)
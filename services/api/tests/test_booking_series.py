@@ -0,0 +1,90 @@
+from datetime import datetime, time, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models import Availability, Booking, BookingStatus
+from app.schemas.booking import BookingCreate, BookingSeriesCreate, BookingSeriesUpdate
+from app.services.booking import BookingService
+from app.services.booking_series import BookingSeriesService
+
+# A Tuesday
+TUESDAY_TEN = datetime(2025, 1, 7, 10)
+
+
+async def make_weekly_specialist(db, make_specialist):
+    patient, specialist = await make_specialist()
+    db.add(Availability(specialist_id=specialist.id, day_of_week="tuesday",
+                        start_time=time(9), end_time=time(17)))
+    await db.commit()
+    return patient, specialist
+
+
+def series_data(specialist_id, **overrides):
+    values = {"specialist_id": specialist_id, "start_time": TUESDAY_TEN, "occurrences": 12}
+    values.update(overrides)
+    return BookingSeriesCreate(**values)
+
+
+@pytest.mark.asyncio
+async def test_create_series_inserts_every_occurrence(db, make_specialist):
+    patient, specialist = await make_weekly_specialist(db, make_specialist)
+
+    series, skipped = await BookingSeriesService.create_series(db, series_data(specialist.id), patient.id)
+
+    assert skipped == []
+    assert [b.start_time for b in series.bookings] == [
+        TUESDAY_TEN + timedelta(weeks=week) for week in range(12)
+    ]
+    assert all(b.end_time == b.start_time + timedelta(hours=1) for b in series.bookings)
+    assert {b.series_id for b in series.bookings} == {series.id}
+
+
+@pytest.mark.asyncio
+async def test_series_is_all_or_nothing_unless_skipping_conflicts(db, make_specialist):
+    patient, specialist = await make_weekly_specialist(db, make_specialist)
+    patient_id, specialist_id = patient.id, specialist.id
+    await BookingService.create_booking(
+        db, BookingCreate(specialist_id=specialist_id, start_time=TUESDAY_TEN + timedelta(weeks=3, minutes=30)),
+        patient_id,
+    )
+
+    with pytest.raises(ValueError, match="conflicts with an existing booking"):
+        await BookingSeriesService.create_series(db, series_data(specialist_id), patient_id)
+    assert await db.scalar(select(func.count()).select_from(Booking)) == 1
+
+    with pytest.raises(ValueError, match="outside the specialist's availability"):
+        await BookingSeriesService.create_series(
+            db, series_data(specialist_id, start_time=TUESDAY_TEN + timedelta(hours=7)), patient_id
+        )
+
+    series, skipped = await BookingSeriesService.create_series(
+        db, series_data(specialist_id, skip_conflicts=True), patient_id
+    )
+    assert skipped == [TUESDAY_TEN + timedelta(weeks=3)]
+    assert len(series.bookings) == 11
+
+
+@pytest.mark.asyncio
+async def test_update_and_cancel_apply_to_upcoming_occurrences(db, make_specialist):
+    patient, specialist = await make_weekly_specialist(db, make_specialist)
+    series, _ = await BookingSeriesService.create_series(
+        db, series_data(specialist.id, occurrences=4), patient.id
+    )
+    from_time = TUESDAY_TEN + timedelta(weeks=1)
+
+    updated = await BookingSeriesService.update_series(
+        db, series.id, BookingSeriesUpdate(duration_minutes=90, notes="longer"), from_time=from_time
+    )
+    assert [(b.duration_minutes, b.notes) for b in updated] == [(90, "longer")] * 3
+    assert updated[0].end_time == from_time + timedelta(minutes=90)
+
+    with pytest.raises(PermissionError):
+        await BookingSeriesService.cancel_series(db, series.id, actor_user_id=999)
+
+    cancelled = await BookingSeriesService.cancel_series(
+        db, series.id, actor_user_id=patient.id, cancellation_reason="moving", from_time=from_time
+    )
+    assert [b.status for b in cancelled] == [BookingStatus.CANCELLED] * 3
+    statuses = await db.scalars(select(Booking.status).order_by(Booking.start_time))
+    assert list(statuses) == [BookingStatus.PENDING] + [BookingStatus.CANCELLED] * 3
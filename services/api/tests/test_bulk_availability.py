@@ -0,0 +1,44 @@
+from datetime import time
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models import Availability, Specialist, User
+from app.schemas.availability import AvailabilityCreate
+from app.services.availability import AvailabilityService
+
+
+def slot(day, start, end):
+    return AvailabilityCreate(day_of_week=day, start_time=time(start), end_time=time(end))
+
+
+def test_find_bulk_conflict_sweeps_new_and_existing_windows():
+    existing = [("monday", time(9), time(12)), ("monday", time(10), time(11))]
+    find = AvailabilityService._find_bulk_conflict
+
+    assert find(existing, [slot("monday", 12, 13), slot("tuesday", 9, 12)]) is None
+    assert find(existing, [slot("monday", 13, 14), slot("monday", 11, 13)]).start_time == time(11)
+    # New windows are checked against each other as well
+    new = [slot("friday", 9, 11), slot("friday", 13, 15), slot("friday", 10, 12)]
+    assert find([], new) is new[2]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_is_atomic(db):
+    user = User(email="b@example.com", password_hash="x")
+    specialist = Specialist(user=user, specializations=[])
+    db.add(specialist)
+    await db.commit()
+
+    created = await AvailabilityService.bulk_create_availability(
+        db, specialist.id, [slot("monday", 9, 12), slot("tuesday", 9, 12)]
+    )
+    assert [a.day_of_week for a in created] == ["monday", "tuesday"]
+    assert all(a.id and a.created_at for a in created)
+
+    with pytest.raises(ValueError):
+        await AvailabilityService.bulk_create_availability(
+            db, specialist.id, [slot("wednesday", 9, 12), slot("monday", 11, 13)]
+        )
+    count = await db.scalar(select(func.count()).select_from(Availability))
+    assert count == 2
@@ -0,0 +1,44 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.db.base import Base
+from app.models import Booking, Specialist, User
+from app.schemas.booking import BookingCreate
+from app.services.booking import BookingService
+
+
+@pytest.mark.asyncio
+async def test_parallel_bookings_for_one_slot_have_a_single_winner(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'race.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    SessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with SessionLocal() as db:
+        user = User(email="p@example.com", password_hash="x")
+        specialist = Specialist(user=user, specializations=[])
+        db.add(specialist)
+        await db.commit()
+        patient_id, specialist_id = user.id, specialist.id
+
+    payload = BookingCreate(specialist_id=specialist_id, start_time=datetime(2025, 1, 6, 9))
+
+    async def attempt():
+        async with SessionLocal() as db:
+            try:
+                await BookingService.create_booking(db, payload, patient_id)
+                return "booked"
+            except ValueError:
+                return "rejected"
+
+    outcomes = await asyncio.gather(*(attempt() for _ in range(200)))
+
+    assert outcomes.count("booked") == 1
+    assert outcomes.count("rejected") == 199
+    async with SessionLocal() as db:
+        assert await db.scalar(select(func.count()).select_from(Booking)) == 1
+    await engine.dispose()
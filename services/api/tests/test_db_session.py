@@ -0,0 +1,20 @@
+import asyncio
+
+from app.db import session as db_session
+
+
+def test_engine_is_shared_and_disposed():
+    engine = db_session.init_engine()
+    assert db_session.get_engine() is engine
+    assert db_session.get_session_maker() is db_session.get_session_maker()
+
+    asyncio.run(db_session.dispose_engine())
+    assert db_session.get_engine() is not engine
+    asyncio.run(db_session.dispose_engine())
+
+
+def test_engine_options_skip_pool_sizing_for_sqlite():
+    assert "pool_size" not in db_session.get_engine_options("sqlite+aiosqlite:///./test.db")
+    options = db_session.get_engine_options("postgresql+asyncpg://u:p@localhost/db")
+    assert options["pool_size"] == db_session.settings.db_pool_size
+    assert options["max_overflow"] == db_session.settings.db_max_overflow
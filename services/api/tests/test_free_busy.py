@@ -0,0 +1,60 @@
+from datetime import date, datetime, time
+
+import pytest
+
+from app.models import Specialist, User
+from app.schemas.availability import AvailabilityCreate
+from app.schemas.booking import BookingCreate
+from app.services.availability import AvailabilityService
+from app.services.booking import BookingService
+from app.services.free_busy import FreeBusyIndex
+
+TUESDAY = date(2025, 1, 7)
+
+
+async def make_specialist(db, email, specializations):
+    user = User(email=email, password_hash="x")
+    specialist = Specialist(user=user, specializations=specializations)
+    db.add(specialist)
+    await db.commit()
+    await AvailabilityService.create_availability(
+        db,
+        AvailabilityCreate(day_of_week="tuesday", start_time=time(13), end_time=time(17)),
+        specialist.id,
+    )
+    return user, specialist
+
+
+def test_bucket_expansion():
+    assert list(FreeBusyIndex.availability_buckets(time(9, 5), time(10))) == [555, 570, 585]
+    assert FreeBusyIndex.booking_buckets(datetime(2025, 1, 6, 23, 40), 30) == [
+        (date(2025, 1, 6), 1410),
+        (date(2025, 1, 6), 1425),
+        (date(2025, 1, 7), 0),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search_tracks_availability_and_booking_writes(db):
+    patient, anxiety = await make_specialist(db, "a@example.com", ["anxiety"])
+    _, grief = await make_specialist(db, "g@example.com", ["grief"])
+
+    # Book 14:00-17:00 on the anxiety specialist, leaving only 13:00-14:00 free
+    booking = await BookingService.create_booking(
+        db,
+        BookingCreate(specialist_id=anxiety.id, start_time=datetime(2025, 1, 7, 14), duration_minutes=180),
+        patient.id,
+    )
+
+    search = FreeBusyIndex.search_free_specialists
+    assert await search(db, TUESDAY, time(14), time(17)) == [(grief.id, datetime(2025, 1, 7, 14))]
+    assert await search(db, TUESDAY, time(13), time(17), specialization="anxiety") == [
+        (anxiety.id, datetime(2025, 1, 7, 13))
+    ]
+    assert await search(db, TUESDAY, time(13), time(17), duration_minutes=90, specialization="anxiety") == []
+
+    await BookingService.cancel_booking(db, booking.id)
+    assert [row[0] for row in await search(db, TUESDAY, time(14), time(17))] == [anxiety.id, grief.id]
+
+    await AvailabilityService.clear_specialist_availability(db, grief.id)
+    assert [row[0] for row in await search(db, TUESDAY, time(14), time(17))] == [anxiety.id]
@@ -0,0 +1,111 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.db.base import Base
+from app.db.session import get_session
+from app.main import app as api_app
+from app.models import Booking, IdempotencyKey, User
+from app.security.tokens import Principal, create_access_token
+from app.services.idempotency import IdempotencyService
+
+NINE = datetime(2025, 1, 6, 9)
+BOOKING = {"start_time": NINE.isoformat(), "duration_minutes": 60}
+
+
+def headers(user_id, key):
+    token = create_access_token(Principal(id=user_id, role="patient"))
+    return {"Authorization": f"Bearer {token}", "Idempotency-Key": key}
+
+
+async def booking_count(db):
+    return (await db.execute(select(func.count(Booking.id)))).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_retry_replays_the_stored_response_without_touching_bookings(db, api, queries, make_specialist):
+    user, specialist = await make_specialist()
+    user_id, payload = user.id, {**BOOKING, "specialist_id": specialist.id}
+
+    first = await api.post("/api/v1/bookings", json=payload, headers=headers(user_id, "k-1"))
+    queries.clear()
+    retry = await api.post("/api/v1/bookings", json=payload, headers=headers(user_id, "k-1"))
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.json() == first.json() and retry.headers["Idempotent-Replayed"] == "true"
+    assert not any("bookings" in statement for statement in queries)
+    assert await booking_count(db) == 1
+
+    # Without the header (or with a new key) the request runs again and hits the conflict check
+    again = await api.post("/api/v1/bookings", json=payload, headers=headers(user_id, "k-2"))
+    assert again.status_code == 400 and "Idempotent-Replayed" not in again.headers
+
+
+@pytest.mark.asyncio
+async def test_keys_are_per_user_and_bound_to_the_request(db, api, make_specialist):
+    user, specialist = await make_specialist()
+    other = User(email="o@example.com", password_hash="x")
+    db.add(other)
+    await db.commit()
+    user_id, other_id, specialist_id = user.id, other.id, specialist.id
+    payload = {**BOOKING, "specialist_id": specialist_id}
+
+    assert (await api.post("/api/v1/bookings", json=payload, headers=headers(user_id, "k"))).status_code == 201
+    reused = await api.post(
+        "/api/v1/bookings", json={**payload, "duration_minutes": 30}, headers=headers(user_id, "k")
+    )
+    assert reused.status_code == 422
+    # Another user's identical key is unrelated: it runs and is refused by the conflict check
+    assert (await api.post("/api/v1/bookings", json=payload, headers=headers(other_id, "k"))).status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicates_wait_for_the_request_in_flight(booking_for, tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'idempotency.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with sessions() as db:
+        user, specialist = await booking_for.participants(db)
+        user_id, payload = user.id, {**BOOKING, "specialist_id": specialist.id}
+
+    async def own_session():
+        async with sessions() as session:
+            yield session
+
+    api_app.dependency_overrides[get_session] = own_session
+    try:
+        transport = httpx.ASGITransport(app=api_app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = await asyncio.gather(*(
+                client.post("/api/v1/bookings", json=payload, headers=headers(user_id, "k")) for _ in range(3)
+            ))
+        async with sessions() as db:
+            assert await booking_count(db) == 1
+    finally:
+        api_app.dependency_overrides.clear()
+        await engine.dispose()
+
+    assert [response.status_code for response in responses] == [201, 201, 201]
+    assert len({response.json()["id"] for response in responses}) == 1
+    assert sum("Idempotent-Replayed" in response.headers for response in responses) == 2
+
+
+@pytest.mark.asyncio
+async def test_abandoned_and_expired_claims_can_be_claimed_again(db, make_specialist):
+    user, _ = await make_specialist()
+    now = datetime(2025, 1, 6, 12)
+    first = await IdempotencyService.claim(db, user.id, "k", "a" * 64, now=now)
+
+    assert await IdempotencyService.claim(db, user.id, "k", "a" * 64, now=now + timedelta(seconds=5)) is None
+    # Still unfinished after IDEMPOTENCY_LOCK_SECONDS: its request is presumed dead
+    retaken = await IdempotencyService.claim(db, user.id, "k", "a" * 64, now=now + timedelta(minutes=5))
+    assert first is not None and retaken is not None
+
+    await IdempotencyService.complete(db, retaken, 201, "application/json", b"{}")
+    assert await IdempotencyService.purge_expired(db, now=now + timedelta(days=2)) == 1
+    assert (await db.execute(select(IdempotencyKey))).first() is None
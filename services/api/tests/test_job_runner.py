@@ -0,0 +1,116 @@
+import asyncio
+import time
+from datetime import datetime
+
+import fakeredis
+import pytest
+from rq import Queue, Retry
+from rq.job import JobStatus
+
+from app.jobs.definitions import JobQueue
+from app.jobs.runner import AsyncJobRunner
+from app.schemas.booking import BookingCreate
+from app.services.booking import BookingService
+
+running = {"now": 0, "peak": 0}
+
+
+async def slow_job(value):
+    running["now"] += 1
+    running["peak"] = max(running["peak"], running["now"])
+    await asyncio.sleep(0.01)
+    running["now"] -= 1
+    return value * 2
+
+
+def failing_job():
+    raise RuntimeError("provider down")
+
+
+def runner_for(connection, **concurrency):
+    limits = {JobQueue(name): limit for name, limit in concurrency.items()}
+    return AsyncJobRunner(connection, limits, scheduler_interval=None, cleanup_interval=None)
+
+
+async def registry_probe():
+    await asyncio.sleep(0.05)
+
+
+@pytest.mark.asyncio
+async def test_runs_jobs_concurrently_within_the_queue_cap():
+    connection = fakeredis.FakeStrictRedis()
+    queue = Queue("default", connection=connection)
+    jobs = [queue.enqueue(slow_job, value) for value in range(12)]
+    running["peak"] = 0
+
+    runner = runner_for(connection, default=4)
+    await runner.run(burst=True)
+
+    assert runner.stats()["finished"] == 12 and running["peak"] == 4
+    assert [job.return_value(refresh=True) for job in jobs] == [value * 2 for value in range(12)]
+    assert jobs[0].get_status(refresh=True) == JobStatus.FINISHED
+
+
+@pytest.mark.asyncio
+async def test_failed_jobs_are_retried_then_recorded():
+    connection = fakeredis.FakeStrictRedis()
+    queue = Queue("low", connection=connection)
+    job = queue.enqueue(failing_job, retry=Retry(max=1))
+
+    runner = runner_for(connection, low=1)
+    await runner.run(burst=True)
+
+    assert runner.stats()["failed"] == 2
+    assert job.get_status(refresh=True) == JobStatus.FAILED
+    assert job.id in queue.failed_job_registry.get_job_ids()
+
+
+@pytest.mark.asyncio
+async def test_running_jobs_are_tracked_in_the_started_registry():
+    connection = fakeredis.FakeStrictRedis()
+    queue = Queue("default", connection=connection)
+    job = queue.enqueue(registry_probe)
+
+    runner = runner_for(connection, default=1)
+    run = asyncio.create_task(runner.run(burst=True))
+    await asyncio.sleep(0.02)
+    assert queue.started_job_registry.get_job_ids() == [job.id]
+    await run
+
+    assert queue.started_job_registry.get_job_ids() == []
+    assert job.get_status(refresh=True) == JobStatus.FINISHED
+
+
+@pytest.mark.asyncio
+async def test_jobs_abandoned_by_a_killed_runner_are_retried_by_registry_cleanup():
+    connection = fakeredis.FakeStrictRedis()
+    queue = Queue("default", connection=connection)
+    job = queue.enqueue(slow_job, 1, retry=Retry(max=1))
+
+    # Started but never finished or heartbeated again, as after SIGKILL
+    runner = runner_for(connection, default=1)
+    queue.dequeue_any([queue], None, connection=connection)
+    runner._mark_started(job, queue)
+    assert queue.started_job_registry.get_job_ids() == [job.id]
+
+    queue.started_job_registry.cleanup(timestamp=time.time() + runner._heartbeat_ttl + 1)
+
+    assert queue.started_job_registry.get_job_ids() == []
+    assert job.get_status(refresh=True) == JobStatus.QUEUED
+    assert job.id in queue.get_job_ids()
+
+
+@pytest.mark.asyncio
+async def test_runs_jobs_enqueued_by_the_api_on_the_shared_engine(db, jobs, booking_for):
+    patient, specialist = await booking_for.participants()
+    await BookingService.create_booking(
+        db, BookingCreate(specialist_id=specialist.id, start_time=datetime(2025, 1, 6, 9)), patient.id
+    )
+    await jobs.relay()
+    notify, calendar = jobs.queued()
+
+    runner = runner_for(jobs.connection, high=8, default=8)
+    await runner.run(burst=True)
+
+    assert notify.return_value(refresh=True)["recipients"] == ["p@example.com", "s@example.com"]
+    assert calendar.return_value(refresh=True)["status"] == "TENTATIVE"
@@ -0,0 +1,48 @@
+import pytest
+
+from app.jobs.definitions import NOTIFY_BOOKING
+from app.jobs.queue import enqueue
+from app.schemas.booking import BookingUpdate
+from app.services.booking import BookingService
+
+
+@pytest.mark.asyncio
+async def test_booking_changes_queue_side_effects_by_priority(db, jobs, make_booking):
+    booking, specialist = await make_booking()
+    await BookingService.update_booking(db, booking.id, BookingUpdate(notes="no time change"))
+    await BookingService.confirm_booking(db, booking.id, actor_specialist_id=specialist.id)
+
+    assert jobs.queued() == []  # nothing reaches Redis until the outbox relay runs
+    assert await jobs.relay() == 2
+    assert [(job.origin, job.kwargs["event"]) for job in jobs.queued()] == [
+        ("high", "created"),
+        ("high", "confirmed"),
+        ("default", "created"),
+        ("default", "confirmed"),
+    ]
+
+    ran = await jobs.run_all()
+    assert [func.rsplit(".", 1)[1] for func, _, _ in ran] == [
+        "notify_booking", "notify_booking", "sync_booking_calendar", "sync_booking_calendar",
+    ]
+    _, _, notification = ran[0]
+    assert notification["recipients"] == ["p@example.com", "s@example.com"]
+    _, _, calendar_event = ran[-1]
+    assert calendar_event["status"] == "CONFIRMED" and calendar_event["end"] == "2025-01-06T10:00:00"
+    assert jobs.queued() == []
+
+
+@pytest.mark.asyncio
+async def test_jobs_read_current_state_and_skip_missing_bookings(db, jobs, make_booking):
+    booking, _ = await make_booking()
+    await BookingService.cancel_booking(db, booking.id)
+    await enqueue(NOTIFY_BOOKING, booking_id=999, event="created")
+
+    results = {(kwargs["booking_id"], func.rsplit(".", 1)[1]): result for func, kwargs, result in await jobs.run_all()}
+    assert results[(booking.id, "sync_booking_calendar")]["status"] == "CANCELLED"
+    assert results[(999, "notify_booking")] is None
+
+
+@pytest.mark.asyncio
+async def test_enqueue_is_skipped_without_redis(db):
+    assert await enqueue(NOTIFY_BOOKING, booking_id=1, event="created") is None
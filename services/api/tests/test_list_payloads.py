@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from app.models import Booking, BookingStatus, Session, User
+from app.security.tokens import Principal, create_access_token
+from app.services.booking import BookingService
+from app.services.session import SessionService
+
+NINE = datetime(2025, 1, 6, 9)
+LONG_NOTES = "x" * 10_000
+
+
+async def seed(db, make_specialist):
+    patient = User(email="p@example.com", password_hash="x")
+    _, specialist = await make_specialist()
+    bookings = [
+        Booking(patient=patient, specialist=specialist, start_time=NINE + timedelta(days=i),
+                notes=LONG_NOTES, status=BookingStatus.COMPLETED)
+        for i in range(3)
+    ]
+    db.add_all([Session(booking=booking, notes=LONG_NOTES, session_summary=LONG_NOTES) for booking in bookings])
+    await db.commit()
+    db.expunge_all()
+    return patient
+
+
+@pytest.mark.asyncio
+async def test_list_queries_defer_note_columns(db, queries, make_specialist):
+    patient = await seed(db, make_specialist)
+    queries.clear()
+
+    bookings = await BookingService.get_bookings_for_patient(db, patient.id)
+    sessions = await SessionService.get_sessions_for_patient(db, patient.id)
+
+    assert not any("notes" in q or "session_summary" in q for q in queries)
+    with pytest.raises(InvalidRequestError):
+        bookings[0].notes
+    with pytest.raises(InvalidRequestError):
+        sessions[0].session_summary
+    assert sessions[0].booking.start_time == bookings[0].start_time
+
+    included = await SessionService.get_sessions_for_patient(db, patient.id, include_notes=True)
+    assert included[0].notes == LONG_NOTES
+
+
+@pytest.mark.asyncio
+async def test_list_endpoints_omit_notes_unless_included(db, api, make_specialist):
+    patient = await seed(db, make_specialist)
+    headers = {"Authorization": f"Bearer {create_access_token(Principal(id=patient.id, role='patient'))}"}
+
+    url = "/api/v1/bookings/my-bookings"
+    lean = await api.get(url, headers=headers)
+    full = await api.get(url, headers=headers, params={"include": "notes"})
+    invalid = await api.get(url, headers=headers, params={"include": "everything"})
+
+    assert lean.status_code == full.status_code == 200
+    assert "notes" not in lean.json()[0]
+    assert full.json()[0]["notes"] == LONG_NOTES
+    assert len(full.content) > 10 * len(lean.content)
+    assert invalid.status_code == 422
@@ -0,0 +1,137 @@
+from datetime import datetime, time, timedelta
+
+import fakeredis
+import pytest
+from sqlalchemy import select
+
+from app.jobs.outbox import OutboxRelay
+from app.jobs.sweeper import BookingSweeper
+from app.jobs.queue import use_job_connection
+from app.models import Availability, OutboxEvent, Session, SessionStatus
+from app.schemas.booking import BookingCreate, BookingSeriesCreate, BookingSeriesUpdate
+from app.schemas.session import SessionUpdate
+from app.services.booking import BookingService
+from app.services.booking_series import BookingSeriesService
+from app.services.session import SessionService
+
+NINE = datetime(2025, 1, 6, 9)
+
+
+async def outbox(db):
+    rows = (await db.execute(select(OutboxEvent).order_by(OutboxEvent.id))).scalars().all()
+    return [(row.aggregate, row.event, row.published_at is not None) for row in rows]
+
+
+@pytest.mark.asyncio
+async def test_events_are_recorded_only_with_committed_changes(db, jobs, make_booking):
+    booking, specialist = await make_booking()
+    booking_id, specialist_id = booking.id, specialist.id
+    with pytest.raises(ValueError, match="not available"):
+        await BookingService.create_booking(
+            db, BookingCreate(specialist_id=specialist_id, start_time=NINE), booking.patient_id
+        )
+    await BookingService.confirm_booking(db, booking_id, actor_specialist_id=specialist_id)
+    session = Session(booking_id=booking_id)
+    db.add(session)
+    await db.commit()
+    await SessionService.update_session(db, session.id, SessionUpdate(status=SessionStatus.IN_PROGRESS))
+    await SessionService.add_session_notes(db, session.id, "went well")
+
+    assert await outbox(db) == [
+        ("booking", "created", False),
+        ("booking", "confirmed", False),
+        ("session", "updated", False),
+        ("session", "updated", False),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_series_changes_record_an_event_per_occurrence(db, jobs, make_booking):
+    booking, specialist = await make_booking()
+    patient_id, specialist_id = booking.patient_id, specialist.id
+    db.add(Availability(specialist_id=specialist_id, day_of_week="tuesday", start_time=time(9), end_time=time(17)))
+    await db.commit()
+    series, _ = await BookingSeriesService.create_series(
+        db,
+        BookingSeriesCreate(specialist_id=specialist_id, start_time=NINE + timedelta(days=1), occurrences=3),
+        patient_id,
+    )
+    series_id, from_time = series.id, NINE
+
+    await BookingSeriesService.update_series(db, series_id, BookingSeriesUpdate(notes="only notes"), from_time)
+    await BookingSeriesService.update_series(db, series_id, BookingSeriesUpdate(duration_minutes=30), from_time)
+    await BookingSeriesService.cancel_series(db, series_id, from_time=from_time + timedelta(weeks=1))
+
+    events = [event for _, event, _ in await outbox(db)]
+    assert events == ["created"] * 4 + ["rescheduled"] * 3 + ["cancelled"] * 2
+    await jobs.relay()
+    assert sum(job.kwargs["event"] == "cancelled" for job in jobs.queued()) == 4
+
+
+@pytest.mark.asyncio
+async def test_expiry_sweep_records_an_event_per_swept_booking(db, jobs, make_booking):
+    lapsed, specialist = await make_booking()
+    missed = await BookingService.create_booking(
+        db, BookingCreate(specialist_id=specialist.id, start_time=NINE + timedelta(hours=2)), lapsed.patient_id
+    )
+    lapsed_id, missed_id = lapsed.id, missed.id
+    await BookingService.confirm_booking(db, missed_id, actor_specialist_id=specialist.id)
+
+    await BookingSweeper().sweep(NINE + timedelta(hours=6))
+
+    rows = (await db.execute(select(OutboxEvent).order_by(OutboxEvent.id))).scalars().all()
+    assert [(row.aggregate_id, row.event) for row in rows[3:]] == [(lapsed_id, "cancelled"), (missed_id, "no_show")]
+    await jobs.relay()
+    assert ("high", {"booking_id": missed_id, "event": "no_show"}) in [
+        (job.origin, job.kwargs) for job in jobs.queued()
+    ]
+
+
+@pytest.mark.asyncio
+async def test_relay_publishes_batches_in_order_and_reports_lag(db, api, jobs, make_booking):
+    booking, specialist = await make_booking()
+    await BookingService.confirm_booking(db, booking.id, actor_specialist_id=specialist.id)
+    assert (await api.get("/api/v1/metrics")).json()["outbox"]["pending"] == 2
+
+    relay = OutboxRelay(batch_size=1)
+    assert [await relay.relay(), await relay.relay(), await relay.relay()] == [1, 1, 0]
+
+    assert [(job.origin, job.kwargs) for job in jobs.queued()] == [
+        ("high", {"booking_id": booking.id, "event": "created"}),
+        ("high", {"booking_id": booking.id, "event": "confirmed"}),
+        ("default", {"booking_id": booking.id, "event": "created"}),
+        ("default", {"booking_id": booking.id, "event": "confirmed"}),
+    ]
+    assert relay.stats()["published"] == 2 and relay.stats()["max_lag_seconds"] >= 0
+    assert (await api.get("/api/v1/metrics")).json()["outbox"] == {"pending": 0, "oldest_pending_seconds": 0.0}
+
+
+@pytest.mark.asyncio
+async def test_failed_publish_leaves_events_pending(db, jobs, make_booking):
+    await make_booking()
+    server = fakeredis.FakeServer()
+    server.connected = False
+    use_job_connection(fakeredis.FakeStrictRedis(server=server))
+
+    relay = OutboxRelay()
+    assert await relay.relay() == 0
+
+    assert relay.stats()["failed_batches"] == 1
+    assert await outbox(db) == [("booking", "created", False)]
+
+
+@pytest.mark.asyncio
+async def test_purge_drops_events_past_retention_published_or_not(db, jobs):
+    now = datetime(2025, 1, 20)
+    db.add_all([
+        OutboxEvent(aggregate="booking", aggregate_id=1, event="created", published_at=now - timedelta(days=8)),
+        OutboxEvent(aggregate="booking", aggregate_id=2, event="created", published_at=now - timedelta(days=1)),
+        OutboxEvent(aggregate="booking", aggregate_id=3, event="created", created_at=now - timedelta(days=30)),
+        OutboxEvent(aggregate="booking", aggregate_id=4, event="created", created_at=now - timedelta(days=1)),
+    ])
+    await db.commit()
+
+    assert await OutboxRelay(retention=timedelta(days=7)).purge(now) == 2
+
+    remaining = (await db.execute(select(OutboxEvent.aggregate_id).order_by(OutboxEvent.id))).scalars().all()
+    assert remaining == [2, 4]
@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models import Booking, BookingStatus, Session, Specialist, User
+from app.services.booking import BookingService
+from app.services.session import SessionService
+from app.services.pagination import decode_cursor, encode_cursor, next_cursor
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    moment = datetime(2025, 1, 6, 9, 30)
+    assert decode_cursor(encode_cursor(moment, 42)) == (moment, 42)
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_match_offset_pages(db):
+    patient = User(email="p@example.com", password_hash="x")
+    specialist = Specialist(user=User(email="s@example.com", password_hash="x"), specializations=[])
+    start = datetime(2025, 1, 6, 9)
+    # Pairs of bookings share a start_time so the id tiebreak matters
+    db.add_all([
+        Booking(patient=patient, specialist=specialist, start_time=start + timedelta(days=i // 2),
+                status=BookingStatus.COMPLETED)
+        for i in range(11)
+    ])
+    await db.commit()
+
+    offset_ids, cursor_ids, cursor = [], [], None
+    for page in range(4):
+        by_offset = await BookingService.get_bookings_for_patient(db, patient.id, skip=page * 3, limit=3)
+        offset_ids += [b.id for b in by_offset]
+        by_cursor = await BookingService.get_bookings_for_patient(db, patient.id, limit=3, cursor=cursor)
+        cursor_ids += [b.id for b in by_cursor]
+        cursor = next_cursor(by_cursor, 3, "start_time")
+
+    assert cursor is None
+    assert cursor_ids == offset_ids
+    assert len(set(cursor_ids)) == 11
+
+
+@pytest.mark.asyncio
+async def test_session_pages_follow_booking_start_time(db):
+    patient = User(email="p@example.com", password_hash="x")
+    specialist = Specialist(user=User(email="s@example.com", password_hash="x"), specializations=[])
+    start = datetime(2025, 1, 6, 9)
+    # Sessions created in the reverse order of their appointments
+    bookings = [
+        Booking(patient=patient, specialist=specialist, start_time=start + timedelta(days=i // 2),
+                status=BookingStatus.COMPLETED)
+        for i in range(7)
+    ]
+    db.add_all(bookings)
+    await db.flush()
+    db.add_all([Session(booking_id=booking.id) for booking in reversed(bookings)])
+    await db.commit()
+    patient_id = patient.id
+
+    pages, cursor = [], None
+    for _ in range(3):
+        page = await SessionService.get_sessions_for_patient(db, patient_id, limit=3, cursor=cursor)
+        pages += [(s.booking.start_time, s.booking_id) for s in page]
+        cursor = next_cursor(page, 3, "booking.start_time", "booking_id")
+
+    assert cursor is None
+    assert pages == sorted(pages, reverse=True) and len(set(pages)) == 7
+    by_offset = await SessionService.get_sessions_for_patient(db, patient_id, skip=3, limit=3)
+    assert [s.booking_id for s in by_offset] == [booking_id for _, booking_id in pages[3:6]]
@@ -1,4 +1,19 @@
-from app.security.password import hash_password, verify_password
+import asyncio
+
+import pytest
+
+from passlib.hash import bcrypt
+
+from app.core.config import settings
+from app.security.password import (
+    PasswordHasher,
+    PasswordPoolSaturated,
+    calibrate_bcrypt_rounds,
+    cost_distribution,
+    hash_password,
+    verify_and_update,
+    verify_password,
+)
 
 
 def test_password_hash_and_verify():
@@ -7,3 +22,45 @@ def test_password_hash_and_verify():
     assert hashed != plain
     assert verify_password(plain, hashed)
     assert not verify_password("wrong", hashed)
+
+
+@pytest.mark.asyncio
+async def test_hasher_runs_off_loop_and_rejects_when_saturated():
+    hasher = PasswordHasher(workers=1, max_queue=1)
+    try:
+        hashed = await hasher.hash("pw")
+        assert await hasher.verify("pw", hashed)
+
+        results = await asyncio.gather(
+            *(hasher.verify("pw", hashed) for _ in range(3)), return_exceptions=True
+        )
+        assert results[:2] == [True, True]
+        assert isinstance(results[2], PasswordPoolSaturated)
+        assert hasher.stats()["rejected"] == 1 and hasher.in_flight == 0
+    finally:
+        hasher.shutdown()
+
+
+def test_hashes_below_policy_are_upgraded_on_verify():
+    weak = bcrypt.using(rounds=4).hash("pw")
+    assert verify_and_update("wrong", weak) == (False, None)
+    verified, upgraded = verify_and_update("pw", weak)
+    assert verified and upgraded.startswith(f"$2b${settings.bcrypt_rounds:02d}$")
+    assert verify_and_update("pw", upgraded) == (True, None)
+
+    distribution = cost_distribution([weak, weak, upgraded, "plaintext"])
+    assert distribution == {
+        "bcrypt/4": (2, True),
+        f"bcrypt/{settings.bcrypt_rounds}": (1, False),
+        "unknown": (1, True),
+    }
+
+
+def test_calibration_picks_highest_cost_within_budget():
+    clock = iter(range(0, 10_000))
+    # Every timer() call advances one second, so each hash "takes" 1000 ms
+    rounds, timings = calibrate_bcrypt_rounds(1500, min_rounds=4, max_rounds=6, samples=1, timer=lambda: next(clock))
+    assert rounds == 6 and timings == {4: 1000, 5: 1000, 6: 1000}
+
+    rounds, timings = calibrate_bcrypt_rounds(500, min_rounds=4, max_rounds=6, samples=1, timer=lambda: next(clock))
+    assert rounds == 4 and list(timings) == [4]
@@ -0,0 +1,89 @@
+import asyncio
+
+import fakeredis
+import pytest
+
+from app.models import Specialist, User
+from app.schemas.user import UserOut
+from app.security.tokens import Principal, create_access_token
+from app.services.principal_cache import CachedPrincipal, PrincipalCache, get_principal_cache, load_principal
+from app.services.specialist import SpecialistService
+
+
+def entry(user_id):
+    return CachedPrincipal(user=UserOut(id=user_id, email=f"u{user_id}@example.com", role="patient"))
+
+
+@pytest.mark.asyncio
+async def test_lru_ttl_and_counters():
+    cache = PrincipalCache(max_entries=2)
+    cache.set(1, entry(1))
+    cache.set(2, entry(2))
+    assert cache.get(1).user.id == 1
+    cache.set(3, entry(3))  # evicts user 2, the least recently used
+    assert cache.get(2) is None
+
+    stale = cache.generation
+    await cache.invalidate(1)
+    cache.set(1, entry(1), stale)  # a load that raced the invalidation is not cached
+    assert cache.get(1) is None
+
+    expired = PrincipalCache(ttl_seconds=-1)
+    expired.set(1, entry(1))
+    assert expired.get(1) is None
+
+    assert cache.stats() == {
+        "entries": 1,
+        "hits": 1,
+        "misses": 2,
+        "invalidations": 1,
+        "remote_invalidations": 0,
+        "hit_ratio": 1 / 3,
+        "queries_saved": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_specialist_writes_invalidate_cached_profile(db, api, queries):
+    user = User(email="s@example.com", password_hash="x")
+    specialist = Specialist(user=user, specializations=[], is_available=True)
+    db.add(specialist)
+    await db.commit()
+    token = create_access_token(Principal(id=user.id, role=user.role, specialist_id=specialist.id))
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert (await api.get("/api/v1/specialists/me", headers=headers)).json()["is_available"] is True
+    queries.clear()
+    assert (await api.get("/api/v1/specialists/me", headers=headers)).status_code == 200
+    assert queries == []
+    assert get_principal_cache().stats()["queries_saved"] == 1
+
+    await SpecialistService.toggle_availability(db, specialist.id, False)
+    assert (await api.get("/api/v1/specialists/me", headers=headers)).json()["is_available"] is False
+
+    await SpecialistService.delete_specialist(db, specialist.id)
+    assert (await load_principal(db, user.id)).principal.specialist_id is None
+
+
+@pytest.mark.asyncio
+async def test_invalidations_fan_out_over_redis():
+    redis = fakeredis.FakeAsyncRedis()
+    writer = PrincipalCache(redis=redis)
+    reader = PrincipalCache(redis=redis)
+    reader.set(1, entry(1))
+    writer.set(1, entry(1))
+    reader.start_listener()
+    try:
+        for _ in range(50):
+            if await redis.pubsub_numsub(reader.channel) != [(reader.channel.encode(), 0)]:
+                break
+            await asyncio.sleep(0.01)
+        await writer.invalidate(1)
+        for _ in range(50):
+            if reader.remote_invalidations:
+                break
+            await asyncio.sleep(0.01)
+        assert reader.get(1) is None and reader.remote_invalidations == 1
+        assert writer.remote_invalidations == 0
+    finally:
+        await reader.stop_listener()
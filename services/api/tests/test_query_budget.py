@@ -0,0 +1,65 @@
+"""Round-trip budgets for service graph loads; raise a budget only deliberately."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from app.models import Booking, BookingStatus, Session, Specialist, User
+from app.services.booking import BookingService
+from app.services.session import SessionService
+from app.services.specialist import SpecialistService
+
+NINE = datetime(2025, 1, 6, 9)
+
+
+async def seed(db):
+    patients = [User(email=f"p{i}@example.com", password_hash="x") for i in range(3)]
+    specialists = [
+        Specialist(user=User(email=f"s{i}@example.com", password_hash="x"), specializations=[])
+        for i in range(3)
+    ]
+    bookings = [
+        Booking(patient=patients[i % 3], specialist=specialists[i % 3],
+                start_time=NINE + timedelta(hours=i), status=BookingStatus.COMPLETED)
+        for i in range(9)
+    ]
+    db.add_all([Session(booking=booking) for booking in bookings])
+    await db.commit()
+    ids = patients[0].id, specialists[0].id, bookings[0].id, bookings[0].session.id
+    db.expunge_all()
+    return ids
+
+
+BUDGETS = [
+    ("get_booking", lambda db, ids: BookingService.get_booking(db, ids[2]), 1),
+    ("get_bookings_for_patient", lambda db, ids: BookingService.get_bookings_for_patient(db, ids[0]), 3),
+    ("get_bookings_for_specialist", lambda db, ids: BookingService.get_bookings_for_specialist(db, ids[1]), 3),
+    ("get_session", lambda db, ids: SessionService.get_session(db, ids[3]), 1),
+    ("get_session_by_booking_id", lambda db, ids: SessionService.get_session_by_booking_id(db, ids[2]), 1),
+    ("get_sessions_for_patient", lambda db, ids: SessionService.get_sessions_for_patient(db, ids[0]), 2),
+    ("get_sessions_for_specialist", lambda db, ids: SessionService.get_sessions_for_specialist(db, ids[1]), 2),
+    ("get_specialist", lambda db, ids: SpecialistService.get_specialist(db, ids[1]), 1),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name,call,budget", BUDGETS, ids=[entry[0] for entry in BUDGETS])
+async def test_graph_loads_stay_within_round_trip_budget(db, queries, name, call, budget):
+    ids = await seed(db)
+    queries.clear()
+
+    result = await call(db, ids)
+
+    assert result
+    assert len(queries) == budget, "\n\n".join(queries)
+
+
+@pytest.mark.asyncio
+async def test_relationships_outside_the_profile_raise(db):
+    ids = await seed(db)
+
+    bookings = await BookingService.get_bookings_for_specialist(db, ids[1])
+    assert bookings[0].patient.id == ids[0]
+    with pytest.raises(InvalidRequestError):
+        bookings[0].specialist
@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.jobs.reminders import ReminderScheduler
+from app.jobs.senders import FileSender
+from app.models import BookingReminder, BookingStatus
+
+NOW = datetime(2025, 1, 6, 9)
+
+
+class BrokenSender(FileSender):
+    async def send(self, notifications):
+        raise ConnectionError("provider down")
+
+
+@pytest.mark.asyncio
+async def test_sends_each_due_reminder_once(jobs, booking_for, tmp_path):
+    due_24h = await booking_for(NOW + timedelta(hours=24, minutes=2))
+    due_1h = await booking_for(NOW + timedelta(hours=1))
+    await booking_for(NOW + timedelta(hours=12))
+    await booking_for(NOW + timedelta(hours=1), status=BookingStatus.PENDING)
+    sender = FileSender(str(tmp_path / "sent.jsonl"))
+
+    counts = await ReminderScheduler(sender, batch_size=1).tick(NOW)
+    # A second scheduler (restart, or another worker) finds nothing left to send
+    again = await ReminderScheduler(sender).tick(NOW + timedelta(minutes=1))
+
+    assert counts == {"due": 2, "sent": 2, "skipped": 0, "failed": 0}
+    assert again["sent"] == 0
+    assert sorted((n.kind, n.booking_id) for n in sender.read()) == [
+        ("reminder_1h", due_1h.id), ("reminder_24h", due_24h.id),
+    ]
+    assert sender.read()[0].recipients == ["p@example.com", "s@example.com"]
+
+
+@pytest.mark.asyncio
+async def test_missed_reminders_catch_up_but_not_after_the_appointment(jobs, booking_for, tmp_path):
+    late = await booking_for(NOW + timedelta(minutes=50))
+    await booking_for(NOW - timedelta(minutes=5))
+    sender = FileSender(str(tmp_path / "sent.jsonl"))
+
+    await ReminderScheduler(sender).tick(NOW)
+
+    assert [(n.kind, n.booking_id) for n in sender.read()] == [("reminder_1h", late.id)]
+
+
+@pytest.mark.asyncio
+async def test_rescheduled_booking_is_reminded_again(db, jobs, booking_for, tmp_path):
+    booking = await booking_for(NOW + timedelta(hours=1))
+    sender = FileSender(str(tmp_path / "sent.jsonl"))
+    scheduler = ReminderScheduler(sender)
+    await scheduler.tick(NOW)
+
+    booking.start_time = NOW + timedelta(hours=2)
+    await db.commit()
+    await scheduler.tick(NOW + timedelta(hours=1))
+
+    assert [n.booking_id for n in sender.read()] == [booking.id, booking.id]
+
+
+@pytest.mark.asyncio
+async def test_failed_send_releases_claims_for_the_next_tick(db, jobs, booking_for, tmp_path):
+    await booking_for(NOW + timedelta(hours=1))
+    sender = FileSender(str(tmp_path / "sent.jsonl"))
+
+    failed = await ReminderScheduler(BrokenSender(sender.path)).tick(NOW)
+    assert failed["failed"] == 1
+    assert (await db.execute(select(BookingReminder))).first() is None
+
+    await ReminderScheduler(sender).tick(NOW + timedelta(minutes=5))
+    assert len(sender.read()) == 1
+    assert (await db.execute(select(BookingReminder.sent_at))).scalar_one() is not None
@@ -0,0 +1,127 @@
+import asyncio
+from datetime import date, datetime, time
+
+import fakeredis
+import pytest
+
+from app.models import Specialist, User
+from app.schemas.availability import AvailabilityCreate
+from app.schemas.booking import BookingCreate
+from app.services.availability import AvailabilityService
+from app.services.booking import BookingService
+from app.services.slot_cache import SlotCache, get_slot_cache
+
+MONDAY = date(2025, 1, 6)
+SLOTS = [datetime(2025, 1, 6, 9), datetime(2025, 1, 6, 10)]
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_and_counters():
+    cache = SlotCache(max_entries=2)
+    await cache.set(1, MONDAY, 60, SLOTS)
+    await cache.set(2, MONDAY, 60, SLOTS)
+    assert await cache.get(1, MONDAY, 60) == SLOTS
+    await cache.set(3, MONDAY, 60, SLOTS)  # evicts specialist 2, the least recently used
+
+    assert await cache.get(2, MONDAY, 60) is None
+    assert await cache.get(1, MONDAY, 60) == SLOTS
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidation_is_scoped_to_specialist_and_date():
+    cache = SlotCache()
+    tuesday = date(2025, 1, 7)
+    await cache.set(1, MONDAY, 60, SLOTS)
+    await cache.set(1, tuesday, 60, SLOTS)
+    await cache.set(2, MONDAY, 60, SLOTS)
+
+    await cache.invalidate_dates(1, [MONDAY])
+    assert await cache.get(1, MONDAY, 60) is None
+    assert await cache.get(1, tuesday, 60) == SLOTS
+    assert await cache.get(2, MONDAY, 60) == SLOTS
+
+    await cache.invalidate_weekdays(1, [1])
+    assert await cache.get(1, tuesday, 60) is None
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_is_shared_and_invalidated():
+    redis = fakeredis.FakeAsyncRedis()
+    writer = SlotCache(redis=redis)
+    reader = SlotCache(redis=redis)
+
+    await writer.set(1, MONDAY, 60, SLOTS)
+    assert await reader.get(1, MONDAY, 60) == SLOTS
+    assert reader.stats()["redis_hits"] == 1
+
+    await writer.invalidate_weekdays(1, [MONDAY.weekday()])
+    reader.clear()
+    assert await reader.get(1, MONDAY, 60) is None
+
+
+@pytest.mark.asyncio
+async def test_slots_computed_before_an_invalidation_are_not_cached():
+    redis = fakeredis.FakeAsyncRedis()
+    writer = SlotCache(redis=redis)
+    reader = SlotCache(redis=redis)
+
+    generation = await reader.generation(1)
+    await writer.invalidate_dates(1, [MONDAY])  # a booking committed while the reader computed
+    await reader.set(1, MONDAY, 60, SLOTS, generation)
+
+    assert await reader.get(1, MONDAY, 60) is None and await writer.get(1, MONDAY, 60) is None
+    assert reader.stats()["stale_writes_skipped"] == 1
+
+    await reader.set(1, MONDAY, 60, SLOTS, await reader.generation(1))
+    assert await writer.get(1, MONDAY, 60) == SLOTS
+
+
+@pytest.mark.asyncio
+async def test_invalidations_fan_out_to_other_workers_lru():
+    redis = fakeredis.FakeAsyncRedis()
+    writer = SlotCache(redis=redis)
+    reader = SlotCache(redis=redis)
+    await reader.set(1, MONDAY, 60, SLOTS)
+    reader.start_listener()
+    try:
+        for _ in range(50):
+            if await redis.pubsub_numsub(reader.channel) != [(reader.channel.encode(), 0)]:
+                break
+            await asyncio.sleep(0.01)
+        await writer.invalidate_dates(1, [MONDAY])
+        for _ in range(50):
+            if reader.remote_invalidations:
+                break
+            await asyncio.sleep(0.01)
+        # Gone from the LRU, not just from Redis
+        await redis.flushall()
+        assert await reader.get(1, MONDAY, 60) is None and reader.remote_invalidations == 1
+        assert writer.remote_invalidations == 0
+    finally:
+        await reader.stop_listener()
+
+
+@pytest.mark.asyncio
+async def test_booking_write_invalidates_cached_slots(db):
+    user = User(email="c@example.com", password_hash="x")
+    specialist = Specialist(user=user, specializations=[])
+    db.add(specialist)
+    await db.commit()
+    await AvailabilityService.create_availability(
+        db, AvailabilityCreate(day_of_week="monday", start_time=time(9), end_time=time(11)), specialist.id
+    )
+
+    hits = get_slot_cache().stats()["hits"]
+    assert await AvailabilityService.get_available_slots(db, specialist.id, MONDAY) == [
+        datetime(2025, 1, 6, 9), datetime(2025, 1, 6, 9, 15), datetime(2025, 1, 6, 9, 30),
+        datetime(2025, 1, 6, 9, 45), datetime(2025, 1, 6, 10),
+    ]
+    assert await AvailabilityService.get_available_slots(db, specialist.id, MONDAY) is not None
+    assert get_slot_cache().stats()["hits"] == hits + 1
+
+    await BookingService.create_booking(
+        db, BookingCreate(specialist_id=specialist.id, start_time=datetime(2025, 1, 6, 9)), user.id
+    )
+    assert await AvailabilityService.get_available_slots(db, specialist.id, MONDAY) == [datetime(2025, 1, 6, 10)]
@@ -0,0 +1,103 @@
+import random
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+from app.models import Availability, Booking, BookingStatus, Specialist, User
+from app.services.availability import AvailabilityService
+from app.services.slots import compute_slot_offsets, merge_intervals
+
+
+def legacy_slot_offsets(windows, busy, duration):
+    """The original per-candidate overlap scan, kept as the reference behaviour."""
+    offsets = []
+    for window_start, window_end in windows:
+        current = window_start
+        while current + duration <= window_end:
+            if not any(current < end and start < current + duration for start, end in busy):
+                offsets.append(current)
+            current += 15
+    return sorted(offsets)
+
+
+def test_merge_intervals():
+    assert merge_intervals([(60, 90), (0, 30), (30, 45), (80, 120)]) == [(0, 45), (60, 120)]
+
+
+def test_slot_offsets_respect_window_grid_and_touching_bookings():
+    # Window 09:05-11:00 with a booking 09:35-10:00: grid stays anchored at 09:05
+    windows = [(545, 660)]
+    busy = [(575, 600)]
+    assert compute_slot_offsets(windows, busy, 30) == [545, 605, 620]
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_slot_offsets_match_legacy_scan(seed):
+    rng = random.Random(seed)
+    windows = []
+    for _ in range(rng.randint(0, 4)):
+        start = rng.randrange(0, 1200, 5)
+        windows.append((start, start + rng.randrange(0, 300, 5)))
+    busy = []
+    for _ in range(rng.randint(0, 12)):
+        start = rng.randrange(-60, 1440)
+        busy.append((start, start + rng.choice([0, 15, 30, 45, 60, 90, 120])))
+    duration = rng.choice([15, 30, 45, 60, 90])
+
+    assert compute_slot_offsets(windows, busy, duration) == legacy_slot_offsets(windows, busy, duration)
+
+
+@pytest.mark.asyncio
+async def test_get_available_slots_excludes_active_bookings(db):
+    user = User(email="s@example.com", password_hash="x")
+    specialist = Specialist(user=user, specializations=[])
+    target = date(2025, 1, 7)  # Tuesday
+    db.add_all([
+        user,
+        specialist,
+        Availability(specialist=specialist, day_of_week="tuesday", start_time=time(9), end_time=time(12)),
+        Booking(patient=user, specialist=specialist, start_time=datetime(2025, 1, 7, 10),
+                duration_minutes=60, status=BookingStatus.CONFIRMED),
+        Booking(patient=user, specialist=specialist, start_time=datetime(2025, 1, 7, 9),
+                duration_minutes=60, status=BookingStatus.CANCELLED),
+    ])
+    await db.commit()
+
+    result = await AvailabilityService.get_available_slots(db, specialist.id, target, 60)
+
+    nine = datetime(2025, 1, 7, 9)
+    assert result == [nine, nine + timedelta(hours=2)]
+
+
+@pytest.mark.asyncio
+async def test_get_available_slots_range_groups_by_day(db):
+    user = User(email="r@example.com", password_hash="x")
+    specialist = Specialist(user=user, specializations=[])
+    db.add_all([
+        user,
+        specialist,
+        Availability(specialist=specialist, day_of_week="monday", start_time=time(23), end_time=time(23, 59)),
+        Availability(specialist=specialist, day_of_week="tuesday", start_time=time(0), end_time=time(2)),
+        # Runs from Monday 23:00 into Tuesday 01:00
+        Booking(patient=user, specialist=specialist, start_time=datetime(2025, 1, 6, 23),
+                duration_minutes=120, status=BookingStatus.PENDING),
+    ])
+    await db.commit()
+
+    days = await AvailabilityService.get_available_slots_range(
+        db, specialist.id, date(2025, 1, 5), date(2025, 1, 7), 60
+    )
+
+    assert list(days) == [
+        (date(2025, 1, 5), []),
+        (date(2025, 1, 6), []),
+        (date(2025, 1, 7), [datetime(2025, 1, 7, 1)]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_available_slots_range_is_bounded(db):
+    with pytest.raises(ValueError):
+        await AvailabilityService.get_available_slots_range(db, 1, date(2025, 1, 1), date(2025, 6, 1))
+    with pytest.raises(ValueError):
+        await AvailabilityService.get_available_slots_range(db, 1, date(2025, 1, 2), date(2025, 1, 1))
@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.jobs.sweeper import BookingSweeper
+from app.models import Booking, BookingBucket, BookingStatus, Session, SessionStatus
+from app.services.booking import BookingService
+
+NOW = datetime(2025, 1, 6, 18)
+
+
+async def statuses(db, booking_id):
+    booking = (await db.execute(select(Booking.status).where(Booking.id == booking_id))).scalar_one()
+    session = (await db.execute(select(Session).where(Session.booking_id == booking_id))).scalar_one_or_none()
+    return booking, session
+
+
+@pytest.mark.asyncio
+async def test_moves_expired_bookings_and_their_sessions_to_terminal_states(db, jobs, booking_for):
+    lapsed = (await booking_for(NOW - timedelta(hours=5), status=BookingStatus.PENDING)).id
+    held = (await booking_for(NOW - timedelta(hours=4), session_status=SessionStatus.IN_PROGRESS)).id
+    missed = (await booking_for(NOW - timedelta(hours=3), session_status=SessionStatus.SCHEDULED)).id
+    no_session = (await booking_for(NOW - timedelta(hours=3, minutes=30))).id
+    within_grace = (await booking_for(NOW - timedelta(minutes=90))).id
+    upcoming = (await booking_for(NOW + timedelta(hours=1))).id
+
+    counts = await BookingSweeper(chunk_size=1).sweep(NOW)
+
+    assert counts == {"cancelled": 1, "completed": 1, "no_show": 2, "sessions": 2}
+    db.expire_all()
+    assert (await statuses(db, lapsed))[0] == BookingStatus.CANCELLED
+    booking, session = await statuses(db, held)
+    assert booking == BookingStatus.COMPLETED and session.status == SessionStatus.COMPLETED
+    assert session.actual_end_time == NOW - timedelta(hours=3)
+    booking, session = await statuses(db, missed)
+    assert booking == BookingStatus.NO_SHOW and session.status == SessionStatus.NO_SHOW
+    assert (await statuses(db, no_session))[0] == BookingStatus.NO_SHOW
+    assert (await statuses(db, within_grace))[0] == BookingStatus.CONFIRMED
+    assert (await statuses(db, upcoming))[0] == BookingStatus.CONFIRMED
+
+
+@pytest.mark.asyncio
+async def test_swept_bookings_leave_the_conflict_check_and_free_busy_index(db, jobs, booking_for):
+    start = NOW - timedelta(hours=3)
+    booking_id = (await booking_for(start)).id
+    specialist_id = booking_for.specialist.id
+    db.add(BookingBucket(booking_id=booking_id, specialist_id=specialist_id, slot_date=start.date(), bucket=0))
+    await db.commit()
+
+    await BookingSweeper().sweep(NOW)
+
+    assert await BookingService._check_booking_conflicts(db, specialist_id, start, start + timedelta(hours=1)) == []
+    assert (await db.execute(select(BookingBucket))).first() is None
+
+
+@pytest.mark.asyncio
+async def test_sweeps_are_idempotent_and_leave_manual_transitions_alone(db, jobs, booking_for):
+    for hours in range(3, 13):
+        await booking_for(NOW - timedelta(hours=hours))
+    completed = (await booking_for(NOW - timedelta(hours=2, minutes=30))).id
+    await BookingService.complete_booking(db, completed)
+
+    first = await BookingSweeper(chunk_size=3).sweep(NOW)
+    second = await BookingSweeper(chunk_size=3).sweep(NOW)
+
+    assert first["no_show"] == 10 and not any(second.values())
+    assert (await statuses(db, completed))[0] == BookingStatus.COMPLETED
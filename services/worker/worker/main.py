@@ -1,30 +1,63 @@
 """
-Minimal RQ Worker implementation for GroundedCounselling.
-This is a placeholder implementation for Docker testing.
+RQ Worker for GroundedCounselling.
+
+Runs the API's background jobs (app.jobs), listening on the job queues in
+priority order so high-priority work is always taken first. The API package
+must be importable (the worker image puts it on PYTHONPATH).
+
+WORKER_MODE selects how jobs run:
+    async - app.jobs.runner.AsyncJobRunner, many jobs concurrently on one
+            asyncio loop with a shared database engine; per-queue limits come
+            from WORKER_QUEUE_CONCURRENCY; also runs the periodic jobs
+            (outbox relay, appointment reminders, expired-booking sweep,
+            idempotency key purge) (default)
+    fork  - the standard RQ Worker, one forked process per job; runs no
+            periodic jobs, so deploy a scheduler process next to it
+    scheduler - only the periodic jobs, for deployments that run fork-mode
+            workers
+
+Booking side effects reach the queues only through the outbox relay, so
+every deployment needs at least one async or scheduler process.
 """
 
+import asyncio
 import os
-import time
 import redis
-from rq import Worker, Queue
+from rq import Worker
+
+from app.jobs.queue import get_queues
+
 
 def main():
     """Main worker function"""
-    print("Starting GroundedCounselling Worker...")
-    
+    mode = os.getenv("WORKER_MODE", "async")
+    print(f"Starting GroundedCounselling Worker ({mode} mode)...")
+
     # Connect to Redis
     redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
     redis_conn = redis.from_url(redis_url)
-    
-    # Create queues
-    queues = [Queue('default', connection=redis_conn)]
-    
+
+    # Create queues, highest priority first
+    queues = list(get_queues(redis_conn).values())
+
     print(f"Connected to Redis: {redis_url}")
     print(f"Listening on queues: {[q.name for q in queues]}")
-    
+
+    if mode == "scheduler":
+        from app.jobs.runner import serve_periodic
+
+        asyncio.run(serve_periodic())
+        return
+
+    if mode == "async":
+        from app.jobs.runner import serve
+
+        asyncio.run(serve(redis_conn))
+        return
+
     # Start worker
     worker = Worker(queues, connection=redis_conn)
     worker.work()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()